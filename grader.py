@@ -3,7 +3,12 @@
 CSP Scheduling Project - Automatic Grader
 University of North Dakota - CSCI 384 AI Course | Fall 2025
 
-Usage: python grader.py <student_file.py>
+Usage: python grader.py <student_file.py> [<student_file.py> ...]
+
+Each submission is graded in its own worker process so that a hanging or
+crashing student file cannot stall the grader. Set GRADER_TIMEOUT (seconds,
+default 60) to change the per-submission time limit, and GRADER_VERBOSE=0 to
+keep per-check feedback out of the console log.
 
 This grader automatically evaluates student submissions and provides detailed feedback
 with point breakdowns for each section of the assignment.
@@ -24,27 +29,120 @@ TOTAL: 110 points
 
 import sys
 import os
+import bisect
 import json
 import time
 import traceback
 import importlib.util
-from typing import Dict, List, Any, Tuple, Optional
+import multiprocessing
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Any, Tuple, Optional, NamedTuple
 from datetime import datetime
 import tempfile
 import shutil
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
+
 # Add project root to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Sentinel for attribute lookups on the student module
+_MISSING = object()
+
+# Console icon for each feedback level
+_LEVEL_ICONS = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
+
+# Wall-clock limit (seconds) for grading one submission in a worker process
+_GRADING_TIMEOUT = int(os.environ.get('GRADER_TIMEOUT', '60'))
+
+# Letter grade cutoffs (percent) and the grade at or above each cutoff
+_GRADE_CUTOFFS = (60, 63, 67, 70, 73, 77, 80, 83, 87, 90, 93)
+_GRADE_LETTERS = ('F', 'D-', 'D', 'D+', 'C-', 'C', 'C+', 'B-', 'B', 'B+', 'A-', 'A')
+
+class Feedback(NamedTuple):
+    """A single feedback entry recorded during grading"""
+    message: str
+    level: str
+    timestamp: str
+
+
 class CSPGrader:
     """Automatic grader for CSP Scheduling Project"""
     
+    # Function checks: (attribute, label, callable label, points if present, points if callable)
+    _HEURISTIC_CHECKS = (
+        ('mrv_heuristic', "MRV heuristic", "MRV heuristic", 5, 1),
+        ('degree_heuristic', "Degree heuristic", "Degree heuristic", 3, 1),
+        ('combined_heuristic', "Combined heuristic", "Combined heuristic", 3, 1),
+    )
+    _ANALYSIS_CHECKS = (
+        ('analyze_constraint_violations', "Constraint violation analysis function", "Constraint violation analysis", 3, 1),
+        ('validate_solution', "Solution validation function", "Solution validation", 3, 1),
+        ('calculate_performance_metrics', "Performance metrics function", "Performance metrics", 3, 1),
+    )
+    _VISUALIZATION_CHECKS = (
+        ('create_gantt_chart', "Gantt chart function", "Gantt chart function", 3, 1),
+        ('create_resource_utilization_chart', "Resource utilization chart function", "Resource utilization chart function", 3, 1),
+    )
+    _EXPORT_CHECKS = (
+        ('export_solution_json', "JSON export function", "JSON export function", 3, 1),
+        ('export_solution_csv', "CSV export function", "CSV export function", 3, 1),
+    )
+    _BONUS_CHECKS = (
+        ('compare_heuristics', "Heuristic comparison function", "Heuristic comparison", 3, 1),
+        ('optimize_solution', "Solution optimization function", "Solution optimization", 3, 1),
+        ('run_gui', "GUI integration function", "GUI integration", 2, 0),
+    )
+    
+    # Module-level variables the student must define
+    _DATA_NAMES = ('tasks', 'resources', 'time_slots', 'constraints')
+    _ANSWER_NAMES = ('q1_answer', 'q2_answer', 'q3_answer', 'q4_answer', 'q5_answer')
+    _EXPLANATION_NAMES = ('q1_explanation', 'q2_explanation', 'q3_explanation', 'q4_explanation', 'q5_explanation')
+    _QUESTION_LABELS = tuple(f"Question {i}" for i in range(1, 6))
+    
+    # Graded sections: (section name, max points, test method, student names it checks)
+    _SECTIONS = (
+        ("Data Loading and Validation", 10, 'test_data_loading',
+         frozenset(('data', 'is_valid') + _DATA_NAMES)),
+        ("CSP Formulation", 15, 'test_csp_formulation',
+         frozenset(('scheduling_csp',))),
+        ("Heuristic Implementation", 15, 'test_heuristics',
+         frozenset(check[0] for check in _HEURISTIC_CHECKS)),
+        ("CSP Solving", 20, 'test_csp_solving',
+         frozenset(('solutions', 'best_solution', 'scheduling_csp'))),
+        ("Solution Analysis", 15, 'test_solution_analysis',
+         frozenset(('best_solution',) + tuple(check[0] for check in _ANALYSIS_CHECKS))),
+        ("Visualization", 10, 'test_visualization',
+         frozenset(('best_solution',) + tuple(check[0] for check in _VISUALIZATION_CHECKS))),
+        ("Export Functionality", 10, 'test_export_functionality',
+         frozenset(('best_solution',) + tuple(check[0] for check in _EXPORT_CHECKS))),
+        ("Conceptual Questions", 15, 'test_conceptual_questions',
+         frozenset(_ANSWER_NAMES + _EXPLANATION_NAMES)),
+        ("Bonus Features", 10, 'test_bonus_features',
+         frozenset(check[0] for check in _BONUS_CHECKS)),
+    )
+    
+    # Every student module attribute the grader looks at
+    _INTERESTING_NAMES = frozenset().union(*(section[3] for section in _SECTIONS))
+    
     def __init__(self, student_file: str):
         self.student_file = student_file
         self.student_name = os.path.splitext(os.path.basename(student_file))[0]
+        
+        # Feedback timestamps are taken once per section, not per entry
+        self._section_ts = datetime.now().isoformat()
+        
         self.results = {
             'student_name': self.student_name,
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._section_ts,
             'total_score': 0,
             'max_score': 110,
             'sections': {},
@@ -53,8 +151,17 @@ class CSPGrader:
             'feedback': []
         }
         
+        # Log lines are buffered and written to stdout once per section
+        self._log_buf: List[str] = []
+        
+        # Set GRADER_VERBOSE=0 to keep feedback out of the console log (it is still reported)
+        self._verbose = os.environ.get('GRADER_VERBOSE', '1') == '1'
+        
         # Import student module
         self.student_module = None
+        self._attrs: Dict[str, Any] = {}
+        self._present: frozenset = frozenset()
+        self._solve_future: Optional[Future] = None
         self.load_student_module()
     
     def load_student_module(self):
@@ -63,48 +170,70 @@ class CSPGrader:
             spec = importlib.util.spec_from_file_location("student_submission", self.student_file)
             self.student_module = importlib.util.module_from_spec(spec)
             spec.loader.exec_module(self.student_module)
+            
+            # Snapshot the attributes the tests use in a single pass over the module dict
+            module_vars = vars(self.student_module)
+            self._attrs = {name: module_vars[name] for name in self._INTERESTING_NAMES if name in module_vars}
+            self._present = frozenset(self._attrs)
             self.add_feedback("✓ Student file loaded successfully", "info")
         except Exception as e:
             self.add_error(f"Failed to load student file: {str(e)}")
             raise
+        finally:
+            self.flush_log()
+    
+    def flush_log(self):
+        """Write all buffered log lines to stdout in a single call"""
+        if not self._log_buf:
+            return
+        sys.stdout.write("\n".join(self._log_buf))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        self._log_buf.clear()
     
     def add_error(self, message: str):
         """Add an error message"""
         self.results['errors'].append(message)
-        print(f"❌ ERROR: {message}")
+        self._log_buf.append(f"❌ ERROR: {message}")
     
     def add_warning(self, message: str):
         """Add a warning message"""
         self.results['warnings'].append(message)
-        print(f"⚠️  WARNING: {message}")
+        self._log_buf.append(f"⚠️  WARNING: {message}")
     
     def add_feedback(self, message: str, level: str = "info"):
         """Add feedback message"""
-        self.results['feedback'].append({
-            'message': message,
-            'level': level,
-            'timestamp': datetime.now().isoformat()
-        })
-        print(f"ℹ️  {message}")
+        self.results['feedback'].append(Feedback(message, level, self._section_ts))
+        if self._verbose:
+            self._log_buf.append(f"ℹ️  {message}")
     
-    def grade_section(self, section_name: str, max_points: int, test_func) -> int:
-        """Grade a section using the provided test function"""
-        print(f"\n{'='*60}")
-        print(f"GRADING SECTION: {section_name.upper()} ({max_points} points)")
-        print(f"{'='*60}")
+    def grade_section(self, section_name: str, max_points: int, test_func,
+                      names: Optional[frozenset] = None) -> int:
+        """Grade a section using the provided test function
+        
+        If names is given and the student defined none of them, the section
+        scores zero without running test_func.
+        """
+        self._section_ts = datetime.now().isoformat()
+        self._log_buf.append(f"\n{'='*60}")
+        self._log_buf.append(f"GRADING SECTION: {section_name.upper()} ({max_points} points)")
+        self._log_buf.append(f"{'='*60}")
         
         try:
-            points = test_func()
-            points = min(points, max_points)  # Cap at max points
-            points = max(points, 0)  # Ensure non-negative
+            if names is not None and self._present.isdisjoint(names):
+                self.add_error(f"{section_name} not attempted (none of {', '.join(sorted(names))} defined)")
+                points = 0
+            else:
+                points = max(0, min(test_func(), max_points))  # Clamp to [0, max_points]
+            percentage = points * 100 / max_points if max_points > 0 else 0
             
             self.results['sections'][section_name] = {
                 'points_earned': points,
                 'max_points': max_points,
-                'percentage': (points / max_points * 100) if max_points > 0 else 0
+                'percentage': percentage
             }
             
-            print(f"✓ {section_name}: {points}/{max_points} points ({points/max_points*100:.1f}%)")
+            self._log_buf.append(f"✓ {section_name}: {points}/{max_points} points ({percentage:.1f}%)")
             return points
             
         except Exception as e:
@@ -116,6 +245,28 @@ class CSPGrader:
                 'error': str(e)
             }
             return 0
+        finally:
+            self.flush_log()
+    
+    def check_functions(self, checks) -> int:
+        """Score a table of required functions for presence and callability"""
+        points = 0
+        for name, label, callable_label, points_present, points_callable in checks:
+            obj = self._attrs.get(name, _MISSING)
+            if obj is _MISSING:
+                self.add_error(f"{label} not implemented")
+                continue
+            
+            points += points_present
+            self.add_feedback(f"✓ {label} implemented")
+            
+            if callable(obj):
+                points += points_callable
+                self.add_feedback(f"✓ {callable_label} is callable")
+            else:
+                self.add_error(f"{callable_label} is not callable")
+        
+        return points
     
     def test_data_loading(self) -> int:
         """Test Step 1: Data Loading and Validation (10 points)"""
@@ -123,37 +274,39 @@ class CSPGrader:
         
         try:
             # Test if data loading is implemented
-            if hasattr(self.student_module, 'data') and self.student_module.data is not None:
+            data = self._attrs.get('data', _MISSING)
+            if data is not _MISSING and data is not None:
                 points += 3
                 self.add_feedback("✓ Data loading implemented")
             else:
                 self.add_error("Data loading not implemented or data is None")
             
             # Test if validation is implemented
-            if hasattr(self.student_module, 'is_valid') and self.student_module.is_valid is not None:
+            is_valid = self._attrs.get('is_valid', _MISSING)
+            if is_valid is not _MISSING and is_valid is not None:
                 points += 2
                 self.add_feedback("✓ Data validation implemented")
             else:
                 self.add_error("Data validation not implemented")
             
             # Test if required variables are extracted
-            required_vars = ['tasks', 'resources', 'time_slots', 'constraints']
-            for var in required_vars:
-                if hasattr(self.student_module, var) and getattr(self.student_module, var) is not None:
+            for var in self._DATA_NAMES:
+                value = self._attrs.get(var, _MISSING)
+                if value is not _MISSING and value is not None:
                     points += 1
                     self.add_feedback(f"✓ {var} extracted correctly")
                 else:
                     self.add_error(f"{var} not extracted or is None")
             
             # Test data structure
-            if hasattr(self.student_module, 'data') and self.student_module.data:
-                if 'schedule' in self.student_module.data:
+            if data is not _MISSING and data:
+                if 'schedule' in data:
                     points += 1
                     self.add_feedback("✓ Correct data structure (schedule key present)")
                 else:
                     self.add_error("Incorrect data structure (missing schedule key)")
             
-            return min(points, 10)
+            return points
             
         except Exception as e:
             self.add_error(f"Data loading test failed: {str(e)}")
@@ -165,41 +318,44 @@ class CSPGrader:
         
         try:
             # Test if CSP object is created
-            if hasattr(self.student_module, 'scheduling_csp') and self.student_module.scheduling_csp is not None:
+            csp = self._attrs.get('scheduling_csp', _MISSING)
+            if csp is not _MISSING and csp is not None:
                 points += 5
                 self.add_feedback("✓ CSP object created")
             else:
                 self.add_error("CSP object not created or is None")
             
             # Test CSP initialization
-            if hasattr(self.student_module, 'scheduling_csp'):
-                csp = self.student_module.scheduling_csp
-                if hasattr(csp, 'variables') and csp.variables:
+            if csp is not _MISSING:
+                variables = getattr(csp, 'variables', _MISSING)
+                if variables is not _MISSING and variables:
                     points += 3
                     self.add_feedback("✓ CSP variables initialized")
                 else:
                     self.add_error("CSP variables not initialized")
                 
-                if hasattr(csp, 'domains') and csp.domains:
+                domains = getattr(csp, 'domains', _MISSING)
+                if domains is not _MISSING and domains:
                     points += 3
                     self.add_feedback("✓ CSP domains initialized")
                 else:
                     self.add_error("CSP domains not initialized")
                 
-                if hasattr(csp, 'constraint_graph') and csp.constraint_graph is not None:
+                constraint_graph = getattr(csp, 'constraint_graph', _MISSING)
+                if constraint_graph is not _MISSING and constraint_graph is not None:
                     points += 2
                     self.add_feedback("✓ CSP constraint graph initialized")
                 else:
                     self.add_error("CSP constraint graph not initialized")
                 
                 # Test CSP solve method
-                if hasattr(csp, 'solve'):
+                if getattr(csp, 'solve', _MISSING) is not _MISSING:
                     points += 2
                     self.add_feedback("✓ CSP solve method present")
                 else:
                     self.add_error("CSP solve method missing")
             
-            return min(points, 15)
+            return points
             
         except Exception as e:
             self.add_error(f"CSP formulation test failed: {str(e)}")
@@ -210,47 +366,10 @@ class CSPGrader:
         points = 0
         
         try:
-            # Test MRV heuristic
-            if hasattr(self.student_module, 'mrv_heuristic'):
-                points += 5
-                self.add_feedback("✓ MRV heuristic implemented")
-                
-                # Test if it's callable
-                if callable(self.student_module.mrv_heuristic):
-                    points += 1
-                    self.add_feedback("✓ MRV heuristic is callable")
-                else:
-                    self.add_error("MRV heuristic is not callable")
-            else:
-                self.add_error("MRV heuristic not implemented")
+            # Test MRV, Degree and Combined heuristics
+            points += self.check_functions(self._HEURISTIC_CHECKS)
             
-            # Test Degree heuristic
-            if hasattr(self.student_module, 'degree_heuristic'):
-                points += 3
-                self.add_feedback("✓ Degree heuristic implemented")
-                
-                if callable(self.student_module.degree_heuristic):
-                    points += 1
-                    self.add_feedback("✓ Degree heuristic is callable")
-                else:
-                    self.add_error("Degree heuristic is not callable")
-            else:
-                self.add_error("Degree heuristic not implemented")
-            
-            # Test Combined heuristic
-            if hasattr(self.student_module, 'combined_heuristic'):
-                points += 3
-                self.add_feedback("✓ Combined heuristic implemented")
-                
-                if callable(self.student_module.combined_heuristic):
-                    points += 1
-                    self.add_feedback("✓ Combined heuristic is callable")
-                else:
-                    self.add_error("Combined heuristic is not callable")
-            else:
-                self.add_error("Combined heuristic not implemented")
-            
-            return min(points, 15)
+            return points
             
         except Exception as e:
             self.add_error(f"Heuristic test failed: {str(e)}")
@@ -262,26 +381,31 @@ class CSPGrader:
         
         try:
             # Test if solutions dictionary is created
-            if hasattr(self.student_module, 'solutions') and self.student_module.solutions is not None:
+            solutions = self._attrs.get('solutions', _MISSING)
+            if solutions is not _MISSING and solutions is not None:
                 points += 5
                 self.add_feedback("✓ Solutions dictionary created")
             else:
                 self.add_error("Solutions dictionary not created or is None")
             
             # Test if best solution is selected
-            if hasattr(self.student_module, 'best_solution') and self.student_module.best_solution is not None:
+            best_solution = self._attrs.get('best_solution', _MISSING)
+            if best_solution is not _MISSING and best_solution is not None:
                 points += 5
                 self.add_feedback("✓ Best solution selected")
             else:
                 self.add_error("Best solution not selected or is None")
             
             # Test if CSP solve method works
-            if hasattr(self.student_module, 'scheduling_csp') and self.student_module.scheduling_csp:
-                csp = self.student_module.scheduling_csp
-                if hasattr(csp, 'solve'):
+            csp = self._attrs.get('scheduling_csp', _MISSING)
+            if csp is not _MISSING and csp:
+                if getattr(csp, 'solve', _MISSING) is not _MISSING:
                     try:
-                        # Test with a short timeout
-                        solution = csp.solve(heuristic='mrv', timeout=5)
+                        # Test with a short timeout (started early by run_all_tests when possible)
+                        if self._solve_future is not None:
+                            solution = self._solve_future.result()
+                        else:
+                            solution = csp.solve(heuristic='mrv', timeout=5)
                         if solution is not None:
                             points += 5
                             self.add_feedback("✓ CSP solve method works and returns solution")
@@ -294,8 +418,7 @@ class CSPGrader:
                     self.add_error("CSP solve method missing")
             
             # Test multiple heuristics
-            if hasattr(self.student_module, 'solutions') and self.student_module.solutions:
-                solutions = self.student_module.solutions
+            if solutions is not _MISSING and solutions:
                 if isinstance(solutions, dict) and len(solutions) > 0:
                     points += 3
                     self.add_feedback(f"✓ Multiple heuristics tested ({len(solutions)} heuristics)")
@@ -303,15 +426,14 @@ class CSPGrader:
                     self.add_error("Solutions dictionary is empty or not a dictionary")
             
             # Test solution format
-            if hasattr(self.student_module, 'best_solution') and self.student_module.best_solution:
-                best_solution = self.student_module.best_solution
+            if best_solution is not _MISSING and best_solution:
                 if isinstance(best_solution, dict):
                     points += 2
                     self.add_feedback("✓ Best solution is in correct format (dictionary)")
                 else:
                     self.add_error("Best solution is not in correct format (should be dictionary)")
             
-            return min(points, 20)
+            return points
             
         except Exception as e:
             self.add_error(f"CSP solving test failed: {str(e)}")
@@ -322,55 +444,19 @@ class CSPGrader:
         points = 0
         
         try:
-            # Test constraint violation analysis
-            if hasattr(self.student_module, 'analyze_constraint_violations'):
-                points += 3
-                self.add_feedback("✓ Constraint violation analysis function implemented")
-                
-                if callable(self.student_module.analyze_constraint_violations):
-                    points += 1
-                    self.add_feedback("✓ Constraint violation analysis is callable")
-                else:
-                    self.add_error("Constraint violation analysis is not callable")
-            else:
-                self.add_error("Constraint violation analysis function not implemented")
-            
-            # Test solution validation
-            if hasattr(self.student_module, 'validate_solution'):
-                points += 3
-                self.add_feedback("✓ Solution validation function implemented")
-                
-                if callable(self.student_module.validate_solution):
-                    points += 1
-                    self.add_feedback("✓ Solution validation is callable")
-                else:
-                    self.add_error("Solution validation is not callable")
-            else:
-                self.add_error("Solution validation function not implemented")
-            
-            # Test performance metrics
-            if hasattr(self.student_module, 'calculate_performance_metrics'):
-                points += 3
-                self.add_feedback("✓ Performance metrics function implemented")
-                
-                if callable(self.student_module.calculate_performance_metrics):
-                    points += 1
-                    self.add_feedback("✓ Performance metrics is callable")
-                else:
-                    self.add_error("Performance metrics is not callable")
-            else:
-                self.add_error("Performance metrics function not implemented")
+            # Test analysis, validation and metrics functions
+            points += self.check_functions(self._ANALYSIS_CHECKS)
             
             # Test if analysis is performed on best solution
-            if hasattr(self.student_module, 'best_solution') and self.student_module.best_solution:
-                best_solution = self.student_module.best_solution
+            best_solution = self._attrs.get('best_solution', _MISSING)
+            if best_solution is not _MISSING and best_solution:
                 if isinstance(best_solution, dict) and len(best_solution) > 0:
                     points += 3
                     self.add_feedback("✓ Solution analysis performed on valid solution")
                 else:
                     self.add_error("Solution analysis not performed on valid solution")
             
-            return min(points, 15)
+            return points
             
         except Exception as e:
             self.add_error(f"Solution analysis test failed: {str(e)}")
@@ -381,42 +467,19 @@ class CSPGrader:
         points = 0
         
         try:
-            # Test Gantt chart function
-            if hasattr(self.student_module, 'create_gantt_chart'):
-                points += 3
-                self.add_feedback("✓ Gantt chart function implemented")
-                
-                if callable(self.student_module.create_gantt_chart):
-                    points += 1
-                    self.add_feedback("✓ Gantt chart function is callable")
-                else:
-                    self.add_error("Gantt chart function is not callable")
-            else:
-                self.add_error("Gantt chart function not implemented")
-            
-            # Test resource utilization chart function
-            if hasattr(self.student_module, 'create_resource_utilization_chart'):
-                points += 3
-                self.add_feedback("✓ Resource utilization chart function implemented")
-                
-                if callable(self.student_module.create_resource_utilization_chart):
-                    points += 1
-                    self.add_feedback("✓ Resource utilization chart function is callable")
-                else:
-                    self.add_error("Resource utilization chart function is not callable")
-            else:
-                self.add_error("Resource utilization chart function not implemented")
+            # Test chart functions
+            points += self.check_functions(self._VISUALIZATION_CHECKS)
             
             # Test if visualizations are created when solution exists
-            if hasattr(self.student_module, 'best_solution') and self.student_module.best_solution:
-                best_solution = self.student_module.best_solution
+            best_solution = self._attrs.get('best_solution', _MISSING)
+            if best_solution is not _MISSING and best_solution:
                 if isinstance(best_solution, dict) and len(best_solution) > 0:
                     points += 2
                     self.add_feedback("✓ Visualizations created for valid solution")
                 else:
                     self.add_error("Visualizations not created for valid solution")
             
-            return min(points, 10)
+            return points
             
         except Exception as e:
             self.add_error(f"Visualization test failed: {str(e)}")
@@ -427,42 +490,19 @@ class CSPGrader:
         points = 0
         
         try:
-            # Test JSON export function
-            if hasattr(self.student_module, 'export_solution_json'):
-                points += 3
-                self.add_feedback("✓ JSON export function implemented")
-                
-                if callable(self.student_module.export_solution_json):
-                    points += 1
-                    self.add_feedback("✓ JSON export function is callable")
-                else:
-                    self.add_error("JSON export function is not callable")
-            else:
-                self.add_error("JSON export function not implemented")
-            
-            # Test CSV export function
-            if hasattr(self.student_module, 'export_solution_csv'):
-                points += 3
-                self.add_feedback("✓ CSV export function implemented")
-                
-                if callable(self.student_module.export_solution_csv):
-                    points += 1
-                    self.add_feedback("✓ CSV export function is callable")
-                else:
-                    self.add_error("CSV export function is not callable")
-            else:
-                self.add_error("CSV export function not implemented")
+            # Test JSON and CSV export functions
+            points += self.check_functions(self._EXPORT_CHECKS)
             
             # Test if export is performed when solution exists
-            if hasattr(self.student_module, 'best_solution') and self.student_module.best_solution:
-                best_solution = self.student_module.best_solution
+            best_solution = self._attrs.get('best_solution', _MISSING)
+            if best_solution is not _MISSING and best_solution:
                 if isinstance(best_solution, dict) and len(best_solution) > 0:
                     points += 2
                     self.add_feedback("✓ Export functionality used for valid solution")
                 else:
                     self.add_error("Export functionality not used for valid solution")
             
-            return min(points, 10)
+            return points
             
         except Exception as e:
             self.add_error(f"Export functionality test failed: {str(e)}")
@@ -474,38 +514,35 @@ class CSPGrader:
         
         try:
             # Test if all questions are answered
-            questions = ['q1_answer', 'q2_answer', 'q3_answer', 'q4_answer', 'q5_answer']
             valid_answers = ['A', 'B', 'C', 'D']
             
-            for i, question in enumerate(questions):
-                if hasattr(self.student_module, question):
-                    answer = getattr(self.student_module, question)
+            for i, question in enumerate(self._ANSWER_NAMES):
+                answer = self._attrs.get(question, _MISSING)
+                if answer is not _MISSING:
                     if answer in valid_answers:
                         points += 2
-                        self.add_feedback(f"✓ Question {i+1} answered correctly")
+                        self.add_feedback(f"✓ {self._QUESTION_LABELS[i]} answered correctly")
                     elif answer is not None:
                         points += 1
-                        self.add_feedback(f"⚠️  Question {i+1} answered but not with A/B/C/D")
+                        self.add_feedback(f"⚠️  {self._QUESTION_LABELS[i]} answered but not with A/B/C/D")
                     else:
-                        self.add_error(f"Question {i+1} not answered")
+                        self.add_error(f"{self._QUESTION_LABELS[i]} not answered")
                 else:
-                    self.add_error(f"Question {i+1} variable not found")
+                    self.add_error(f"{self._QUESTION_LABELS[i]} variable not found")
             
             # Test explanations
-            explanations = ['q1_explanation', 'q2_explanation', 'q3_explanation', 'q4_explanation', 'q5_explanation']
-            
-            for i, explanation in enumerate(explanations):
-                if hasattr(self.student_module, explanation):
-                    expl = getattr(self.student_module, explanation)
+            for i, explanation in enumerate(self._EXPLANATION_NAMES):
+                expl = self._attrs.get(explanation, _MISSING)
+                if expl is not _MISSING:
                     if expl and isinstance(expl, str) and len(expl.strip()) > 10:
                         points += 1
-                        self.add_feedback(f"✓ Question {i+1} explanation provided")
+                        self.add_feedback(f"✓ {self._QUESTION_LABELS[i]} explanation provided")
                     else:
-                        self.add_error(f"Question {i+1} explanation missing or too short")
+                        self.add_error(f"{self._QUESTION_LABELS[i]} explanation missing or too short")
                 else:
-                    self.add_error(f"Question {i+1} explanation variable not found")
+                    self.add_error(f"{self._QUESTION_LABELS[i]} explanation variable not found")
             
-            return min(points, 15)
+            return points
             
         except Exception as e:
             self.add_error(f"Conceptual questions test failed: {str(e)}")
@@ -516,45 +553,10 @@ class CSPGrader:
         points = 0
         
         try:
-            # Test arc consistency
-            if hasattr(self.student_module, 'compare_heuristics'):
-                points += 3
-                self.add_feedback("✓ Heuristic comparison function implemented")
-                
-                if callable(self.student_module.compare_heuristics):
-                    points += 1
-                    self.add_feedback("✓ Heuristic comparison is callable")
-                else:
-                    self.add_error("Heuristic comparison is not callable")
-            else:
-                self.add_error("Heuristic comparison function not implemented")
-            
-            # Test solution optimization
-            if hasattr(self.student_module, 'optimize_solution'):
-                points += 3
-                self.add_feedback("✓ Solution optimization function implemented")
-                
-                if callable(self.student_module.optimize_solution):
-                    points += 1
-                    self.add_feedback("✓ Solution optimization is callable")
-                else:
-                    self.add_error("Solution optimization is not callable")
-            else:
-                self.add_error("Solution optimization function not implemented")
-            
-            # Test GUI integration
-            if hasattr(self.student_module, 'run_gui'):
-                points += 2
-                self.add_feedback("✓ GUI integration function implemented")
-                
-                if callable(self.student_module.run_gui):
-                    self.add_feedback("✓ GUI integration is callable")
-                else:
-                    self.add_error("GUI integration is not callable")
-            else:
-                self.add_error("GUI integration function not implemented")
+            # Test comparison, optimization and GUI functions
+            points += self.check_functions(self._BONUS_CHECKS)
             
-            return min(points, 10)
+            return points
             
         except Exception as e:
             self.add_error(f"Bonus features test failed: {str(e)}")
@@ -562,187 +564,196 @@ class CSPGrader:
     
     def run_all_tests(self):
         """Run all grading tests"""
-        print(f"\n{'='*80}")
-        print(f"GRADING STUDENT: {self.student_name}")
-        print(f"FILE: {self.student_file}")
-        print(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*80}")
-        
-        # Run all tests
-        total_score = 0
-        
-        total_score += self.grade_section("Data Loading and Validation", 10, self.test_data_loading)
-        total_score += self.grade_section("CSP Formulation", 15, self.test_csp_formulation)
-        total_score += self.grade_section("Heuristic Implementation", 15, self.test_heuristics)
-        total_score += self.grade_section("CSP Solving", 20, self.test_csp_solving)
-        total_score += self.grade_section("Solution Analysis", 15, self.test_solution_analysis)
-        total_score += self.grade_section("Visualization", 10, self.test_visualization)
-        total_score += self.grade_section("Export Functionality", 10, self.test_export_functionality)
-        total_score += self.grade_section("Conceptual Questions", 15, self.test_conceptual_questions)
-        total_score += self.grade_section("Bonus Features", 10, self.test_bonus_features)
+        self._log_buf.append(f"\n{'='*80}")
+        self._log_buf.append(f"GRADING STUDENT: {self.student_name}")
+        self._log_buf.append(f"FILE: {self.student_file}")
+        self._log_buf.append(f"TIMESTAMP: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        self._log_buf.append(f"{'='*80}")
+        
+        # Run all tests, overlapping the trial solve with the introspection-only sections
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            csp = self._attrs.get('scheduling_csp', _MISSING)
+            if csp is not _MISSING and csp and getattr(csp, 'solve', _MISSING) is not _MISSING:
+                self._solve_future = executor.submit(csp.solve, heuristic='mrv', timeout=5)
+            
+            try:
+                total_score = sum(
+                    self.grade_section(section_name, max_points, getattr(self, test_name), names)
+                    for section_name, max_points, test_name, names in self._SECTIONS
+                )
+            finally:
+                self._solve_future = None
         
         self.results['total_score'] = total_score
         
         # Generate final report
-        self.generate_report()
+        try:
+            self.generate_report()
+        finally:
+            self.flush_log()
     
     def generate_report(self):
         """Generate detailed grading report"""
-        print(f"\n{'='*80}")
-        print("FINAL GRADING REPORT")
-        print(f"{'='*80}")
+        self._log_buf.append(f"\n{'='*80}")
+        self._log_buf.append("FINAL GRADING REPORT")
+        self._log_buf.append(f"{'='*80}")
         
-        print(f"Student: {self.student_name}")
-        print(f"File: {self.student_file}")
-        print(f"Total Score: {self.results['total_score']}/{self.results['max_score']} ({self.results['total_score']/self.results['max_score']*100:.1f}%)")
+        self._log_buf.append(f"Student: {self.student_name}")
+        self._log_buf.append(f"File: {self.student_file}")
+        total_percentage = (self.results['total_score'] / self.results['max_score']) * 100
+        self._log_buf.append(f"Total Score: {self.results['total_score']}/{self.results['max_score']} ({total_percentage:.1f}%)")
         
-        print(f"\nSECTION BREAKDOWN:")
-        print(f"{'Section':<30} {'Points':<10} {'Percentage':<12}")
-        print(f"{'-'*30} {'-'*10} {'-'*12}")
+        self._log_buf.append(f"\nSECTION BREAKDOWN:")
+        self._log_buf.append(f"{'Section':<30} {'Points':<10} {'Percentage':<12}")
+        self._log_buf.append(f"{'-'*30} {'-'*10} {'-'*12}")
         
         for section_name, section_data in self.results['sections'].items():
             points = section_data['points_earned']
             max_points = section_data['max_points']
             percentage = section_data['percentage']
-            print(f"{section_name:<30} {points}/{max_points:<10} {percentage:.1f}%")
+            self._log_buf.append(f"{section_name:<30} {points}/{max_points:<10} {percentage:.1f}%")
         
         if self.results['errors']:
-            print(f"\nERRORS FOUND:")
+            self._log_buf.append(f"\nERRORS FOUND:")
             for error in self.results['errors']:
-                print(f"❌ {error}")
+                self._log_buf.append(f"❌ {error}")
         
         if self.results['warnings']:
-            print(f"\nWARNINGS:")
+            self._log_buf.append(f"\nWARNINGS:")
             for warning in self.results['warnings']:
-                print(f"⚠️  {warning}")
+                self._log_buf.append(f"⚠️  {warning}")
         
-        print(f"\nDETAILED FEEDBACK:")
-        for feedback in self.results['feedback']:
-            level_icon = {"info": "ℹ️", "warning": "⚠️", "error": "❌"}
-            icon = level_icon.get(feedback['level'], "ℹ️")
-            print(f"{icon} {feedback['message']}")
+        self._log_buf.append(f"\nDETAILED FEEDBACK:")
+        self._log_buf.extend(f"{_LEVEL_ICONS.get(feedback.level, 'ℹ️')} {feedback.message}"
+                             for feedback in self.results['feedback'])
         
         # Save detailed report to file
         report_file = f"grade_report_{self.student_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report = dict(self.results, feedback=[fb._asdict() for fb in self.results['feedback']])
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                f.write(json.dumps(report, indent=2))
         
-        print(f"\nDetailed report saved to: {report_file}")
+        self._log_buf.append(f"\nDetailed report saved to: {report_file}")
         
         # Determine letter grade
-        percentage = (self.results['total_score'] / self.results['max_score']) * 100
-        if percentage >= 93:
-            letter_grade = "A"
-        elif percentage >= 90:
-            letter_grade = "A-"
-        elif percentage >= 87:
-            letter_grade = "B+"
-        elif percentage >= 83:
-            letter_grade = "B"
-        elif percentage >= 80:
-            letter_grade = "B-"
-        elif percentage >= 77:
-            letter_grade = "C+"
-        elif percentage >= 73:
-            letter_grade = "C"
-        elif percentage >= 70:
-            letter_grade = "C-"
-        elif percentage >= 67:
-            letter_grade = "D+"
-        elif percentage >= 63:
-            letter_grade = "D"
-        elif percentage >= 60:
-            letter_grade = "D-"
-        else:
-            letter_grade = "F"
+        letter_grade = _GRADE_LETTERS[bisect.bisect_right(_GRADE_CUTOFFS, total_percentage)]
         
-        print(f"\nLETTER GRADE: {letter_grade}")
+        self._log_buf.append(f"\nLETTER GRADE: {letter_grade}")
         
         # Generate email template
-        self.generate_email_template(letter_grade, percentage)
+        self.generate_email_template(letter_grade, total_percentage)
     
     def generate_email_template(self, letter_grade: str, percentage: float):
         """Generate email template for student feedback"""
         email_file = f"email_template_{self.student_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
         
+        rule = "-" * 50 + "\n"
+        parts = [
+            "Subject: CSP Scheduling Project - Grading Results\n\n",
+            "Dear Student,\n\n",
+            "Your CSP Scheduling Project has been graded. Here are your results:\n\n",
+            f"Overall Score: {self.results['total_score']}/{self.results['max_score']} ({percentage:.1f}%)\n",
+            f"Letter Grade: {letter_grade}\n\n",
+            "SECTION BREAKDOWN:\n",
+            rule,
+        ]
+        parts.extend(
+            f"{section_name}: {section_data['points_earned']}/{section_data['max_points']} ({section_data['percentage']:.1f}%)\n"
+            for section_name, section_data in self.results['sections'].items()
+        )
+        
+        parts.append("\nAREAS FOR IMPROVEMENT:\n")
+        parts.append(rule)
+        
+        # Find sections with low scores
+        low_score_sections = [section_name for section_name, section_data in self.results['sections'].items()
+                              if section_data['percentage'] < 70]
+        
+        if low_score_sections:
+            parts.append("You need to improve in the following areas:\n")
+            parts.extend(f"- {section}\n" for section in low_score_sections)
+        else:
+            parts.append("Good work! All sections are well implemented.\n")
+        
+        if self.results['errors']:
+            parts.append("\nSPECIFIC ISSUES FOUND:\n")
+            parts.append(rule)
+            parts.extend(f"- {error}\n" for error in self.results['errors'])
+        
+        parts.append("\nPOSITIVE FEEDBACK:\n")
+        parts.append(rule)
+        positive_feedback = [fb.message for fb in self.results['feedback'] if fb.level == 'info']
+        if positive_feedback:
+            parts.extend(f"- {feedback}\n" for feedback in positive_feedback[:5])  # Top 5 positive feedback
+        else:
+            parts.append("- Keep working on the implementation\n")
+        
+        parts.append("\nIf you have any questions about your grade, please don't hesitate to ask.\n\n")
+        parts.append("Best regards,\n")
+        parts.append("Your Teaching Assistant\n")
+        
         with open(email_file, 'w') as f:
-            f.write(f"Subject: CSP Scheduling Project - Grading Results\n\n")
-            f.write(f"Dear Student,\n\n")
-            f.write(f"Your CSP Scheduling Project has been graded. Here are your results:\n\n")
-            f.write(f"Overall Score: {self.results['total_score']}/{self.results['max_score']} ({percentage:.1f}%)\n")
-            f.write(f"Letter Grade: {letter_grade}\n\n")
-            
-            f.write("SECTION BREAKDOWN:\n")
-            f.write("-" * 50 + "\n")
-            for section_name, section_data in self.results['sections'].items():
-                points = section_data['points_earned']
-                max_points = section_data['max_points']
-                percentage = section_data['percentage']
-                f.write(f"{section_name}: {points}/{max_points} ({percentage:.1f}%)\n")
-            
-            f.write("\nAREAS FOR IMPROVEMENT:\n")
-            f.write("-" * 50 + "\n")
-            
-            # Find sections with low scores
-            low_score_sections = []
-            for section_name, section_data in self.results['sections'].items():
-                if section_data['percentage'] < 70:
-                    low_score_sections.append(section_name)
-            
-            if low_score_sections:
-                f.write("You need to improve in the following areas:\n")
-                for section in low_score_sections:
-                    f.write(f"- {section}\n")
-            else:
-                f.write("Good work! All sections are well implemented.\n")
-            
-            if self.results['errors']:
-                f.write("\nSPECIFIC ISSUES FOUND:\n")
-                f.write("-" * 50 + "\n")
-                for error in self.results['errors']:
-                    f.write(f"- {error}\n")
-            
-            f.write("\nPOSITIVE FEEDBACK:\n")
-            f.write("-" * 50 + "\n")
-            positive_feedback = [f['message'] for f in self.results['feedback'] if f['level'] == 'info']
-            if positive_feedback:
-                for feedback in positive_feedback[:5]:  # Top 5 positive feedback
-                    f.write(f"- {feedback}\n")
-            else:
-                f.write("- Keep working on the implementation\n")
-            
-            f.write("\nIf you have any questions about your grade, please don't hesitate to ask.\n\n")
-            f.write("Best regards,\n")
-            f.write("Your Teaching Assistant\n")
+            f.write("".join(parts))
         
-        print(f"Email template saved to: {email_file}")
+        self._log_buf.append(f"Email template saved to: {email_file}")
+
+
+def _limit_worker_resources(cpu_seconds: int):
+    """Cap the CPU time of a grading worker process"""
+    if resource is not None:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+
+
+def _grade_worker(student_file: str) -> Dict[str, Any]:
+    """Grade a submission and return its results (runs in a worker process)"""
+    grader = CSPGrader(student_file)
+    grader.run_all_tests()
+    return grader.results
+
+
+def grade_in_subprocess(student_file: str, timeout: int = _GRADING_TIMEOUT) -> Dict[str, Any]:
+    """Grade a submission in a separate process, killing it after timeout seconds"""
+    with multiprocessing.Pool(1, initializer=_limit_worker_resources, initargs=(timeout,)) as pool:
+        try:
+            return pool.apply_async(_grade_worker, (student_file,)).get(timeout)
+        except multiprocessing.TimeoutError:
+            raise TimeoutError(f"Grading '{student_file}' exceeded {timeout} seconds") from None
 
 
 def main():
     """Main function to run the grader"""
-    if len(sys.argv) != 2:
-        print("Usage: python grader.py <student_file.py>")
+    if len(sys.argv) < 2:
+        print("Usage: python grader.py <student_file.py> [<student_file.py> ...]")
         print("Example: python grader.py student_submission.py")
         sys.exit(1)
     
-    student_file = sys.argv[1]
+    student_files = sys.argv[1:]
     
-    if not os.path.exists(student_file):
-        print(f"Error: File '{student_file}' not found.")
-        sys.exit(1)
+    for student_file in student_files:
+        if not os.path.exists(student_file):
+            print(f"Error: File '{student_file}' not found.")
+            sys.exit(1)
+        
+        if not student_file.endswith('.py'):
+            print(f"Error: File '{student_file}' is not a Python file.")
+            sys.exit(1)
     
-    if not student_file.endswith('.py'):
-        print(f"Error: File '{student_file}' is not a Python file.")
-        sys.exit(1)
+    failed = False
+    for student_file in student_files:
+        try:
+            grade_in_subprocess(student_file)
+        except Exception as e:
+            print(f"Fatal error during grading: {str(e)}")
+            traceback.print_exc()
+            failed = True
     
-    try:
-        grader = CSPGrader(student_file)
-        grader.run_all_tests()
-    except Exception as e:
-        print(f"Fatal error during grading: {str(e)}")
-        traceback.print_exc()
+    if failed:
         sys.exit(1)
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main() 
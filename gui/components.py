@@ -5,24 +5,174 @@ Modern PySide6-based components for better user experience
 
 import sys
 import os
+import re
 from typing import Dict, List, Any, Optional, Callable
 from datetime import datetime
+from collections import defaultdict
+from functools import lru_cache
 
 # Add the project root to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import numpy as np
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, 
-    QTableWidget, QTableWidgetItem, QHeaderView, QTextEdit, QComboBox,
+    QTableView, QAbstractItemView, QHeaderView, QTextEdit, QComboBox,
     QSpinBox, QCheckBox, QGroupBox, QFrame, QScrollArea, QSizePolicy,
     QProgressBar, QSlider, QSplitter, QMessageBox, QFileDialog,
-    QLineEdit, QTextBrowser, QListWidget, QListWidgetItem
+    QLineEdit, QPlainTextEdit, QListWidget, QListWidgetItem
+)
+from PySide6.QtCore import (
+    Qt, QTimer, pyqtSignal, QThread, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
 )
-from PySide6.QtCore import Qt, QTimer, pyqtSignal, QThread
 from PySide6.QtGui import QFont, QPalette, QColor, QPixmap, QPainter, QBrush
 
 from utils.constraint_utils import get_constraint_violations, calculate_schedule_score
-from utils.visualization import create_gantt_chart, create_resource_utilization_chart
+
+# Shared cell backgrounds
+_BRUSH_ASSIGNED = QBrush(QColor(200, 255, 200))  # Light green
+_BRUSH_EMPTY = QBrush(QColor(240, 240, 240))  # Light gray
+_BRUSH_VIOLATION = QBrush(QColor(255, 200, 200))  # Light red
+
+# Separator for comma-separated editor fields
+_CSV_SPLIT = re.compile(r'\s*,\s*')
+
+
+def _split_csv(text):
+    """Split a comma-separated field into its non-empty, stripped parts"""
+    return [part for part in _CSV_SPLIT.split(text.strip()) if part]
+
+
+def _freeze(value):
+    """Hashable snapshot of nested dicts and lists"""
+    if isinstance(value, dict):
+        return tuple((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+@lru_cache(maxsize=4096)
+def _cached_violations(task_id, assignment_key, task_key, resource_key, context_key):
+    """get_constraint_violations on frozen inputs
+    
+    context_key holds the other assignments that can affect the task: those
+    on the same resource and day (in schedule order) and its dependencies.
+    """
+    solution = {other_id: dict(other_key) for other_id, other_key in context_key}
+    assignment = solution[task_id] = dict(assignment_key)
+    tasks = [dict(task_key)] if task_key is not None else []
+    resources = [dict(resource_key)] if resource_key is not None else []
+    return tuple(get_constraint_violations(assignment, task_id, resources, tasks, solution))
+
+
+def _schedule_violations(schedule_data, tasks, resources, task_ids=None):
+    """Violations per task (all scheduled tasks by default)
+    
+    Results are memoized on each task's own inputs, so unchanged tasks are
+    not rechecked on repeated refreshes.
+    """
+    tasks_by_id = {}
+    for task in tasks:
+        tasks_by_id.setdefault(task['id'], task)
+    resources_by_id = {}
+    for resource in resources:
+        resources_by_id.setdefault(resource['id'], resource)
+    
+    slots = defaultdict(list)  # (resource_id, day) -> task IDs in schedule order
+    for task_id, assignment in schedule_data.items():
+        slots[(assignment['resource_id'], assignment['start_day'])].append(task_id)
+    
+    frozen = {}
+    def freeze_assignment(task_id):
+        if task_id not in frozen:
+            frozen[task_id] = _freeze(schedule_data[task_id])
+        return frozen[task_id]
+    
+    results = {}
+    for task_id in (schedule_data if task_ids is None else task_ids):
+        assignment = schedule_data[task_id]
+        task = tasks_by_id.get(task_id)
+        resource = resources_by_id.get(assignment['resource_id'])
+        
+        context = dict.fromkeys(slots[(assignment['resource_id'], assignment['start_day'])])
+        if task:
+            context.update(dict.fromkeys(
+                dep_id for dep_id in task.get('dependencies', []) if dep_id in schedule_data
+            ))
+        context.pop(task_id, None)
+        
+        results[task_id] = list(_cached_violations(
+            task_id,
+            freeze_assignment(task_id),
+            _freeze(task) if task else None,
+            _freeze(resource) if resource else None,
+            tuple((other_id, freeze_assignment(other_id)) for other_id in context)
+        ))
+    return results
+
+
+class ScheduleModel(QAbstractTableModel):
+    """Table model for the schedule grid (resources x day/hour slots)
+    
+    Only occupied cells are stored, keyed by (row, column); colors and
+    tooltips are produced on demand for the cells the view paints. Header labels are
+    rebuilt only when the time slots or resources actually change.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cells = {}  # (row, column) -> cell text, occupied cells only
+        self._slots_key = None
+        self._resources_key = None
+        self._column_labels = []
+        self._row_labels = []
+        
+    def set_schedule(self, resources, days, hours, cells):
+        """Replace the grid contents"""
+        self.beginResetModel()
+        self._cells = cells
+        
+        slots_key = (tuple(days), tuple(hours))
+        if slots_key != self._slots_key:
+            self._slots_key = slots_key
+            self._column_labels = [f"{day} {hour}:00" for day in days for hour in hours]
+        
+        resources_key = tuple((resource['id'], resource['name']) for resource in resources)
+        if resources_key != self._resources_key:
+            self._resources_key = resources_key
+            self._row_labels = [f"{resource_id}: {name}" for resource_id, name in resources_key]
+        
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._row_labels)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._column_labels)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        
+        task_info = self._cells.get((index.row(), index.column()), "")
+        
+        if role == Qt.DisplayRole:
+            return task_info
+        if role == Qt.BackgroundRole:
+            return _BRUSH_ASSIGNED if task_info else _BRUSH_EMPTY
+        if role == Qt.ToolTipRole and task_info:
+            return f"Task: {task_info}"
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        
+        if orientation == Qt.Horizontal:
+            return self._column_labels[section]
+        return self._row_labels[section]
 
 
 class ScheduleGridWidget(QWidget):
@@ -36,6 +186,18 @@ class ScheduleGridWidget(QWidget):
         self.tasks = []
         self.resources = []
         self.time_slots = {}
+        self._sched_soa = {}
+        self._day_to_idx = {}
+        self._hour_to_idx = {}
+        self._resource_to_idx = {}
+        
+        # Apply zoom at most once per 50ms while the slider is dragged
+        self._pending_zoom = 100
+        self._zoom_timer = QTimer(self)
+        self._zoom_timer.setSingleShot(True)
+        self._zoom_timer.setInterval(50)
+        self._zoom_timer.timeout.connect(self._apply_zoom)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -52,16 +214,24 @@ class ScheduleGridWidget(QWidget):
         self.zoom_slider = QSlider(Qt.Horizontal)
         self.zoom_slider.setRange(50, 200)
         self.zoom_slider.setValue(100)
-        self.zoom_slider.valueChanged.connect(self.update_zoom)
+        self.zoom_slider.valueChanged.connect(self.schedule_zoom)
         
         header_layout.addWidget(zoom_label)
         header_layout.addWidget(self.zoom_slider)
         layout.addLayout(header_layout)
         
         # Schedule table
-        self.schedule_table = QTableWidget()
+        self.schedule_model = ScheduleModel(self)
+        self.schedule_table = QTableView()
+        self.schedule_table.setModel(self.schedule_model)
         self.schedule_table.setAlternatingRowColors(True)
-        self.schedule_table.itemClicked.connect(self.on_cell_clicked)
+        self.schedule_table.setSortingEnabled(False)
+        self.schedule_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.schedule_table.clicked.connect(self.on_cell_clicked)
+        
+        header = self.schedule_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(80)
         layout.addWidget(self.schedule_table)
         
         # Status bar
@@ -75,6 +245,28 @@ class ScheduleGridWidget(QWidget):
         self.resources = resources
         self.time_slots = time_slots
         
+        # Grid positions of each day, hour and resource
+        days = time_slots.get('days', [])
+        hours = time_slots.get('hours', [])
+        self._day_to_idx = {day: i for i, day in enumerate(days)}
+        self._hour_to_idx = {hour: i for i, hour in enumerate(hours)}
+        self._resource_to_idx = {resource['id']: i for i, resource in enumerate(resources)}
+        
+        # Schedule as parallel arrays (one entry per task, in schedule order);
+        # resources/days outside the grid get index -1
+        assignments = list(schedule_data.values())
+        n = len(assignments)
+        self._sched_soa = {
+            'resource_idx': np.fromiter(
+                (self._resource_to_idx.get(a['resource_id'], -1) for a in assignments), dtype=np.int32, count=n),
+            'day_idx': np.fromiter(
+                (self._day_to_idx.get(a['start_day'], -1) for a in assignments), dtype=np.int32, count=n),
+            'start_hour': np.fromiter((a['start_hour'] for a in assignments), dtype=np.int32, count=n),
+            'end_hour': np.fromiter((a['end_hour'] for a in assignments), dtype=np.int32, count=n),
+            'task_info': np.array(
+                [f"{task_id}: {a['task_name']}" for task_id, a in schedule_data.items()], dtype=object),
+        }
+        
         self.populate_table()
         
     def populate_table(self):
@@ -85,77 +277,125 @@ class ScheduleGridWidget(QWidget):
         # Setup table structure
         days = self.time_slots.get('days', [])
         hours = self.time_slots.get('hours', [])
-        
-        # Set table dimensions
-        self.schedule_table.setRowCount(len(self.resources))
-        self.schedule_table.setColumnCount(len(days) * len(hours))
-        
-        # Set headers
-        headers = []
-        for day in days:
-            for hour in hours:
-                headers.append(f"{day} {hour}:00")
-        self.schedule_table.setHorizontalHeaderLabels(headers)
-        
-        # Set row labels (resources)
-        resource_labels = [f"{r['id']}: {r['name']}" for r in self.resources]
-        self.schedule_table.setVerticalHeaderLabels(resource_labels)
-        
-        # Populate cells
-        for resource_idx, resource in enumerate(self.resources):
-            for day_idx, day in enumerate(days):
-                for hour_idx, hour in enumerate(hours):
-                    col_idx = day_idx * len(hours) + hour_idx
-                    
-                    # Find task assigned to this resource at this time
-                    task_info = self.find_task_at_time(resource['id'], day, hour)
-                    
-                    if task_info:
-                        item = QTableWidgetItem(task_info)
-                        item.setBackground(QColor(200, 255, 200))  # Light green
-                        item.setToolTip(f"Task: {task_info}")
-                    else:
-                        item = QTableWidgetItem("")
-                        item.setBackground(QColor(240, 240, 240))  # Light gray
-                    
-                    self.schedule_table.setItem(resource_idx, col_idx, item)
-        
-        # Resize columns
-        header = self.schedule_table.horizontalHeader()
-        for i in range(self.schedule_table.columnCount()):
-            header.setSectionResizeMode(i, QHeaderView.Fixed)
-            header.resizeSection(i, 80)
+        n_cols = len(days) * len(hours)
+        
+        cells = {}
+        soa = self._sched_soa
+        if n_cols:
+            # Expand every task into one entry per occupied hour
+            durations = np.clip(soa['end_hour'] - soa['start_hour'], 0, None)
+            task_of_slot = np.repeat(np.arange(len(durations)), durations)
+            offsets = np.arange(len(task_of_slot)) - np.repeat(np.cumsum(durations) - durations, durations)
+            slot_hours = soa['start_hour'][task_of_slot] + offsets
+            
+            # Map each hour to its grid position (hours need not be sorted)
+            hours_arr = np.asarray(hours)
+            order = np.argsort(hours_arr, kind='stable')
+            pos = np.minimum(np.searchsorted(hours_arr[order], slot_hours), len(hours) - 1)
+            hour_idx = order[pos]
+            
+            rows = soa['resource_idx'][task_of_slot]
+            day_idx = soa['day_idx'][task_of_slot]
+            inside = (rows >= 0) & (day_idx >= 0) & (hours_arr[hour_idx] == slot_hours)
+            
+            # First task in schedule order wins when tasks overlap
+            flat = (rows.astype(np.int64) * n_cols + day_idx * len(hours) + hour_idx)[inside]
+            flat, first = np.unique(flat, return_index=True)
+            cell_rows, cell_cols = np.divmod(flat, n_cols)
+            cells = dict(zip(zip(cell_rows.tolist(), cell_cols.tolist()),
+                             soa['task_info'][task_of_slot[inside][first]].tolist()))
+        
+        # Suspend painting across the model reset; sizes stay fixed, no resizeToContents
+        self.schedule_table.setUpdatesEnabled(False)
+        try:
+            self.schedule_model.set_schedule(self.resources, days, hours, cells)
+        finally:
+            self.schedule_table.setUpdatesEnabled(True)
+            self.schedule_table.viewport().update()
             
     def find_task_at_time(self, resource_id, day, hour):
         """Find task assigned to resource at specific time"""
-        for task_id, assignment in self.schedule_data.items():
-            if (assignment['resource_id'] == resource_id and 
-                assignment['start_day'] == day and 
-                assignment['start_hour'] <= hour < assignment['end_hour']):
-                return f"{task_id}: {assignment['task_name']}"
-        return None
-        
-    def on_cell_clicked(self, item):
+        resource_idx = self._resource_to_idx.get(resource_id)
+        day_idx = self._day_to_idx.get(day)
+        if resource_idx is None or day_idx is None:
+            return None
+        
+        soa = self._sched_soa
+        mask = ((soa['resource_idx'] == resource_idx) & (soa['day_idx'] == day_idx) &
+                (soa['start_hour'] <= hour) & (soa['end_hour'] > hour))
+        if not mask.any():
+            return None
+        return soa['task_info'][np.argmax(mask)]
+        
+    def on_cell_clicked(self, index):
         """Handle cell click events"""
-        if item.text():
+        task_info = index.data()
+        if task_info:
             # Extract task ID from cell text
-            task_id = item.text().split(':')[0]
+            task_id = task_info.split(':')[0]
             self.task_selected.emit(task_id)
             self.status_label.setText(f"Selected task: {task_id}")
             
+    def schedule_zoom(self, value):
+        """Remember the requested zoom and apply it once the slider settles"""
+        self._pending_zoom = value
+        self._zoom_timer.start()
+        
+    def _apply_zoom(self):
+        """Apply the most recent zoom request"""
+        self.update_zoom(self._pending_zoom)
+        
     def update_zoom(self, value):
         """Update zoom level"""
-        header = self.schedule_table.horizontalHeader()
-        new_width = int(80 * value / 100)
-        for i in range(self.schedule_table.columnCount()):
-            header.resizeSection(i, new_width)
+        # Fixed-mode sections all follow the default size; no per-column resize
+        self.schedule_table.horizontalHeader().setDefaultSectionSize(int(80 * value / 100))
+
+
+class _ViolationSignals(QObject):
+    """Signals for _ViolationWorker (QRunnable cannot emit signals itself)"""
+    
+    finished = pyqtSignal(int, dict)  # Emits generation and task_id -> violations
+
+
+class _ViolationWorker(QRunnable):
+    """Compute constraint violations for every scheduled task off the UI thread"""
+    
+    def __init__(self, signals, generation, schedule_data, tasks, resources):
+        super().__init__()
+        self.signals = signals
+        self.generation = generation
+        # Shallow snapshots so edits on the UI thread cannot resize them mid-run
+        self.schedule_data = dict(schedule_data)
+        self.tasks = list(tasks)
+        self.resources = list(resources)
+        
+    def run(self):
+        results = _schedule_violations(self.schedule_data, self.tasks, self.resources)
+        self.signals.finished.emit(self.generation, results)
 
 
 class ConstraintViolationPanel(QWidget):
-    """Panel for displaying constraint violations"""
+    """Panel for displaying constraint violations
+    
+    A full refresh runs on the global QThreadPool; violations are cached per
+    task, and after an edit only the affected tasks are rechecked via
+    invalidate_task() / invalidate_resource().
+    """
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.schedule_data = {}
+        self.tasks = []
+        self.resources = []
+        self._violations_cache = {}  # task_id -> list of violation messages
+        self._dependents = defaultdict(set)  # task_id -> tasks depending on it
+        
+        # Background refreshes; results from superseded generations are dropped
+        self._generation = 0
+        self._refresh_pending = False
+        self._worker_signals = _ViolationSignals(self)
+        self._worker_signals.finished.connect(self._on_results)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -189,31 +429,96 @@ class ConstraintViolationPanel(QWidget):
         self.refresh_violations()
         
     def refresh_violations(self):
-        """Refresh the violations list"""
-        self.violations_list.clear()
+        """Recompute violations for every task in the background"""
+        self._generation += 1
+        self._violations_cache = {}
+        self._index_dependents()
         
         if not self.schedule_data:
+            self._refresh_pending = False
+            self.violations_list.clear()
             self.summary_label.setText("No schedule data")
             return
-            
-        all_violations = []
-        
-        # Check violations for each task
-        for task_id, assignment in self.schedule_data.items():
-            violations = get_constraint_violations(
-                assignment, task_id, self.resources, self.tasks, self.schedule_data
-            )
-            if violations:
-                all_violations.extend([(task_id, v) for v in violations])
-        
-        # Display violations
-        if all_violations:
-            for task_id, violation in all_violations:
-                item = QListWidgetItem(f"{task_id}: {violation}")
-                item.setBackground(QColor(255, 200, 200))  # Light red
-                self.violations_list.addItem(item)
-            
-            self.summary_label.setText(f"Found {len(all_violations)} violations")
+        
+        self._refresh_pending = True
+        self.summary_label.setText("Checking constraints...")
+        QThreadPool.globalInstance().start(_ViolationWorker(
+            self._worker_signals, self._generation, self.schedule_data, self.tasks, self.resources
+        ))
+        
+    def _on_results(self, generation, results):
+        """Show the results of a background refresh unless it was superseded"""
+        if generation != self._generation:
+            return
+        
+        self._refresh_pending = False
+        self._violations_cache = results
+        self.display_violations()
+        
+    def invalidate_task(self, task_id, *_):
+        """Recheck a task and the tasks that depend on it
+        
+        Accepts the (task_id, updated_data) arguments of
+        TaskEditorWidget.task_updated once the edit has been applied.
+        """
+        self._index_dependents()
+        affected = {task_id} | self._dependents.get(task_id, set())
+        self._recheck(affected)
+        
+    def invalidate_resource(self, resource_id, *_):
+        """Recheck the tasks assigned to a resource
+        
+        Accepts the (resource_id, updated_data) arguments of
+        ResourceEditorWidget.resource_updated once the edit has been applied.
+        """
+        affected = {task_id for task_id, assignment in self.schedule_data.items()
+                    if assignment['resource_id'] == resource_id}
+        self._recheck(affected)
+        
+    def _index_dependents(self):
+        """Map each task ID to the IDs of the tasks that depend on it"""
+        self._dependents = defaultdict(set)
+        for task in self.tasks:
+            for dep_id in task.get('dependencies', []):
+                self._dependents[dep_id].add(task['id'])
+                
+    def _recheck(self, task_ids):
+        """Recompute cached violations for the given tasks and redisplay"""
+        if self._refresh_pending:
+            # The running refresh may predate this edit; start a fresh one
+            self.refresh_violations()
+            return
+        
+        self._violations_cache.update(_schedule_violations(
+            self.schedule_data, self.tasks, self.resources,
+            [task_id for task_id in task_ids if task_id in self.schedule_data]
+        ))
+        
+        self.display_violations()
+        
+    def display_violations(self):
+        """Show the cached violations in schedule order"""
+        self.violations_list.clear()
+        
+        # Insert items in one pass with painting and signals suspended
+        count = 0
+        self.violations_list.setUpdatesEnabled(False)
+        self.violations_list.blockSignals(True)
+        try:
+            for task_id in self.schedule_data:
+                for violation in self._violations_cache.get(task_id, []):
+                    item = QListWidgetItem(f"{task_id}: {violation}")
+                    item.setBackground(_BRUSH_VIOLATION)
+                    self.violations_list.addItem(item)
+                    count += 1
+        finally:
+            self.violations_list.blockSignals(False)
+            self.violations_list.setUpdatesEnabled(True)
+            self.violations_list.viewport().update()
+        
+        # Display summary
+        if count:
+            self.summary_label.setText(f"Found {count} violations")
         else:
             self.summary_label.setText("No violations found! ✅")
 
@@ -221,9 +526,18 @@ class ConstraintViolationPanel(QWidget):
 class PerformanceChartWidget(QWidget):
     """Widget for displaying performance charts"""
     
+    MAX_BAR_WIDTH = 60  # Longest text bar drawn, in characters
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.performance_data = {}
+        
+        # Redraw once the chart type selection settles
+        self._chart_timer = QTimer(self)
+        self._chart_timer.setSingleShot(True)
+        self._chart_timer.setInterval(100)
+        self._chart_timer.timeout.connect(self.update_chart)
+        
         self.setup_ui()
         
     def setup_ui(self):
@@ -236,7 +550,7 @@ class PerformanceChartWidget(QWidget):
         
         self.chart_type_combo = QComboBox()
         self.chart_type_combo.addItems(["Time Comparison", "Quality Comparison", "Tasks Scheduled"])
-        self.chart_type_combo.currentTextChanged.connect(self.update_chart)
+        self.chart_type_combo.currentTextChanged.connect(self.schedule_chart_update)
         header_layout.addWidget(self.chart_type_combo)
         
         self.generate_btn = QPushButton("Generate Chart")
@@ -246,7 +560,8 @@ class PerformanceChartWidget(QWidget):
         layout.addLayout(header_layout)
         
         # Chart display area
-        self.chart_display = QTextBrowser()
+        self.chart_display = QPlainTextEdit()
+        self.chart_display.setReadOnly(True)
         self.chart_display.setMaximumHeight(300)
         layout.addWidget(self.chart_display)
         
@@ -255,6 +570,10 @@ class PerformanceChartWidget(QWidget):
         self.performance_data = performance_data
         self.update_chart()
         
+    def schedule_chart_update(self, *_):
+        """Redraw the chart after the selection has been stable for 100ms"""
+        self._chart_timer.start()
+        
     def update_chart(self):
         """Update the chart display"""
         if not self.performance_data:
@@ -272,35 +591,47 @@ class PerformanceChartWidget(QWidget):
             
     def display_time_chart(self):
         """Display time comparison chart"""
-        chart_text = "Time Comparison (seconds):\n\n"
-        
-        for heuristic, (time_taken, tasks_scheduled) in self.performance_data.items():
-            chart_text += f"{heuristic.upper()}: {time_taken:.2f}s\n"
-            chart_text += "█" * int(time_taken * 10) + "\n\n"
-            
-        self.chart_display.setPlainText(chart_text)
+        times = [time_taken for time_taken, tasks_scheduled in self.performance_data.values()]
+        lines = [
+            f"{heuristic.upper()}: {time_taken:.2f}s\n{'█' * width}"
+            for heuristic, time_taken, width in zip(self.performance_data, times, self._bar_widths(times))
+        ]
+        self.render_chart("Time Comparison (seconds):", lines)
         
     def display_quality_chart(self):
         """Display quality comparison chart"""
-        chart_text = "Quality Score Comparison:\n\n"
-        
-        for heuristic, (time_taken, tasks_scheduled) in self.performance_data.items():
-            # Calculate quality score (placeholder)
-            quality_score = tasks_scheduled / 10.0  # Simple metric
-            chart_text += f"{heuristic.upper()}: {quality_score:.3f}\n"
-            chart_text += "█" * int(quality_score * 20) + "\n\n"
-            
-        self.chart_display.setPlainText(chart_text)
+        # Quality score is a simple placeholder metric: tasks_scheduled / 10
+        scores = [tasks_scheduled / 10.0 for time_taken, tasks_scheduled in self.performance_data.values()]
+        lines = [
+            f"{heuristic.upper()}: {quality_score:.3f}\n{'█' * width}"
+            for heuristic, quality_score, width in zip(self.performance_data, scores, self._bar_widths(scores))
+        ]
+        self.render_chart("Quality Score Comparison:", lines)
         
     def display_tasks_chart(self):
         """Display tasks scheduled comparison chart"""
-        chart_text = "Tasks Scheduled Comparison:\n\n"
-        
-        for heuristic, (time_taken, tasks_scheduled) in self.performance_data.items():
-            chart_text += f"{heuristic.upper()}: {tasks_scheduled} tasks\n"
-            chart_text += "█" * tasks_scheduled + "\n\n"
-            
-        self.chart_display.setPlainText(chart_text)
+        counts = [tasks_scheduled for time_taken, tasks_scheduled in self.performance_data.values()]
+        lines = [
+            f"{heuristic.upper()}: {tasks_scheduled} tasks\n{'█' * width}"
+            for heuristic, tasks_scheduled, width in zip(self.performance_data, counts, self._bar_widths(counts))
+        ]
+        self.render_chart("Tasks Scheduled Comparison:", lines)
+        
+    def render_chart(self, title, lines):
+        """Show the chart title and bar lines with a single setPlainText"""
+        self.chart_display.setUpdatesEnabled(False)
+        try:
+            self.chart_display.setPlainText(title + "\n\n" + "\n\n".join(lines) + "\n\n")
+        finally:
+            self.chart_display.setUpdatesEnabled(True)
+        
+    def _bar_widths(self, values):
+        """Bar lengths scaled so the largest value spans MAX_BAR_WIDTH characters"""
+        vals = np.fromiter(values, dtype=np.float64, count=len(values))
+        peak = vals.max() if len(vals) else 0.0
+        if peak <= 0:
+            return [0] * len(vals)
+        return (vals / peak * self.MAX_BAR_WIDTH).astype(np.int32).tolist()
         
     def generate_chart(self):
         """Generate and save performance chart"""
@@ -394,8 +725,29 @@ class TaskEditorWidget(QWidget):
     def set_tasks(self, tasks):
         """Set the list of tasks for editing"""
         self.tasks = tasks
-        self.task_combo.clear()
-        self.task_combo.addItems([task['id'] for task in tasks])
+        # Joined skill/dependency strings, so selecting a task does no string building
+        self._tasks_by_id = {}
+        for task in tasks:
+            self._tasks_by_id.setdefault(task['id'], task)
+        self._task_display = {task_id: self._display_entry(task)
+                              for task_id, task in self._tasks_by_id.items()}
+        
+        # Repopulate without firing currentTextChanged per item, then select once
+        self.task_combo.blockSignals(True)
+        try:
+            self.task_combo.clear()
+            self.task_combo.addItems(list(self._tasks_by_id))
+        finally:
+            self.task_combo.blockSignals(False)
+        self.on_task_selected(self.task_combo.currentText())
+        
+    @staticmethod
+    def _display_entry(task):
+        """Joined skill and dependency strings of a task"""
+        return {
+            'skills': ', '.join(task.get('required_skills', [])),
+            'deps': ', '.join(task.get('dependencies', []))
+        }
         
     def on_task_selected(self, task_id):
         """Handle task selection"""
@@ -403,14 +755,15 @@ class TaskEditorWidget(QWidget):
             return
             
         # Find the selected task
-        self.current_task = next((task for task in self.tasks if task['id'] == task_id), None)
+        self.current_task = self._tasks_by_id.get(task_id)
         
         if self.current_task:
             self.name_edit.setText(self.current_task.get('name', ''))
             self.duration_spinbox.setValue(self.current_task.get('duration', 1))
             self.priority_combo.setCurrentText(self.current_task.get('priority', 'medium'))
-            self.skills_edit.setText(', '.join(self.current_task.get('required_skills', [])))
-            self.dependencies_edit.setText(', '.join(self.current_task.get('dependencies', [])))
+            display = self._task_display[task_id]
+            self.skills_edit.setText(display['skills'])
+            self.dependencies_edit.setText(display['deps'])
             
     def update_task(self):
         """Update the current task"""
@@ -422,13 +775,16 @@ class TaskEditorWidget(QWidget):
             'name': self.name_edit.text(),
             'duration': self.duration_spinbox.value(),
             'priority': self.priority_combo.currentText(),
-            'required_skills': [s.strip() for s in self.skills_edit.text().split(',') if s.strip()],
-            'dependencies': [d.strip() for d in self.dependencies_edit.text().split(',') if d.strip()]
+            'required_skills': _split_csv(self.skills_edit.text()),
+            'dependencies': _split_csv(self.dependencies_edit.text())
         }
         
         # Emit signal
         self.task_updated.emit(self.current_task['id'], updated_data)
         
+        # The edit has been applied by now (direct connection); refresh its strings
+        self._task_display[self.current_task['id']] = self._display_entry(self.current_task)
+        
         QMessageBox.information(self, "Success", f"Task {self.current_task['id']} updated successfully")
 
 
@@ -497,8 +853,29 @@ class ResourceEditorWidget(QWidget):
     def set_resources(self, resources):
         """Set the list of resources for editing"""
         self.resources = resources
-        self.resource_combo.clear()
-        self.resource_combo.addItems([resource['id'] for resource in resources])
+        # Joined skill/day strings, so selecting a resource does no string building
+        self._resources_by_id = {}
+        for resource in resources:
+            self._resources_by_id.setdefault(resource['id'], resource)
+        self._resource_display = {resource_id: self._display_entry(resource)
+                                  for resource_id, resource in self._resources_by_id.items()}
+        
+        # Repopulate without firing currentTextChanged per item, then select once
+        self.resource_combo.blockSignals(True)
+        try:
+            self.resource_combo.clear()
+            self.resource_combo.addItems(list(self._resources_by_id))
+        finally:
+            self.resource_combo.blockSignals(False)
+        self.on_resource_selected(self.resource_combo.currentText())
+        
+    @staticmethod
+    def _display_entry(resource):
+        """Joined skill and day strings of a resource"""
+        return {
+            'skills': ', '.join(resource.get('skills', [])),
+            'days': ', '.join(resource.get('available_days', []))
+        }
         
     def on_resource_selected(self, resource_id):
         """Handle resource selection"""
@@ -506,13 +883,14 @@ class ResourceEditorWidget(QWidget):
             return
             
         # Find the selected resource
-        self.current_resource = next((r for r in self.resources if r['id'] == resource_id), None)
+        self.current_resource = self._resources_by_id.get(resource_id)
         
         if self.current_resource:
             self.name_edit.setText(self.current_resource.get('name', ''))
-            self.skills_edit.setText(', '.join(self.current_resource.get('skills', [])))
+            display = self._resource_display[resource_id]
+            self.skills_edit.setText(display['skills'])
             self.max_hours_spinbox.setValue(self.current_resource.get('max_hours_per_day', 8))
-            self.availability_edit.setText(', '.join(self.current_resource.get('available_days', [])))
+            self.availability_edit.setText(display['days'])
             
     def update_resource(self):
         """Update the current resource"""
@@ -522,12 +900,15 @@ class ResourceEditorWidget(QWidget):
         # Collect updated data
         updated_data = {
             'name': self.name_edit.text(),
-            'skills': [s.strip() for s in self.skills_edit.text().split(',') if s.strip()],
+            'skills': _split_csv(self.skills_edit.text()),
             'max_hours_per_day': self.max_hours_spinbox.value(),
-            'available_days': [d.strip() for d in self.availability_edit.text().split(',') if d.strip()]
+            'available_days': _split_csv(self.availability_edit.text())
         }
         
         # Emit signal
         self.resource_updated.emit(self.current_resource['id'], updated_data)
         
+        # The edit has been applied by now (direct connection); refresh its strings
+        self._resource_display[self.current_resource['id']] = self._display_entry(self.current_resource)
+        
         QMessageBox.information(self, "Success", f"Resource {self.current_resource['id']} updated successfully") 
\ No newline at end of file
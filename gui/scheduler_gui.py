@@ -8,8 +8,13 @@ import sys
 import os
 import json
 import time
+import hashlib
 import threading
+import multiprocessing
 from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
 
 # Add the project root to the path so we can import our modules
@@ -17,17 +22,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTabWidget, QLabel, QPushButton, QComboBox, QSpinBox, QCheckBox,
-    QProgressBar, QTextEdit, QTableWidget, QTableWidgetItem, QHeaderView,
+    QTabWidget, QLabel, QPushButton, QComboBox, QSpinBox,
+    QProgressBar, QTextEdit, QTableWidget, QTableWidgetItem, QTableView, QHeaderView,
     QGroupBox, QGridLayout, QSplitter, QMessageBox, QFileDialog,
     QFrame, QScrollArea, QSizePolicy
 )
-from PySide6.QtCore import Qt, QThread, pyqtSignal, QTimer
+from PySide6.QtCore import (
+    Qt, QThread, pyqtSignal, QTimer, QAbstractTableModel, QModelIndex,
+    QObject, QRunnable, QThreadPool
+)
 from PySide6.QtGui import QFont, QPalette, QColor, QIcon
 
-from utils.file_utils import load_schedule_data, export_schedule_to_json, export_schedule_to_csv
-from utils.constraint_utils import get_constraint_violations, calculate_schedule_score
-from utils.visualization import create_gantt_chart, create_resource_utilization_chart
+from utils.file_utils import (
+    load_schedule_data, export_schedule_to_json, export_schedule_to_csv, schedule_to_csv_bytes
+)
+from utils.constraint_utils import get_constraint_violations, get_schedule_violations, calculate_schedule_score
 from src.csp_solver import SchedulingCSP
 
 
@@ -36,6 +45,8 @@ class SolverThread(QThread):
     
     finished = pyqtSignal(dict, float, str)  # solution, time, heuristic
     error = pyqtSignal(str)  # error message
+    progress = pyqtSignal(int)  # percentage of tasks assigned
+    stopped = pyqtSignal()  # cancelled run has returned from solve()
     
     def __init__(self, scheduling_csp, heuristic, use_arc_consistency, timeout):
         super().__init__()
@@ -43,6 +54,7 @@ class SolverThread(QThread):
         self.heuristic = heuristic
         self.use_arc_consistency = use_arc_consistency
         self.timeout = timeout
+        self.cancel_event = threading.Event()  # Set by the GUI to stop the search
     
     def run(self):
         """Run the solver in background thread"""
@@ -51,16 +63,148 @@ class SolverThread(QThread):
             solution = self.scheduling_csp.solve(
                 heuristic=self.heuristic,
                 use_arc_consistency=self.use_arc_consistency,
-                timeout=self.timeout
+                timeout=self.timeout,
+                cancel_event=self.cancel_event,
+                progress_callback=self.progress.emit
             )
             solve_time = time.time() - start_time
             
-            self.finished.emit(solution, solve_time, self.heuristic)
+            if self.cancel_event.is_set():
+                self.stopped.emit()
+            else:
+                self.finished.emit(solution, solve_time, self.heuristic)
             
         except Exception as e:
             self.error.emit(str(e))
 
 
+class CSPBuildThread(QThread):
+    """Thread for building the CSP (variables, domains, constraint graph) ahead of the first solve"""
+    
+    def __init__(self, tasks, resources, time_slots, constraints):
+        super().__init__()
+        self.args = (tasks, resources, time_slots, constraints)
+        self.scheduling_csp = None
+    
+    def run(self):
+        """Build the CSP in background thread"""
+        try:
+            self.scheduling_csp = SchedulingCSP(*self.args)
+        except Exception:
+            # Leave it to the first solve to rebuild and report the error
+            self.scheduling_csp = None
+
+
+@dataclass(frozen=True, slots=True)
+class _SolvePerf:
+    """Outcome of one heuristic's solve, as shown in the performance table"""
+    
+    seconds: float
+    tasks_scheduled: int
+
+
+class _SaveSignals(QObject):
+    """Signals for _SaveFigure (QRunnable cannot emit signals itself)"""
+    
+    finished = pyqtSignal(object, str)  # Emits the figure and an error message ('' on success)
+
+
+class _SaveFigure(QRunnable):
+    """Write a finished matplotlib figure to disk on the thread pool
+    
+    The figure is built on the UI thread and not touched again until
+    finished is emitted, so only the PNG rendering/encoding runs here.
+    """
+    
+    def __init__(self, signals, fig, path):
+        super().__init__()
+        self.signals = signals
+        self.fig = fig
+        self.path = path
+    
+    def run(self):
+        try:
+            self.fig.savefig(self.path, dpi=300, bbox_inches='tight')
+            self.signals.finished.emit(self.fig, "")
+        except Exception as e:
+            self.signals.finished.emit(self.fig, str(e))
+
+
+class _CsvSignals(QObject):
+    """Signals for _CsvWorker (QRunnable cannot emit signals itself)"""
+    
+    finished = pyqtSignal(object, bytes)  # Emits the solution and its CSV bytes
+
+
+class _CsvWorker(QRunnable):
+    """Serialize a solution to CSV on the thread pool ahead of an export"""
+    
+    def __init__(self, signals, solution):
+        super().__init__()
+        self.signals = signals
+        self.solution = solution
+    
+    def run(self):
+        try:
+            payload = schedule_to_csv_bytes(self.solution)
+        except Exception:
+            # Exporting falls back to serializing synchronously
+            return
+        self.signals.finished.emit(self.solution, payload)
+
+
+def _solve_one(scheduling_csp, heuristic):
+    """Solve a prebuilt CSP with one heuristic (runs in a worker process)"""
+    start_time = time.time()
+    solution = scheduling_csp.solve(heuristic=heuristic)
+    return heuristic, solution, time.time() - start_time
+
+
+@contextmanager
+def _bulk_fill(table):
+    """Suspend sorting, painting and signals of a table while it is refilled"""
+    table.setSortingEnabled(False)
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    try:
+        yield table
+    finally:
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+
+class TableModel(QAbstractTableModel):
+    """Read-only table model serving precomputed rows of display strings"""
+    
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+        
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+        
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class SchedulerGUI(QMainWindow):
     """Main GUI application for CSP scheduling"""
     
@@ -73,12 +217,38 @@ class SchedulerGUI(QMainWindow):
         self.resources = []
         self.time_slots = {}
         self.constraints = {}
+        self._problem_info_cached = ""
         self.current_solution = None
-        self.scheduling_csp = None
+        self.scheduling_csp = None  # Built once per distinct problem data
+        self._data_hash = None
+        self._solve_cache = {}  # (data hash, heuristic, arc consistency) -> (solution, solve time)
+        self._pending_solve_key = None
+        self.csp_build_thread = None
         self.solver_thread = None
         
         # Performance tracking
-        self.performance_results = {}
+        self.performance_results = {}  # heuristic -> _SolvePerf
+        # Quality scores keyed by (data hash, frozen solution); the same solution is
+        # scored both when a heuristic finishes and in update_performance_display
+        self._cached_score = lru_cache(maxsize=16)(self._compute_score)
+        self.heuristic_pool = None
+        self.pending_heuristics = []  # (heuristic, AsyncResult) still running
+        
+        # Incremental violation checking (see revalidate_solution)
+        self._validated_solution = None
+        self._validated_inputs = None
+        self._violation_text = {}  # task_id -> formatted violations ('' if none)
+        
+        # Chart PNGs being written on the thread pool
+        self._save_signals = _SaveSignals()
+        self._save_signals.finished.connect(self.figure_saved)
+        self._pending_saves = 0
+        self._save_errors = []
+        
+        # CSV export contents, prepared in the background for each new solution
+        self._csv_signals = _CsvSignals()
+        self._csv_signals.finished.connect(self.csv_payload_ready)
+        self._csv_payload = (None, None)  # (solution it was serialized from, bytes)
         
         # Setup UI
         self.setup_ui()
@@ -137,7 +307,7 @@ class SchedulerGUI(QMainWindow):
                 background-color: #cccccc;
                 color: #666666;
             }
-            QTableWidget {
+            QTableWidget, QTableView {
                 gridline-color: #e0e0e0;
                 selection-background-color: #e3f2fd;
             }
@@ -195,9 +365,9 @@ class SchedulerGUI(QMainWindow):
         tasks_group = QGroupBox("Tasks")
         tasks_layout = QVBoxLayout(tasks_group)
         
-        self.tasks_table = QTableWidget()
-        self.tasks_table.setColumnCount(6)
-        self.tasks_table.setHorizontalHeaderLabels(['Task ID', 'Name', 'Duration', 'Priority', 'Skills', 'Dependencies'])
+        self.tasks_model = TableModel(['Task ID', 'Name', 'Duration', 'Priority', 'Skills', 'Dependencies'], self)
+        self.tasks_table = QTableView()
+        self.tasks_table.setModel(self.tasks_model)
         header = self.tasks_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         tasks_layout.addWidget(self.tasks_table)
@@ -208,9 +378,9 @@ class SchedulerGUI(QMainWindow):
         resources_group = QGroupBox("Resources")
         resources_layout = QVBoxLayout(resources_group)
         
-        self.resources_table = QTableWidget()
-        self.resources_table.setColumnCount(4)
-        self.resources_table.setHorizontalHeaderLabels(['Resource ID', 'Name', 'Skills', 'Max Hours/Day'])
+        self.resources_model = TableModel(['Resource ID', 'Name', 'Skills', 'Max Hours/Day'], self)
+        self.resources_table = QTableView()
+        self.resources_table.setModel(self.resources_model)
         header = self.resources_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         resources_layout.addWidget(self.resources_table)
@@ -233,13 +403,15 @@ class SchedulerGUI(QMainWindow):
         # Heuristic selection
         config_layout.addWidget(QLabel("Variable Ordering Heuristic:"), 0, 0)
         self.heuristic_combo = QComboBox()
-        self.heuristic_combo.addItems(["mrv", "degree", "combined"])
+        self.heuristic_combo.addItems(["mrv", "degree", "combined", "dom_wdeg"])
         config_layout.addWidget(self.heuristic_combo, 0, 1)
         
-        # Arc consistency option
-        self.arc_consistency_check = QCheckBox("Use Arc Consistency")
-        self.arc_consistency_check.setChecked(True)
-        config_layout.addWidget(self.arc_consistency_check, 1, 0, 1, 2)
+        # Arc consistency algorithm (AC-4 avoids AC-3's repeated arc revisions on dense graphs)
+        config_layout.addWidget(QLabel("Arc Consistency:"), 1, 0)
+        self.arc_consistency_combo = QComboBox()
+        self.arc_consistency_combo.addItems(list(SchedulingCSP.ARC_CONSISTENCY_MODES))
+        self.arc_consistency_combo.setCurrentText("ac3")
+        config_layout.addWidget(self.arc_consistency_combo, 1, 1)
         
         # Timeout setting
         config_layout.addWidget(QLabel("Timeout (seconds):"), 2, 0)
@@ -297,9 +469,9 @@ class SchedulerGUI(QMainWindow):
         export_csv_btn.clicked.connect(self.export_solution_csv)
         controls_layout.addWidget(export_csv_btn)
         
-        viz_btn = QPushButton("Generate Visualizations")
-        viz_btn.clicked.connect(self.generate_visualizations)
-        controls_layout.addWidget(viz_btn)
+        self.viz_btn = QPushButton("Generate Visualizations")
+        self.viz_btn.clicked.connect(self.generate_visualizations)
+        controls_layout.addWidget(self.viz_btn)
         
         controls_layout.addStretch()
         layout.addLayout(controls_layout)
@@ -308,9 +480,9 @@ class SchedulerGUI(QMainWindow):
         solution_group = QGroupBox("Schedule Solution")
         solution_layout = QVBoxLayout(solution_group)
         
-        self.solution_table = QTableWidget()
-        self.solution_table.setColumnCount(6)
-        self.solution_table.setHorizontalHeaderLabels(['Task', 'Resource', 'Day', 'Start Time', 'Duration (h)', 'End Time'])
+        self.solution_model = TableModel(['Task', 'Resource', 'Day', 'Start Time', 'Duration (h)', 'End Time'], self)
+        self.solution_table = QTableView()
+        self.solution_table.setModel(self.solution_model)
         header = self.solution_table.horizontalHeader()
         header.setSectionResizeMode(QHeaderView.Stretch)
         solution_layout.addWidget(self.solution_table)
@@ -351,9 +523,14 @@ class SchedulerGUI(QMainWindow):
         # Analysis controls
         controls_layout = QHBoxLayout()
         
-        run_all_btn = QPushButton("Run All Heuristics")
-        run_all_btn.clicked.connect(self.run_all_heuristics)
-        controls_layout.addWidget(run_all_btn)
+        self.run_all_btn = QPushButton("Run All Heuristics")
+        self.run_all_btn.clicked.connect(self.run_all_heuristics)
+        controls_layout.addWidget(self.run_all_btn)
+        
+        # Polls the heuristic worker processes without blocking the UI
+        self.heuristics_timer = QTimer(self)
+        self.heuristics_timer.setInterval(100)
+        self.heuristics_timer.timeout.connect(self.check_heuristic_results)
         
         chart_btn = QPushButton("Generate Performance Chart")
         chart_btn.clicked.connect(self.generate_performance_chart)
@@ -380,6 +557,17 @@ class SchedulerGUI(QMainWindow):
             self.resources = self.data['schedule']['resources']
             self.time_slots = self.data['schedule']['time_slots']
             self.constraints = self.data['schedule']['constraints']
+            self._problem_info_cached = self.build_problem_info()
+            
+            # Keep the existing CSP and solutions unless the problem data actually changed
+            data_hash = hashlib.blake2b(
+                json.dumps(self.data, sort_keys=True).encode(), digest_size=16
+            ).hexdigest()
+            if data_hash != self._data_hash:
+                self._data_hash = data_hash
+                self._solve_cache = {}
+                self.scheduling_csp = None
+                self.start_csp_build()
             
             self.update_problem_display()
             self.status_bar.showMessage("Data loaded successfully")
@@ -388,65 +576,102 @@ class SchedulerGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load data: {str(e)}")
             self.status_bar.showMessage("Failed to load data")
     
+    def build_problem_info(self):
+        """Build the problem overview text (once per data load)"""
+        days = self.time_slots['days']
+        hours = self.time_slots['hours']
+        hard_constraints = self.constraints['hard_constraints']
+        soft_constraints = self.constraints['soft_constraints']
+        
+        return "\n".join([
+            "Problem Overview:",
+            f"• Tasks: {len(self.tasks)}",
+            f"• Resources: {len(self.resources)}",
+            f"• Time slots: {len(days)} days, {len(hours)} hours per day",
+            f"• Hard constraints: {len(hard_constraints)}",
+            f"• Soft constraints: {len(soft_constraints)}",
+            "",
+            "Time Slots:",
+            f"• Days: {', '.join(days)}",
+            f"• Hours: {', '.join(map(str, hours))}",
+            f"• Working hours per day: {self.time_slots['working_hours_per_day']}",
+            "",
+            "Constraints:",
+            f"• Hard: {', '.join(hard_constraints)}",
+            f"• Soft: {', '.join(soft_constraints)}",
+            ""
+        ])
+    
     def update_problem_display(self):
         """Update the problem overview display"""
         # Update problem info
-        info_text = f"""Problem Overview:
-• Tasks: {len(self.tasks)}
-• Resources: {len(self.resources)}
-• Time slots: {len(self.time_slots['days'])} days, {len(self.time_slots['hours'])} hours per day
-• Hard constraints: {len(self.constraints['hard_constraints'])}
-• Soft constraints: {len(self.constraints['soft_constraints'])}
-
-Time Slots:
-• Days: {', '.join(self.time_slots['days'])}
-• Hours: {', '.join(map(str, self.time_slots['hours']))}
-• Working hours per day: {self.time_slots['working_hours_per_day']}
-
-Constraints:
-• Hard: {', '.join(self.constraints['hard_constraints'])}
-• Soft: {', '.join(self.constraints['soft_constraints'])}
-"""
-        self.problem_info.setPlainText(info_text)
+        self.problem_info.setPlainText(self._problem_info_cached)
         
         # Update tasks table
-        self.tasks_table.setRowCount(len(self.tasks))
-        for i, task in enumerate(self.tasks):
-            self.tasks_table.setItem(i, 0, QTableWidgetItem(task['id']))
-            self.tasks_table.setItem(i, 1, QTableWidgetItem(task['name']))
-            self.tasks_table.setItem(i, 2, QTableWidgetItem(str(task['duration'])))
-            self.tasks_table.setItem(i, 3, QTableWidgetItem(task.get('priority', 'medium')))
-            self.tasks_table.setItem(i, 4, QTableWidgetItem(', '.join(task.get('required_skills', []))))
-            self.tasks_table.setItem(i, 5, QTableWidgetItem(', '.join(task.get('dependencies', []))))
+        with _bulk_fill(self.tasks_table):
+            self.tasks_model.set_rows([
+                (task['id'], task['name'], str(task['duration']), task.get('priority', 'medium'),
+                 ', '.join(task.get('required_skills', [])), ', '.join(task.get('dependencies', [])))
+                for task in self.tasks
+            ])
         
         # Update resources table
-        self.resources_table.setRowCount(len(self.resources))
-        for i, resource in enumerate(self.resources):
-            self.resources_table.setItem(i, 0, QTableWidgetItem(resource['id']))
-            self.resources_table.setItem(i, 1, QTableWidgetItem(resource['name']))
-            self.resources_table.setItem(i, 2, QTableWidgetItem(', '.join(resource.get('skills', []))))
-            self.resources_table.setItem(i, 3, QTableWidgetItem(str(resource.get('max_hours_per_day', 8))))
+        with _bulk_fill(self.resources_table):
+            self.resources_model.set_rows([
+                (resource['id'], resource['name'], ', '.join(resource.get('skills', [])),
+                 str(resource.get('max_hours_per_day', 8)))
+                for resource in self.resources
+            ])
+    
+    def start_csp_build(self):
+        """Build the CSP in the background so the first solve doesn't pay for it"""
+        if self.csp_build_thread is not None:
+            self.csp_build_thread.wait()
+        
+        self.csp_build_thread = CSPBuildThread(self.tasks, self.resources, self.time_slots, self.constraints)
+        self.csp_build_thread.finished.connect(self.get_scheduling_csp)
+        self.csp_build_thread.start()
+    
+    def get_scheduling_csp(self):
+        """Return the shared CSP, building it on first use"""
+        if self.scheduling_csp is None:
+            if self.csp_build_thread is not None:
+                # Adopt the background build, waiting for it if still running
+                self.csp_build_thread.wait()
+                self.scheduling_csp = self.csp_build_thread.scheduling_csp
+                self.csp_build_thread = None
+            if self.scheduling_csp is None:
+                self.scheduling_csp = SchedulingCSP(self.tasks, self.resources, self.time_slots, self.constraints)
+        return self.scheduling_csp
     
     def solve_csp(self):
         """Solve the CSP in a separate thread"""
-        if self.scheduling_csp is None:
-            self.scheduling_csp = SchedulingCSP(self.tasks, self.resources, self.time_slots, self.constraints)
-        
         # Get solver parameters
         heuristic = self.heuristic_combo.currentText()
-        use_arc_consistency = self.arc_consistency_check.isChecked()
+        use_arc_consistency = self.arc_consistency_combo.currentText()
         timeout = self.timeout_spinbox.value()
         
+        # Identical problem and settings were already solved; show that solution again
+        self._pending_solve_key = (self._data_hash, heuristic, use_arc_consistency)
+        cached = self._solve_cache.get(self._pending_solve_key)
+        if cached is not None:
+            self.solving_complete(*cached, heuristic)
+            return
+        
         # Create and start solver thread
-        self.solver_thread = SolverThread(self.scheduling_csp, heuristic, use_arc_consistency, timeout)
+        self.solver_thread = SolverThread(self.get_scheduling_csp(), heuristic, use_arc_consistency, timeout)
         self.solver_thread.finished.connect(self.solving_complete)
         self.solver_thread.error.connect(self.solving_error)
+        self.solver_thread.progress.connect(self.progress_bar.setValue)
+        self.solver_thread.stopped.connect(self.solving_stopped)
         
-        # Update UI
+        # Update UI (Run All would pickle the CSP while this thread searches on it)
         self.solve_button.setEnabled(False)
+        self.run_all_btn.setEnabled(False)
         self.stop_button.setEnabled(True)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.progress_bar.setRange(0, 100)  # Driven by the solver's progress reports
+        self.progress_bar.setValue(0)
         self.status_bar.showMessage("Solving CSP...")
         
         self.solver_thread.start()
@@ -455,11 +680,15 @@ Constraints:
         """Called when solving is complete"""
         self.progress_bar.setVisible(False)
         self.solve_button.setEnabled(True)
+        self.run_all_btn.setEnabled(True)
         self.stop_button.setEnabled(False)
         
         if solution:
+            self._solve_cache[self._pending_solve_key] = (solution, solve_time)
             self.current_solution = solution
-            self.performance_results[heuristic] = [solve_time, len(solution)]
+            self.performance_results[heuristic] = _SolvePerf(solve_time, len(solution))
+            if self._csv_payload[0] is not solution:
+                QThreadPool.globalInstance().start(_CsvWorker(self._csv_signals, solution))
             
             self.status_bar.showMessage(f"Solution found in {solve_time:.2f}s")
             self.update_solution_display()
@@ -474,9 +703,12 @@ Constraints:
 
 Solution Summary:
 """
-            for task_id, assignment in solution.items():
-                results_text += f"• {task_id}: {assignment['task_name']} -> {assignment['resource_name']} "
-                results_text += f"({assignment['start_day']} {assignment['start_hour']}:00)\n"
+            # Build the summary lines in one join rather than growing the string per task
+            results_text += "".join(
+                f"• {task_id}: {assignment['task_name']} -> {assignment['resource_name']} "
+                f"({assignment['start_day']} {assignment['start_hour']}:00)\n"
+                for task_id, assignment in solution.items()
+            )
             
             self.results_text.setPlainText(results_text)
             
@@ -488,6 +720,7 @@ Solution Summary:
         """Called when solving encounters an error"""
         self.progress_bar.setVisible(False)
         self.solve_button.setEnabled(True)
+        self.run_all_btn.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.status_bar.showMessage("Error occurred")
         QMessageBox.critical(self, "Solver Error", f"Error during solving: {error_msg}")
@@ -495,11 +728,22 @@ Solution Summary:
     def stop_solving(self):
         """Stop the solving process"""
         if self.solver_thread and self.solver_thread.isRunning():
-            self.solver_thread.terminate()
-            self.solver_thread.wait()
+            # Cooperative stop: the solver polls the event between search steps,
+            # but not during arc consistency preprocessing. The search state lives
+            # on the shared CSP, so Solve stays disabled until the thread reports
+            # that it has returned (solving_stopped).
+            self.solver_thread.cancel_event.set()
+            self.stop_button.setEnabled(False)
+            self.status_bar.showMessage("Stopping solver...")
+            return
         
+        self.solving_stopped()
+    
+    def solving_stopped(self):
+        """Called once a cancelled solve has returned"""
         self.progress_bar.setVisible(False)
         self.solve_button.setEnabled(True)
+        self.run_all_btn.setEnabled(True)
         self.stop_button.setEnabled(False)
         self.status_bar.showMessage("Solver stopped")
     
@@ -509,48 +753,103 @@ Solution Summary:
             return
         
         # Update solution table
-        self.solution_table.setRowCount(len(self.current_solution))
-        for i, (task_id, assignment) in enumerate(self.current_solution.items()):
-            self.solution_table.setItem(i, 0, QTableWidgetItem(f"{task_id}: {assignment['task_name']}"))
-            self.solution_table.setItem(i, 1, QTableWidgetItem(assignment['resource_name']))
-            self.solution_table.setItem(i, 2, QTableWidgetItem(assignment['start_day']))
-            self.solution_table.setItem(i, 3, QTableWidgetItem(f"{assignment['start_hour']}:00"))
-            self.solution_table.setItem(i, 4, QTableWidgetItem(str(assignment['duration'])))
-            self.solution_table.setItem(i, 5, QTableWidgetItem(f"{assignment['end_hour']}:00"))
-        
-        # Check for violations
-        violations = {}
-        for task_id, assignment in self.current_solution.items():
-            task_violations = get_constraint_violations(assignment, task_id, self.resources, self.tasks, self.current_solution)
-            if task_violations:
-                violations[task_id] = task_violations
-        
-        # Display violations
-        if violations:
-            violations_text = "Constraint Violations Found:\n\n"
-            for task_id, task_violations in violations.items():
-                violations_text += f"{task_id}:\n"
-                for violation in task_violations:
-                    violations_text += f"  • {violation}\n"
-                violations_text += "\n"
+        with _bulk_fill(self.solution_table):
+            self.solution_model.set_rows([
+                (f"{task_id}: {assignment['task_name']}", assignment['resource_name'], assignment['start_day'],
+                 f"{assignment['start_hour']}:00", str(assignment['duration']), f"{assignment['end_hour']}:00")
+                for task_id, assignment in self.current_solution.items()
+            ])
+        
+        # Check for violations, reusing results for tasks the change didn't touch
+        self.revalidate_solution()
+        
+        # Display violations from the per-task text blocks
+        blocks = [self._violation_text[task_id] for task_id in self.current_solution
+                  if self._violation_text.get(task_id)]
+        if blocks:
+            violations_text = "Constraint Violations Found:\n\n" + "".join(blocks)
         else:
             violations_text = "No constraint violations found! ✅"
         
         self.violations_text.setPlainText(violations_text)
     
+    def revalidate_solution(self):
+        """Recheck only the tasks whose constraint inputs changed since the last check
+        
+        A task's violations depend on its own assignment, the assignments sharing
+        its resource and day, and its dependencies. Tasks untouched by the
+        difference from the previous solution keep their cached result.
+        """
+        solution = self.current_solution
+        previous = self._validated_solution
+        
+        if previous is None or self._validated_inputs != (id(self.tasks), id(self.resources)):
+            # First check or new problem data: validate everything in one pass
+            violations = get_schedule_violations(solution, self.resources, self.tasks)
+            affected = set(solution)
+        else:
+            changed = {task_id for task_id in solution.keys() | previous.keys()
+                       if solution.get(task_id) != previous.get(task_id)}
+            
+            # Resource/day slots the changed tasks left or entered
+            touched_slots = {(assignment['resource_id'], assignment['start_day'])
+                             for task_id in changed
+                             for assignment in (solution.get(task_id), previous.get(task_id))
+                             if assignment is not None}
+            
+            affected = {task_id for task_id, assignment in solution.items()
+                        if task_id in changed
+                        or (assignment['resource_id'], assignment['start_day']) in touched_slots}
+            affected |= {task['id'] for task in self.tasks
+                         if task['id'] in solution and changed.intersection(task.get('dependencies', []))}
+            
+            violations = {
+                task_id: get_constraint_violations(solution[task_id], task_id, self.resources, self.tasks, solution)
+                for task_id in affected
+            }
+        
+        for task_id in previous.keys() - solution.keys() if previous else ():
+            self._violation_text.pop(task_id, None)
+        for task_id in affected:
+            task_violations = violations.get(task_id)
+            self._violation_text[task_id] = (
+                f"{task_id}:\n" + "".join(f"  • {violation}\n" for violation in task_violations) + "\n"
+                if task_violations else ""
+            )
+        
+        # Snapshot the assignments so later in-place edits still show up as changes
+        self._validated_solution = {task_id: dict(assignment) for task_id, assignment in solution.items()}
+        self._validated_inputs = (id(self.tasks), id(self.resources))
+    
+    def schedule_score(self, solution):
+        """calculate_schedule_score for the loaded data, memoized on the solution's contents"""
+        solution_key = tuple((task_id, tuple(assignment.items())) for task_id, assignment in solution.items())
+        return self._cached_score(self._data_hash, solution_key)
+    
+    def _compute_score(self, data_hash, solution_key):
+        """Uncached scorer behind schedule_score (data_hash only keys the cache)"""
+        solution = {task_id: dict(assignment) for task_id, assignment in solution_key}
+        return calculate_schedule_score(solution, self.tasks, self.resources)
+    
     def update_performance_display(self):
         """Update the performance display"""
+        # Score the current solution once; every row shows the same score
+        quality_score = self.schedule_score(self.current_solution) if self.current_solution else 0.0
+        
         # Update performance table
-        self.perf_table.setRowCount(len(self.performance_results))
-        for i, (heuristic, (time_taken, tasks_scheduled)) in enumerate(self.performance_results.items()):
-            quality_score = 0.0
-            if self.current_solution:
-                quality_score = calculate_schedule_score(self.current_solution, self.tasks, self.resources)
+        with _bulk_fill(self.perf_table):
+            # Items are created only for newly added rows and reused afterwards
+            old_rows = self.perf_table.rowCount()
+            self.perf_table.setRowCount(len(self.performance_results))
+            for row in range(old_rows, self.perf_table.rowCount()):
+                for col in range(self.perf_table.columnCount()):
+                    self.perf_table.setItem(row, col, QTableWidgetItem())
             
-            self.perf_table.setItem(i, 0, QTableWidgetItem(heuristic.upper()))
-            self.perf_table.setItem(i, 1, QTableWidgetItem(f"{time_taken:.2f}"))
-            self.perf_table.setItem(i, 2, QTableWidgetItem(str(tasks_scheduled)))
-            self.perf_table.setItem(i, 3, QTableWidgetItem(f"{quality_score:.3f}"))
+            for i, (heuristic, perf) in enumerate(self.performance_results.items()):
+                self.perf_table.item(i, 0).setText(heuristic.upper())
+                self.perf_table.item(i, 1).setText(f"{perf.seconds:.2f}")
+                self.perf_table.item(i, 2).setText(str(perf.tasks_scheduled))
+                self.perf_table.item(i, 3).setText(f"{quality_score:.3f}")
     
     def export_solution_json(self):
         """Export solution to JSON file"""
@@ -581,11 +880,19 @@ Solution Summary:
         
         if filename:
             try:
-                export_schedule_to_csv(self.current_solution, filename)
+                serialized_solution, payload = self._csv_payload
+                if serialized_solution is not self.current_solution:
+                    payload = None  # Not ready yet; serialize now
+                export_schedule_to_csv(self.current_solution, filename, payload)
                 QMessageBox.information(self, "Success", f"Solution exported to {filename}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
     
+    def csv_payload_ready(self, solution, payload):
+        """Keep the background-serialized CSV if it is for the displayed solution"""
+        if solution is self.current_solution:
+            self._csv_payload = (solution, payload)
+    
     def generate_visualizations(self):
         """Generate visualization charts"""
         if not self.current_solution:
@@ -596,52 +903,105 @@ Solution Summary:
             # Create output directory
             os.makedirs("output", exist_ok=True)
             
-            # Generate charts
-            import matplotlib.pyplot as plt
-            
-            # Gantt chart
-            fig1 = create_gantt_chart(self.current_solution, self.tasks, self.resources)
-            fig1.savefig("output/gantt_chart.png", dpi=300, bbox_inches='tight')
-            plt.close(fig1)
+            # Generate charts (matplotlib is only loaded on first use)
+            from utils.visualization import create_gantt_chart, create_resource_utilization_chart
             
-            # Resource utilization
-            fig2 = create_resource_utilization_chart(self.current_solution, self.resources)
-            fig2.savefig("output/resource_utilization.png", dpi=300, bbox_inches='tight')
-            plt.close(fig2)
-            
-            QMessageBox.information(self, "Success", "Visualizations generated in output/ directory")
+            # Figures are built here; the slow dpi=300 saves run on the thread pool
+            figures = [
+                (create_gantt_chart(self.current_solution, self.tasks, self.resources),
+                 "output/gantt_chart.png"),
+                (create_resource_utilization_chart(self.current_solution, self.resources),
+                 "output/resource_utilization.png"),
+            ]
             
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to generate visualizations: {str(e)}")
+            return
+        
+        self.viz_btn.setEnabled(False)
+        self.status_bar.showMessage("Saving visualizations...")
+        self._pending_saves = len(figures)
+        self._save_errors = []
+        for fig, path in figures:
+            QThreadPool.globalInstance().start(_SaveFigure(self._save_signals, fig, path))
+    
+    def figure_saved(self, fig, error_msg):
+        """Close a saved figure and report once every chart has been written"""
+        import matplotlib.pyplot as plt
+        plt.close(fig)
+        
+        if error_msg:
+            self._save_errors.append(error_msg)
+        self._pending_saves -= 1
+        if self._pending_saves > 0:
+            return
+        
+        self.viz_btn.setEnabled(True)
+        if self._save_errors:
+            self.status_bar.showMessage("Saving visualizations failed")
+            QMessageBox.critical(self, "Error", f"Failed to generate visualizations: {self._save_errors[0]}")
+        else:
+            self.status_bar.showMessage("Visualizations saved")
+            QMessageBox.information(self, "Success", "Visualizations generated in output/ directory")
     
     def run_all_heuristics(self):
-        """Run all heuristics and compare performance"""
+        """Run all heuristics in parallel worker processes and compare performance"""
         heuristics = ["mrv", "degree", "combined"]
         
         self.analysis_text.setPlainText("Running all heuristics...\n\n")
+        self.run_all_btn.setEnabled(False)
+        # The pool pickles the shared CSP in the background; a solve must not
+        # change its search state until every heuristic has finished
+        self.solve_button.setEnabled(False)
         
+        # The solver is CPU-bound Python, so each heuristic gets its own process.
+        # 'spawn' avoids forking a process that is running Qt threads.
+        self.heuristic_pool = multiprocessing.get_context('spawn').Pool(len(heuristics))
+        # Every worker gets a copy of the shared CSP instead of rebuilding its domains
+        scheduling_csp = self.get_scheduling_csp()
+        self.pending_heuristics = []
         for heuristic in heuristics:
             self.analysis_text.append(f"Testing {heuristic.upper()} heuristic...")
-            QApplication.processEvents()  # Update UI
+            self.pending_heuristics.append((heuristic, self.heuristic_pool.apply_async(
+                _solve_one, (scheduling_csp, heuristic)
+            )))
+        
+        self.heuristics_timer.start()
+    
+    def check_heuristic_results(self):
+        """Report heuristic runs as they finish"""
+        still_running = []
+        for heuristic, result in self.pending_heuristics:
+            if not result.ready():
+                still_running.append((heuristic, result))
+                continue
             
             try:
-                if self.scheduling_csp is None:
-                    self.scheduling_csp = SchedulingCSP(self.tasks, self.resources, self.time_slots, self.constraints)
-                
-                start_time = time.time()
-                solution = self.scheduling_csp.solve(heuristic=heuristic)
-                solve_time = time.time() - start_time
+                _, solution, solve_time = result.get()
                 
                 if solution:
-                    quality_score = calculate_schedule_score(solution, self.tasks, self.resources)
-                    self.performance_results[heuristic] = [solve_time, len(solution)]
+                    # _solve_one uses the solver's default arc consistency (AC-3)
+                    self._solve_cache[(self._data_hash, heuristic, 'ac3')] = (solution, solve_time)
+                    quality_score = self.schedule_score(solution)
+                    self.performance_results[heuristic] = _SolvePerf(solve_time, len(solution))
                     
-                    self.analysis_text.append(f"  ✓ Solution found in {solve_time:.2f}s, Quality: {quality_score:.3f}")
+                    self.analysis_text.append(f"  ✓ {heuristic.upper()}: Solution found in {solve_time:.2f}s, Quality: {quality_score:.3f}")
                 else:
-                    self.analysis_text.append(f"  ✗ No solution found")
+                    self.analysis_text.append(f"  ✗ {heuristic.upper()}: No solution found")
                     
             except Exception as e:
-                self.analysis_text.append(f"  ✗ Error: {str(e)}")
+                self.analysis_text.append(f"  ✗ {heuristic.upper()}: Error: {str(e)}")
+        
+        self.pending_heuristics = still_running
+        if still_running:
+            return
+        
+        self.heuristics_timer.stop()
+        self.heuristic_pool.close()
+        self.heuristic_pool.join()
+        self.heuristic_pool = None
+        self.run_all_btn.setEnabled(True)
+        self.solve_button.setEnabled(True)
         
         self.update_performance_display()
         self.analysis_text.append("\nAll heuristics completed!")
@@ -658,7 +1018,10 @@ Solution Summary:
             from utils.visualization import create_performance_comparison_chart
             import matplotlib.pyplot as plt
             
-            fig = create_performance_comparison_chart(self.performance_results)
+            fig = create_performance_comparison_chart({
+                heuristic: {'solve_time': perf.seconds, 'tasks_scheduled': perf.tasks_scheduled}
+                for heuristic, perf in self.performance_results.items()
+            })
             fig.savefig("output/performance_comparison.png", dpi=300, bbox_inches='tight')
             plt.close(fig)
             
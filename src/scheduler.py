@@ -4,7 +4,10 @@ High-level scheduling problem management and solving
 """
 
 import time
-from typing import Dict, List, Any, Optional, Tuple
+import multiprocessing
+from collections import Counter
+from functools import partial
+from typing import Dict, List, Any, Optional, Tuple, Union
 from .csp_solver import SchedulingCSP
 from utils.constraint_utils import (
     get_constraint_violations, calculate_schedule_score, 
@@ -12,6 +15,113 @@ from utils.constraint_utils import (
 )
 from utils.file_utils import export_schedule_to_json, export_schedule_to_csv
 
+def _luby(i: int) -> int:
+    """i-th term (from 1) of the Luby sequence 1, 1, 2, 1, 1, 2, 4, 1, 1, 2, ..."""
+    while True:
+        k = i.bit_length()
+        if i == (1 << k) - 1:
+            return 1 << (k - 1)
+        i -= (1 << (k - 1)) - 1
+
+def solve_with_restarts(scheduling_csp: SchedulingCSP, heuristic: str, total_timeout: int = 60,
+                        luby_unit: int = 500, use_arc_consistency: Union[bool, str] = False
+                        ) -> Optional[Dict[str, Any]]:
+    """
+    Solve with restarts on a Luby schedule of node limits
+    
+    A search that commits to a bad early choice can spend its whole time
+    budget under it. Here each attempt gives up after luby(n) * luby_unit
+    nodes and the next one starts over with a differently seeded random
+    tiebreak in variable selection. The dom/wdeg weights learned so far are
+    kept, so later attempts start from the variables that kept failing. The
+    first attempt uses the heuristic's normal tiebreak, so instances that
+    solve quickly behave as with a single solve().
+    
+    Args:
+        scheduling_csp: Built CSP
+        heuristic: Variable ordering heuristic
+        total_timeout: Maximum time over all attempts (seconds)
+        luby_unit: Node limit of a Luby term of 1
+        use_arc_consistency: Arc consistency mode passed to solve()
+        
+    Returns:
+        Solution dictionary, or None if there is none or time ran out
+    """
+    deadline = time.perf_counter() + total_timeout
+    attempt = 0
+    
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        
+        solution = scheduling_csp.solve(heuristic=heuristic, use_arc_consistency=use_arc_consistency,
+                                        timeout=remaining, node_limit=_luby(attempt + 1) * luby_unit,
+                                        tiebreak_seed=attempt if attempt else None,
+                                        keep_weights=attempt > 0)
+        if solution or not scheduling_csp.stopped_early:
+            return solution  # Solved, or the search proved there is no solution
+        attempt += 1
+
+def _solve_timed(scheduling_csp: SchedulingCSP, use_arc_consistency: Union[bool, str], timeout: int,
+                 restarts: bool, heuristic: str) -> Tuple[str, Optional[Dict], float]:
+    """Solve with one heuristic and time it (runs in a portfolio worker process)"""
+    start_time = time.time()
+    if restarts:
+        solution = solve_with_restarts(scheduling_csp, heuristic, total_timeout=timeout,
+                                       use_arc_consistency=use_arc_consistency)
+    else:
+        solution = scheduling_csp.solve(heuristic=heuristic, use_arc_consistency=use_arc_consistency,
+                                        timeout=timeout)
+    return heuristic, solution, time.time() - start_time
+
+def solve_portfolio(scheduling_csp: SchedulingCSP, heuristics: List[str], 
+                    use_arc_consistency: Union[bool, str] = False, timeout: int = 60,
+                    stop_on_first: bool = False, restarts: bool = False
+                    ) -> Dict[str, Tuple[Optional[Dict], float]]:
+    """
+    Solve with several heuristics at once, one worker process per heuristic
+    
+    Wall-clock time is that of the slowest heuristic (or the fastest successful
+    one with stop_on_first) instead of the sum of all of them. The search is
+    CPU-bound Python, so processes rather than threads are used. Workers are
+    forked so the calling script is not re-imported. Where forking is
+    unavailable, or inside a daemonic worker (which may not have children),
+    the heuristics run one after another in this process.
+    
+    Args:
+        scheduling_csp: Built CSP; each worker gets a pickled copy
+        heuristics: Heuristics to run
+        use_arc_consistency: Arc consistency mode passed to solve()
+        timeout: Maximum solving time per heuristic (seconds)
+        stop_on_first: Return as soon as one heuristic finds a solution and
+            terminate the workers still searching
+        restarts: Run each heuristic through solve_with_restarts
+        
+    Returns:
+        Dictionary mapping each finished heuristic to (solution or None, solve time)
+    """
+    solve = partial(_solve_timed, scheduling_csp, use_arc_consistency, timeout, restarts)
+    results = {}
+    
+    if (len(heuristics) < 2 or multiprocessing.current_process().daemon
+            or 'fork' not in multiprocessing.get_all_start_methods()):
+        for heuristic in heuristics:
+            _, solution, solve_time = solve(heuristic)
+            results[heuristic] = (solution, solve_time)
+            if stop_on_first and solution:
+                break
+        return results
+    
+    # Leaving the with block terminates any worker that is still searching
+    with multiprocessing.get_context('fork').Pool(len(heuristics)) as pool:
+        for heuristic, solution, solve_time in pool.imap_unordered(solve, heuristics):
+            results[heuristic] = (solution, solve_time)
+            if stop_on_first and solution:
+                break
+    
+    return results
+
 class Scheduler:
     """
     High-level scheduler for managing CSP scheduling problems
@@ -41,14 +151,14 @@ class Scheduler:
         self.current_solution = None
         self.performance_metrics = {}
     
-    def solve(self, heuristic: str = 'mrv', use_arc_consistency: bool = True, 
+    def solve(self, heuristic: str = 'mrv', use_arc_consistency: Union[bool, str] = True, 
               timeout: int = 60) -> Optional[Dict[str, Any]]:
         """
         Solve the scheduling problem
         
         Args:
             heuristic: Variable ordering heuristic
-            use_arc_consistency: Whether to use arc consistency
+            use_arc_consistency: Arc consistency mode ('none', 'ac3', 'ac4', 'mac', 'fc') or a bool
             timeout: Maximum solving time in seconds
             
         Returns:
@@ -287,11 +397,9 @@ class Scheduler:
         
         # Resource utilization
         report.append("RESOURCE UTILIZATION:")
-        resource_hours = {}
+        resource_hours = Counter()
         for assignment in solution.values():
-            resource_id = assignment['resource_id']
-            duration = assignment['duration']
-            resource_hours[resource_id] = resource_hours.get(resource_id, 0) + duration
+            resource_hours[assignment['resource_id']] += assignment['duration']
         
         for resource in self.resources:
             hours = resource_hours.get(resource['id'], 0)
@@ -326,11 +434,9 @@ class Scheduler:
         optimized = solution.copy()
         
         # Calculate current resource utilization
-        resource_hours = {}
+        resource_hours = Counter()
         for assignment in optimized.values():
-            resource_id = assignment['resource_id']
-            duration = assignment['duration']
-            resource_hours[resource_id] = resource_hours.get(resource_id, 0) + duration
+            resource_hours[assignment['resource_id']] += assignment['duration']
         
         # Find underutilized and overutilized resources
         avg_hours = sum(resource_hours.values()) / len(self.resources)
@@ -5,6 +5,7 @@ Test script to check if the solution imports work correctly
 
 import sys
 import os
+import random
 
 # Add the project root to the path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -49,4 +50,120 @@ try:
 except Exception as e:
     print(f"\n❌ Error: {str(e)}")
     import traceback
-    traceback.print_exc() 
\ No newline at end of file
+    traceback.print_exc() 
+
+def random_instance(seed, n_tasks=8, n_resources=3):
+    """Small random scheduling instance (two days, no dependencies)"""
+    rng = random.Random(seed)
+    skills = ['backend', 'frontend', 'database']
+    days = ['monday', 'tuesday']
+    hours = list(range(9, 17))
+    
+    resources = []
+    for idx in range(n_resources):
+        resources.append({
+            'id': f'R{idx + 1}',
+            'name': f'Resource {idx + 1}',
+            'skills': rng.sample(skills, rng.randint(1, len(skills))),
+            'availability': {day: sorted(rng.sample(hours, rng.randint(4, len(hours)))) for day in days},
+            'max_hours_per_day': rng.randint(2, 4),
+        })
+    
+    tasks = []
+    for idx in range(n_tasks):
+        tasks.append({
+            'id': f'T{idx + 1}',
+            'name': f'Task {idx + 1}',
+            'duration': rng.randint(1, 3),
+            'priority': rng.choice(['high', 'medium', 'low']),
+            'required_skills': [rng.choice(skills)],
+            'dependencies': [],
+        })
+    
+    time_slots = {'days': days, 'hours': hours, 'working_hours_per_day': len(hours)}
+    constraints = {'hard_constraints': ['no_resource_overlap', 'resource_skills', 'resource_availability'],
+                   'soft_constraints': []}
+    return tasks, resources, time_slots, constraints
+
+
+def assert_valid(solution, csp):
+    """Every task scheduled, each within its domain, with no resource overlaps"""
+    from utils.constraint_utils import find_time_conflicts
+    
+    assert set(solution) == set(csp.variables)
+    for task_id, assignment in solution.items():
+        assert assignment in csp.domains[task_id]
+    assert not find_time_conflicts(solution)
+
+
+def test_est_finds_solution_whenever_domain_order_does():
+    from src.csp_solver import SchedulingCSP
+    
+    for seed in list(range(40)) + [70, 208, 273]:
+        csp = SchedulingCSP(*random_instance(seed))
+        expected = csp.solve(value_order='domain', use_arc_consistency=False)
+        solution = csp.solve(value_order='est', use_arc_consistency=False)
+        
+        assert not csp.stopped_early
+        assert (solution is None) == (expected is None), f"seed {seed}"
+        if solution is not None:
+            assert_valid(solution, csp)
+
+
+def test_est_tries_earliest_start_first():
+    from src.csp_solver import SchedulingCSP
+    
+    # A single task, so the first value tried is the one returned
+    data = load_schedule_data("data/sample_schedule.json")['schedule']
+    task_id = data['tasks'][0]['id']
+    csp = SchedulingCSP(data['tasks'][:1], data['resources'], data['time_slots'], data['constraints'])
+    solution = csp.solve(value_order='est', use_arc_consistency=False)
+    assert_valid(solution, csp)
+    
+    days = data['time_slots']['days']
+    earliest = min((days.index(value['start_day']), value['start_hour'])
+                   for value in csp.domains[task_id])
+    assert (days.index(solution[task_id]['start_day']), solution[task_id]['start_hour']) == earliest
+
+
+def test_arc_consistency_modes_agree():
+    from src.csp_solver import SchedulingCSP
+    
+    for seed in range(30):
+        csp = SchedulingCSP(*random_instance(seed))
+        expected = csp.solve(use_arc_consistency='none')
+        for mode in ('ac3', 'ac4', 'mac', 'fc'):
+            solution = csp.solve(use_arc_consistency=mode)
+            assert not csp.stopped_early
+            assert (solution is None) == (expected is None), f"seed {seed}, mode {mode}"
+            if solution is not None:
+                assert_valid(solution, csp)
+
+
+def test_score_tracker_matches_full_rescore():
+    from src.csp_solver import SchedulingCSP
+    from utils.constraint_utils import ScheduleScoreTracker, calculate_schedule_score
+    
+    tasks, resources, time_slots, constraints = random_instance(3)
+    csp = SchedulingCSP(tasks, resources, time_slots, constraints)
+    solution = csp.solve()
+    assert solution is not None
+    
+    rng = random.Random(0)
+    tracker = ScheduleScoreTracker(solution, tasks, resources)
+    current = dict(solution)
+    assert abs(tracker.score_cache - calculate_schedule_score(current, tasks, resources)) < 1e-9
+    
+    for _ in range(50):
+        task_id = rng.choice(list(current))
+        new_assignment = rng.choice(csp.domains[task_id])
+        moved = dict(current, **{task_id: new_assignment})
+        expected = calculate_schedule_score(moved, tasks, resources)
+        
+        delta = tracker.delta_score(task_id, new_assignment)
+        assert abs(tracker.score_cache + delta - expected) < 1e-9
+        
+        if rng.random() < 0.5:
+            assert abs(tracker.apply_move(task_id, new_assignment) - expected) < 1e-9
+            current = moved
+        assert abs(tracker.score_cache - calculate_schedule_score(current, tasks, resources)) < 1e-9
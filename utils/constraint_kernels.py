@@ -0,0 +1,54 @@
+"""
+Constraint Checking Kernels for CSP Scheduling Project
+Array versions of the pairwise constraint checks used when analyzing a solution
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional; the numpy implementation below is used instead
+    njit = None
+
+
+def _overlap_violations_loop(resource_ids, day_ids, starts, ends):
+    counts = np.zeros(resource_ids.shape[0], dtype=np.int64)
+    for i in range(resource_ids.shape[0]):
+        for j in range(i):
+            if (resource_ids[i] == resource_ids[j] and day_ids[i] == day_ids[j]
+                    and starts[i] < ends[j] and ends[i] > starts[j]):
+                counts[i] += 1
+    return counts
+
+
+def _overlap_violations_numpy(resource_ids, day_ids, starts, ends):
+    overlaps = ((resource_ids[:, None] == resource_ids[None, :])
+                & (day_ids[:, None] == day_ids[None, :])
+                & (starts[:, None] < ends[None, :])
+                & (ends[:, None] > starts[None, :])
+                & np.tri(resource_ids.shape[0], k=-1, dtype=bool))
+    return overlaps.sum(axis=1)
+
+
+if njit is not None:
+    _overlap_violations = njit(cache=True)(_overlap_violations_loop)
+else:
+    _overlap_violations = _overlap_violations_numpy
+
+
+def overlap_violations(resource_ids: np.ndarray, day_ids: np.ndarray,
+                       starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """
+    Count time conflicts between assignments
+
+    Args:
+        resource_ids: Integer code of each assignment's resource
+        day_ids: Integer code of each assignment's day
+        starts: Start hour of each assignment
+        ends: End hour of each assignment
+
+    Returns:
+        For every assignment, the number of earlier assignments (in array
+        order) on the same resource and day that overlap it in time
+    """
+    return np.asarray(_overlap_violations(resource_ids, day_ids, starts, ends))
@@ -4,7 +4,7 @@ Functions for checking various types of constraints in scheduling problems
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 def get_constraint_violations(assignment: Dict[str, Any], task_id: str, 
                             resources: List[Dict], tasks: List[Dict], 
@@ -125,6 +125,105 @@ def check_dependency_constraints(assignment: Dict[str, Any], task: Dict[str, Any
     
     return violations
 
+def find_time_conflicts(solution: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Find all pairwise time conflicts in a solution with one sweep
+    
+    Assignments are grouped by resource and day and swept in start-hour
+    order, so conflicts are found in O(N log N) instead of rescanning the
+    whole solution for every task.
+    
+    Args:
+        solution: Complete solution
+        
+    Returns:
+        Dictionary mapping task IDs to conflict messages, listed in solution
+        order as check_time_conflicts would report them
+    """
+    position = {task_id: i for i, task_id in enumerate(solution)}
+    conflicting = defaultdict(set)
+    
+    groups = defaultdict(list)
+    for task_id, assignment in solution.items():
+        groups[(assignment['resource_id'], assignment['start_day'])].append(
+            (assignment['start_hour'], assignment['end_hour'], task_id)
+        )
+    
+    for intervals in groups.values():
+        intervals.sort()
+        active = []  # Intervals started so far that may still overlap
+        for start_hour, end_hour, task_id in intervals:
+            active = [other for other in active if other[1] > start_hour]
+            for other_start, other_end, other_id in active:
+                if not (end_hour <= other_start or start_hour >= other_end):
+                    conflicting[task_id].add(other_id)
+                    conflicting[other_id].add(task_id)
+            active.append((start_hour, end_hour, task_id))
+    
+    return {
+        task_id: [f"Time conflict with task {other_id}"
+                  for other_id in sorted(others, key=position.__getitem__)]
+        for task_id, others in conflicting.items()
+    }
+
+def get_schedule_violations(solution: Dict[str, Any], resources: List[Dict], 
+                            tasks: List[Dict]) -> Dict[str, List[str]]:
+    """
+    Check every assignment of a solution for constraint violations
+    
+    Gives the same messages as calling get_constraint_violations for each
+    task, with time conflicts found by a single find_time_conflicts sweep.
+    
+    Args:
+        solution: Complete solution dictionary
+        resources: List of resource dictionaries
+        tasks: List of task dictionaries
+        
+    Returns:
+        Dictionary mapping task IDs (in solution order) to violation messages;
+        tasks without violations are omitted
+    """
+    tasks_by_id = {}
+    for task in tasks:
+        tasks_by_id.setdefault(task['id'], task)
+    resources_by_id = {}
+    for resource in resources:
+        resources_by_id.setdefault(resource['id'], resource)
+    
+    time_conflicts = find_time_conflicts(solution)
+    
+    violations = {}
+    for task_id, assignment in solution.items():
+        task = tasks_by_id.get(task_id)
+        resource = resources_by_id.get(assignment['resource_id'])
+        
+        if not task or not resource:
+            violations[task_id] = ["Invalid task or resource reference"]
+            continue
+        
+        task_violations = []
+        
+        # Check resource skills
+        required_skills = task.get('required_skills', [])
+        resource_skills = resource.get('skills', [])
+        if required_skills:
+            missing_skills = [skill for skill in required_skills if skill not in resource_skills]
+            if missing_skills:
+                task_violations.append(f"Resource {resource['name']} missing skills: {missing_skills}")
+        
+        # Check resource capacity
+        max_hours = resource.get('max_hours_per_day', 8)
+        if assignment['duration'] > max_hours:
+            task_violations.append(f"Task duration ({assignment['duration']}h) exceeds resource capacity ({max_hours}h)")
+        
+        task_violations.extend(time_conflicts.get(task_id, []))
+        task_violations.extend(check_dependency_constraints(assignment, task, solution))
+        
+        if task_violations:
+            violations[task_id] = task_violations
+    
+    return violations
+
 def calculate_schedule_score(solution: Dict[str, Any], tasks: List[Dict], 
                            resources: List[Dict]) -> float:
     """
@@ -149,11 +248,9 @@ def calculate_schedule_score(solution: Dict[str, Any], tasks: List[Dict],
     completion_rate = scheduled_tasks / total_tasks if total_tasks > 0 else 0
     
     # Resource utilization
-    resource_hours = {}
+    resource_hours = Counter()
     for assignment in solution.values():
-        resource_id = assignment['resource_id']
-        duration = assignment['duration']
-        resource_hours[resource_id] = resource_hours.get(resource_id, 0) + duration
+        resource_hours[assignment['resource_id']] += assignment['duration']
     
     # Calculate average utilization
     total_hours = sum(resource_hours.values())
@@ -173,6 +270,161 @@ def calculate_schedule_score(solution: Dict[str, Any], tasks: List[Dict],
     
     return min(1.0, max(0.0, score))
 
+class ScheduleScoreTracker:
+    """
+    calculate_schedule_score kept up to date while single tasks are moved
+    
+    Each task's violation count is cached along with an index of assignments
+    by resource and day, so scoring a move only revisits the tasks sharing the
+    old or new slot and the tasks that depend on the moved one.
+    """
+    
+    def __init__(self, solution: Dict[str, Any], tasks: List[Dict], 
+                 resources: List[Dict]):
+        """
+        Score a solution and start tracking it
+        
+        Args:
+            solution: Complete solution dictionary (copied, not modified)
+            tasks: List of task dictionaries
+            resources: List of resource dictionaries
+        """
+        self.tasks = tasks
+        self.resources = resources
+        self.solution = dict(solution)
+        
+        self._tasks_by_id = {}
+        for task in tasks:
+            self._tasks_by_id.setdefault(task['id'], task)
+        self._resources_by_id = {}
+        for resource in resources:
+            self._resources_by_id.setdefault(resource['id'], resource)
+        
+        # Tasks whose dependency checks read a given task's assignment
+        self._dependents = defaultdict(set)
+        for task_id, task in self._tasks_by_id.items():
+            for dep_id in task.get('dependencies', []):
+                self._dependents[dep_id].add(task_id)
+        
+        self._slots = defaultdict(set)
+        for task_id, assignment in self.solution.items():
+            self._slots[(assignment['resource_id'], assignment['start_day'])].add(task_id)
+        
+        self.total_hours = sum(assignment['duration'] for assignment in self.solution.values())
+        self.per_task_contrib = {task_id: self._count_violations(task_id) for task_id in self.solution}
+        self.violation_count = sum(self.per_task_contrib.values())
+        self.score_cache = self._score(self.total_hours, self.violation_count)
+    
+    def delta_score(self, task_id: str, new_assignment: Dict[str, Any]) -> float:
+        """
+        Score change if a scheduled task were given a new assignment
+        
+        Args:
+            task_id: ID of a task in the tracked solution
+            new_assignment: Assignment to evaluate for the task
+            
+        Returns:
+            New score minus the current score (the solution is left unchanged)
+        """
+        return self._move(task_id, new_assignment, commit=False) - self.score_cache
+    
+    def apply_move(self, task_id: str, new_assignment: Dict[str, Any]) -> float:
+        """
+        Give a scheduled task a new assignment and update the score
+        
+        Args:
+            task_id: ID of a task in the tracked solution
+            new_assignment: New assignment for the task
+            
+        Returns:
+            The new score
+        """
+        return self._move(task_id, new_assignment, commit=True)
+    
+    def _move(self, task_id: str, new_assignment: Dict[str, Any], commit: bool) -> float:
+        old_assignment = self.solution[task_id]
+        
+        affected = {task_id}
+        affected |= self._slots[(old_assignment['resource_id'], old_assignment['start_day'])]
+        affected |= self._slots[(new_assignment['resource_id'], new_assignment['start_day'])]
+        affected |= {other for other in self._dependents[task_id] if other in self.solution}
+        
+        self._place(task_id, new_assignment)
+        counts = {other: self._count_violations(other) for other in affected}
+        
+        violation_count = (self.violation_count
+                           - sum(self.per_task_contrib[other] for other in affected)
+                           + sum(counts.values()))
+        total_hours = self.total_hours - old_assignment['duration'] + new_assignment['duration']
+        score = self._score(total_hours, violation_count)
+        
+        if commit:
+            self.per_task_contrib.update(counts)
+            self.violation_count = violation_count
+            self.total_hours = total_hours
+            self.score_cache = score
+        else:
+            self._place(task_id, old_assignment)
+        
+        return score
+    
+    def _place(self, task_id: str, assignment: Dict[str, Any]):
+        current = self.solution[task_id]
+        self._slots[(current['resource_id'], current['start_day'])].discard(task_id)
+        self.solution[task_id] = assignment
+        self._slots[(assignment['resource_id'], assignment['start_day'])].add(task_id)
+    
+    def _count_violations(self, task_id: str) -> int:
+        """Number of messages get_constraint_violations gives for a task"""
+        assignment = self.solution[task_id]
+        task = self._tasks_by_id.get(task_id)
+        resource = self._resources_by_id.get(assignment['resource_id'])
+        
+        if not task or not resource:
+            return 1
+        
+        count = 0
+        
+        required_skills = task.get('required_skills', [])
+        resource_skills = resource.get('skills', [])
+        if any(skill not in resource_skills for skill in required_skills):
+            count += 1
+        
+        if assignment['duration'] > resource.get('max_hours_per_day', 8):
+            count += 1
+        
+        start_hour = assignment['start_hour']
+        end_hour = assignment['end_hour']
+        for other_id in self._slots[(assignment['resource_id'], assignment['start_day'])]:
+            if other_id == task_id:
+                continue
+            other = self.solution[other_id]
+            if not (end_hour <= other['start_hour'] or start_hour >= other['end_hour']):
+                count += 1
+        
+        count += len(check_dependency_constraints(assignment, task, self.solution))
+        
+        return count
+    
+    def _score(self, total_hours: float, violation_count: int) -> float:
+        """calculate_schedule_score from the tracked totals"""
+        if not self.solution:
+            return 0.0
+        
+        total_tasks = len(self.tasks)
+        completion_rate = len(self.solution) / total_tasks if total_tasks > 0 else 0
+        
+        max_possible_hours = len(self.resources) * 8 * 5  # 8 hours/day, 5 days
+        utilization_rate = total_hours / max_possible_hours if max_possible_hours > 0 else 0
+        
+        violation_penalty = violation_count * 0.1
+        
+        score = (completion_rate * 0.4 + 
+                 utilization_rate * 0.4 + 
+                 max(0, 1 - violation_penalty) * 0.2)
+        
+        return min(1.0, max(0.0, score))
+
 def check_resource_availability(resource_id: str, day: str, hour: int, 
                               resources: List[Dict]) -> bool:
     """
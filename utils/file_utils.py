@@ -5,9 +5,15 @@ Functions for loading, validating, and exporting scheduling data
 
 import json
 import csv
+import io
 import os
 from typing import Dict, List, Any, Optional
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the json module
+    orjson = None
+
 def load_schedule_data(file_path: str = "data/sample_schedule.json") -> Dict[str, Any]:
     """
     Load scheduling data from JSON file
@@ -94,16 +100,58 @@ def export_schedule_to_json(solution: Dict[str, Any], filename: str) -> None:
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
+    if orjson is not None:
+        # Serialized in C straight to UTF-8, numpy values included
+        with open(filename, 'wb') as file:
+            file.write(orjson.dumps(solution, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                                    | orjson.OPT_NON_STR_KEYS))
+        return
+    
     with open(filename, 'w', encoding='utf-8') as file:
         json.dump(solution, file, indent=2, ensure_ascii=False)
 
-def export_schedule_to_csv(solution: Dict[str, Any], filename: str) -> None:
+def schedule_to_csv_bytes(solution: Dict[str, Any]) -> bytes:
+    """
+    Serialize a solution to UTF-8 encoded CSV
+    
+    Args:
+        solution: Dictionary containing the solution
+        
+    Returns:
+        CSV file contents, as written by export_schedule_to_csv
+    """
+    # Define CSV headers
+    headers = ['task_id', 'task_name', 'resource_id', 'resource_name', 
+              'start_day', 'start_hour', 'end_hour', 'duration']
+    
+    buffer = io.StringIO(newline='')
+    writer = csv.DictWriter(buffer, fieldnames=headers)
+    writer.writeheader()
+    
+    for task_id, assignment in solution.items():
+        row = {
+            'task_id': task_id,
+            'task_name': assignment.get('task_name', ''),
+            'resource_id': assignment.get('resource_id', ''),
+            'resource_name': assignment.get('resource_name', ''),
+            'start_day': assignment.get('start_day', ''),
+            'start_hour': assignment.get('start_hour', ''),
+            'end_hour': assignment.get('end_hour', ''),
+            'duration': assignment.get('duration', '')
+        }
+        writer.writerow(row)
+    
+    return buffer.getvalue().encode('utf-8')
+
+def export_schedule_to_csv(solution: Dict[str, Any], filename: str,
+                           payload: Optional[bytes] = None) -> None:
     """
     Export solution to CSV format
     
     Args:
         solution: Dictionary containing the solution
         filename: Output filename
+        payload: Precomputed schedule_to_csv_bytes(solution), if available
         
     Raises:
         IOError: If there's an error writing the file
@@ -111,26 +159,11 @@ def export_schedule_to_csv(solution: Dict[str, Any], filename: str) -> None:
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
-    # Define CSV headers
-    headers = ['task_id', 'task_name', 'resource_id', 'resource_name', 
-              'start_day', 'start_hour', 'end_hour', 'duration']
+    if payload is None:
+        payload = schedule_to_csv_bytes(solution)
     
-    with open(filename, 'w', newline='', encoding='utf-8') as file:
-        writer = csv.DictWriter(file, fieldnames=headers)
-        writer.writeheader()
-        
-        for task_id, assignment in solution.items():
-            row = {
-                'task_id': task_id,
-                'task_name': assignment.get('task_name', ''),
-                'resource_id': assignment.get('resource_id', ''),
-                'resource_name': assignment.get('resource_name', ''),
-                'start_day': assignment.get('start_day', ''),
-                'start_hour': assignment.get('start_hour', ''),
-                'end_hour': assignment.get('end_hour', ''),
-                'duration': assignment.get('duration', '')
-            }
-            writer.writerow(row)
+    with open(filename, 'wb') as file:
+        file.write(payload)
 
 def load_constraints(file_path: str = "data/constraints.json") -> Dict[str, Any]:
     """
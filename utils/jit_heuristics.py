@@ -0,0 +1,144 @@
+"""
+Variable Ordering Kernels for CSP Scheduling Project
+Array versions of the MRV / degree selection used by the CSP solver's search loop
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Optional; the numpy implementations below are used instead
+    njit = None
+
+# Domain size given to masked-out (assigned) variables
+_NO_VALUE = np.iinfo(np.int32).max
+
+
+def _degree_select_loop(degrees, unassigned_mask):
+    best_idx = -1
+    best_deg = -1
+    for idx in range(degrees.shape[0]):
+        if unassigned_mask[idx] and degrees[idx] > best_deg:
+            best_deg = degrees[idx]
+            best_idx = idx
+    return best_idx
+
+
+def _combined_select_loop(domain_sizes, degrees, unassigned_mask):
+    # One fused pass tracking (min domain size, best degree among ties, index)
+    best_idx = -1
+    min_dom = _NO_VALUE
+    best_deg = -1
+    for idx in range(domain_sizes.shape[0]):
+        if not unassigned_mask[idx]:
+            continue
+        size = domain_sizes[idx]
+        if size < min_dom or (size == min_dom and degrees[idx] > best_deg):
+            min_dom = size
+            best_deg = degrees[idx]
+            best_idx = idx
+    return best_idx
+
+
+def _dom_wdeg_select_loop(domain_sizes, weights, unassigned_mask):
+    best_idx = -1
+    best_score = np.inf
+    for idx in range(domain_sizes.shape[0]):
+        if not unassigned_mask[idx]:
+            continue
+        score = domain_sizes[idx] / max(weights[idx], 1.0)
+        if score < best_score:
+            best_score = score
+            best_idx = idx
+    return best_idx
+
+
+def _degree_select_numpy(degrees, unassigned_mask):
+    if not unassigned_mask.any():
+        return -1
+    return int(np.argmax(np.where(unassigned_mask, degrees, -1)))
+
+
+def _combined_select_numpy(domain_sizes, degrees, unassigned_mask):
+    if not unassigned_mask.any():
+        return -1
+    masked = np.where(unassigned_mask, domain_sizes, _NO_VALUE)
+    ties = unassigned_mask & (masked == masked.min())
+    return int(np.argmax(np.where(ties, degrees, -1)))
+
+
+def _dom_wdeg_select_numpy(domain_sizes, weights, unassigned_mask):
+    if not unassigned_mask.any():
+        return -1
+    scores = domain_sizes / np.maximum(weights, 1.0)
+    return int(np.argmin(np.where(unassigned_mask, scores, np.inf)))
+
+
+if njit is not None:
+    _degree_select = njit(cache=True)(_degree_select_loop)
+    _combined_select = njit(cache=True)(_combined_select_loop)
+    _dom_wdeg_select = njit(cache=True)(_dom_wdeg_select_loop)
+else:
+    _degree_select = _degree_select_numpy
+    _combined_select = _combined_select_numpy
+    _dom_wdeg_select = _dom_wdeg_select_numpy
+
+
+def degree_select(degrees: np.ndarray, unassigned_mask: np.ndarray) -> int:
+    """
+    Index of the unassigned variable with the highest degree
+
+    Args:
+        degrees: Constraint graph degree of every variable
+        unassigned_mask: True for variables that are not assigned yet
+
+    Returns:
+        Variable index (first one on ties), or -1 if every variable is assigned
+    """
+    return int(_degree_select(degrees, unassigned_mask))
+
+
+def combined_select(domain_sizes: np.ndarray, degrees: np.ndarray,
+                    unassigned_mask: np.ndarray) -> int:
+    """
+    Index of the unassigned variable with the fewest remaining values, ties
+    broken by the highest degree
+
+    Args:
+        domain_sizes: Number of remaining values of every variable
+        degrees: Constraint graph degree of every variable
+        unassigned_mask: True for variables that are not assigned yet
+
+    Returns:
+        Variable index (first one on ties), or -1 if every variable is assigned
+    """
+    return int(_combined_select(domain_sizes, degrees, unassigned_mask))
+
+
+def dom_wdeg_select(domain_sizes: np.ndarray, weights: np.ndarray,
+                    unassigned_mask: np.ndarray) -> int:
+    """
+    Index of the unassigned variable with the smallest domain size to
+    weighted degree ratio (dom/wdeg)
+
+    Args:
+        domain_sizes: Number of remaining values of every variable
+        weights: Weighted degree of every variable (weights below 1 count as 1)
+        unassigned_mask: True for variables that are not assigned yet
+
+    Returns:
+        Variable index (first one on ties), or -1 if every variable is assigned
+    """
+    return int(_dom_wdeg_select(domain_sizes, weights, unassigned_mask))
+
+
+def warm_up() -> None:
+    """
+    Compile the kernels ahead of a timed solve (no-op cost without numba)
+    """
+    sizes = np.zeros(1, dtype=np.int32)
+    degrees = np.zeros(1, dtype=np.int32)
+    mask = np.ones(1, dtype=bool)
+    degree_select(degrees, mask)
+    combined_select(sizes, degrees, mask)
+    dom_wdeg_select(sizes, np.ones(1), mask)
@@ -4,7 +4,7 @@ Functions for creating charts and visualizations of scheduling solutions
 """
 
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+from matplotlib.collections import PolyCollection
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Any, Optional
@@ -37,6 +37,9 @@ def create_gantt_chart(solution: Dict[str, Any], tasks: List[Dict],
     # Create the Gantt chart
     y_pos = 0
     task_labels = []
+    bar_starts = []
+    bar_durations = []
+    bar_colors = []
     
     for task_id, assignment in solution.items():
         # Find task name
@@ -50,13 +53,11 @@ def create_gantt_chart(solution: Dict[str, Any], tasks: List[Dict],
         
         # Convert to hours from start of week
         start_time = start_day * 8 + (start_hour - 9)  # Assuming 9-17 work hours
-        end_time = start_time + duration
         
-        # Create rectangle
-        color = resource_colors.get(assignment.get('resource_id', 'R1'), 'gray')
-        rect = patches.Rectangle((start_time, y_pos - 0.3), duration, 0.6, 
-                               facecolor=color, edgecolor='black', alpha=0.7)
-        ax.add_patch(rect)
+        # Collect the bar (all bars are added below as one collection)
+        bar_starts.append(start_time)
+        bar_durations.append(duration)
+        bar_colors.append(resource_colors.get(assignment.get('resource_id', 'R1'), 'gray'))
         
         # Add text label
         ax.text(start_time + duration/2, y_pos, f'{task_name}\n({resource_name})', 
@@ -65,6 +66,16 @@ def create_gantt_chart(solution: Dict[str, Any], tasks: List[Dict],
         task_labels.append(f'{task_name} ({resource_name})')
         y_pos += 1
     
+    # Draw every bar as a single artist instead of one patch per task
+    if bar_starts:
+        left = np.asarray(bar_starts, dtype=float)
+        right = left + np.asarray(bar_durations, dtype=float)
+        bottom = np.arange(len(bar_starts)) - 0.3
+        top = bottom + 0.6
+        bars = np.stack([np.column_stack(corner) for corner in
+                         [(left, bottom), (right, bottom), (right, top), (left, top)]], axis=1)
+        ax.add_collection(PolyCollection(bars, facecolors=bar_colors, edgecolors='black', alpha=0.7))
+    
     # Customize the chart
     ax.set_ylim(-0.5, len(solution) - 0.5)
     ax.set_xlim(0, 40)  # 5 days * 8 hours
@@ -100,26 +111,24 @@ def create_resource_utilization_chart(solution: Dict[str, Any],
     """
     fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
     
-    # Calculate utilization for each resource
-    resource_hours = {}
-    resource_tasks = {}
-    
+    # Calculate utilization for each resource with one scatter-add over the
+    # assignments (those on unknown resources are left out)
+    resource_index = {}
     for resource in resources:
-        resource_id = resource['id']
-        resource_hours[resource_id] = 0
-        resource_tasks[resource_id] = []
+        resource_index.setdefault(resource['id'], len(resource_index))
     
-    for task_id, assignment in solution.items():
-        resource_id = assignment.get('resource_id')
-        duration = assignment.get('duration', 0)
-        
-        if resource_id in resource_hours:
-            resource_hours[resource_id] += duration
-            resource_tasks[resource_id].append(assignment.get('task_name', task_id))
+    assigned = [(resource_index[assignment.get('resource_id')], assignment.get('duration', 0))
+                for assignment in solution.values()
+                if assignment.get('resource_id') in resource_index]
+    resource_idx = np.array([idx for idx, _ in assigned], dtype=np.intp)
+    durations = np.array([duration for _, duration in assigned])
+    resource_hours = np.bincount(resource_idx, weights=durations, minlength=len(resource_index))
+    if durations.dtype.kind in 'iu':
+        resource_hours = resource_hours.astype(durations.dtype)  # Keep whole hours as integers
     
     # Create bar chart of total hours
     resource_names = [r['name'] for r in resources]
-    hours = [resource_hours.get(r['id'], 0) for r in resources]
+    hours = resource_hours[[resource_index[r['id']] for r in resources]].tolist()
     
     bars = ax1.bar(resource_names, hours, color='skyblue', alpha=0.7)
     ax1.set_xlabel('Resources')